@@ -11,6 +11,7 @@ import { buildPrompt, type PromptContext } from '../core/prompt-template-engine.
 import { type PromptTemplates } from '../domain/schemas/manifest.js';
 import { Result } from '../core/config-resolver.js';
 import { logger } from '../utils/logger.js';
+import { GeminiRateGovernor, getGeminiRateGovernor } from './gemini-rate-governor.js';
 
 /**
  * Part for Gemini API content
@@ -38,6 +39,7 @@ export interface GeneratorContext {
     previousFramePath?: string;
     previousFrameSF01?: number;
     retryAction?: 'identity_rescue' | 'tighten_prompt' | 're_anchor' | null;
+    seedSalt?: number;      // Forces a fresh seed after a duplicate candidate
     outputPath: string;
     canvasSize: number;
 }
@@ -54,6 +56,7 @@ export interface CandidateResult {
     thoughtSignature?: string;
     thoughtContent?: string;
     durationMs: number;
+    queueWaitMs?: number;       // Time spent queued behind the rate governor
     errors: string[];
 }
 
@@ -162,11 +165,13 @@ export function buildGenerationConfig(manifestTemperature?: number): {
 /**
  * Generate a frame using Gemini API
  * NOTE: This is a stub implementation - actual API call requires @google/generative-ai SDK
+ * The call is made under the rate governor shared by all Gemini callers.
  */
 export async function generateFrame(
     context: GeneratorContext,
     templates: PromptTemplates,
-    apiKey: string
+    apiKey: string,
+    governor: GeminiRateGovernor = getGeminiRateGovernor()
 ): Promise<Result<CandidateResult, GeneratorError>> {
     const startTime = Date.now();
     const errors: string[] = [];
@@ -198,7 +203,7 @@ export async function generateFrame(
         const fullPrompt = `${builtPrompt.resolvedPrompt}\n\n${builtPrompt.negativePrompt}`;
 
         // Calculate seed
-        const seed = calculateSeed(context.runId, context.frameIndex, context.attemptIndex);
+        const seed = calculateSeed(context.runId, context.frameIndex, context.attemptIndex, context.seedSalt);
 
         // Build generation config
         const genConfig = buildGenerationConfig();
@@ -216,42 +221,41 @@ export async function generateFrame(
             model: 'gemini-2.0-flash-exp',
             ...genConfig,
             seed,
-            seedPolicy: describeSeedPolicy(context.attemptIndex),
+            seedPolicy: describeSeedPolicy(context.attemptIndex, context.seedSalt),
             canvasSize: context.canvasSize,
         });
 
-        // -------------------------------------------------------------------
-        // ACTUAL API CALL WOULD GO HERE
-        // Using @google/generative-ai SDK:
-        //
-        // import { GoogleGenerativeAI } from '@google/generative-ai';
-        // const genAI = new GoogleGenerativeAI(apiKey);
-        // const model = genAI.getGenerativeModel({ 
-        //     model: 'gemini-2.0-flash-exp',
-        //     generationConfig: genConfig,
-        // });
-        // const result = await model.generateContent({ contents: [{ parts }] });
-        // const response = result.response;
-        // Extract image from response and save to context.outputPath
-        // -------------------------------------------------------------------
-
-        // For now, return a stub result indicating API call needed
-        // In production, this would be replaced with actual API call
-
         // Ensure output directory exists
         await fs.mkdir(dirname(context.outputPath), { recursive: true });
 
-        // Create a placeholder file to indicate where output would go
-        // (In production, this is the generated image)
-        await fs.writeFile(
-            context.outputPath + '.stub',
-            JSON.stringify({
-                message: 'Stub: Real API call would generate image here',
-                prompt: fullPrompt.substring(0, 200) + '...',
-                seed,
-                attemptId,
-            }, null, 2)
-        );
+        const { queueWaitMs } = await governor.run(async () => {
+            // -------------------------------------------------------------------
+            // ACTUAL API CALL WOULD GO HERE
+            // Using @google/generative-ai SDK:
+            //
+            // import { GoogleGenerativeAI } from '@google/generative-ai';
+            // const genAI = new GoogleGenerativeAI(apiKey);
+            // const model = genAI.getGenerativeModel({
+            //     model: 'gemini-2.0-flash-exp',
+            //     generationConfig: genConfig,
+            // });
+            // const result = await model.generateContent({ contents: [{ parts }] });
+            // const response = result.response;
+            // Extract image from response and save to context.outputPath
+            // -------------------------------------------------------------------
+
+            // For now, write a placeholder indicating where output would go
+            // (In production, this is the generated image)
+            await fs.writeFile(
+                context.outputPath + '.stub',
+                JSON.stringify({
+                    message: 'Stub: Real API call would generate image here',
+                    prompt: fullPrompt.substring(0, 200) + '...',
+                    seed,
+                    attemptId,
+                }, null, 2)
+            );
+        }, 'gemini_generate');
 
         const durationMs = Date.now() - startTime;
 
@@ -264,6 +268,7 @@ export async function generateFrame(
             thoughtSignature: undefined,
             thoughtContent: undefined,
             durationMs,
+            queueWaitMs,
             errors,
         });
     } catch (error) {
@@ -308,6 +313,7 @@ export async function logGenerationToAudit(
         attempt_id: result.attemptId,
         seed: result.seed,
         duration_ms: result.durationMs,
+        queue_wait_ms: result.queueWaitMs ?? 0,
         image_path: result.imagePath,
         prompt_length: result.rawPrompt.length,
         thought_signature: result.thoughtSignature || null,
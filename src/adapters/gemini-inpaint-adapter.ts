@@ -6,6 +6,7 @@
 import { GoogleGenerativeAI, GenerativeModel } from '@google/generative-ai';
 import { Result } from '../core/config-resolver.js';
 import { logger } from '../utils/logger.js';
+import { GeminiRateGovernor, getGeminiRateGovernor } from './gemini-rate-governor.js';
 
 /**
  * Request structure for inpainting
@@ -29,6 +30,8 @@ export interface InpaintResult {
   imageBase64?: string;
   /** Error message (if failed) */
   error?: string;
+  /** Time spent queued behind the rate governor */
+  queueWaitMs?: number;
 }
 
 /**
@@ -58,6 +61,14 @@ export class GeminiInpaintAdapter {
   private genAI: GoogleGenerativeAI | null = null;
   private model: GenerativeModel | null = null;
   private initialized = false;
+  private governor: GeminiRateGovernor;
+
+  /**
+   * @param governor - Rate governor shared with other Gemini callers (defaults to process-wide)
+   */
+  constructor(governor?: GeminiRateGovernor) {
+    this.governor = governor ?? getGeminiRateGovernor();
+  }
 
   /**
    * Initialize the adapter with API key
@@ -117,7 +128,8 @@ export class GeminiInpaintAdapter {
       }
     }
 
-    if (!this.model) {
+    const model = this.model;
+    if (!model) {
       return {
         success: false,
         error: 'Model not initialized',
@@ -135,7 +147,8 @@ export class GeminiInpaintAdapter {
     try {
       // Construct the edit request with image, mask, and prompt
       // Using Gemini's multimodal input with two images (original + mask) and text
-      const result = await this.model.generateContent({
+      // Routed through the governor: rate limit, concurrency cap, quota backoff
+      const { value: result, queueWaitMs } = await this.governor.run(() => model.generateContent({
         contents: [
           {
             role: 'user',
@@ -166,7 +179,7 @@ export class GeminiInpaintAdapter {
           topP: 0.95,
           topK: 40,
         },
-      });
+      }), 'gemini_inpaint');
 
       // Extract image from response
       const response = result.response;
@@ -203,11 +216,13 @@ export class GeminiInpaintAdapter {
       logger.info({
         event: 'gemini_inpaint_success',
         imageSize: imagePart.inlineData.data.length,
+        queueWaitMs,
       });
 
       return {
         success: true,
         imageBase64: imagePart.inlineData.data,
+        queueWaitMs,
       };
     } catch (error) {
       const message = error instanceof Error ? error.message : 'Unknown API error';
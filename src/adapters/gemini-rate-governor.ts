@@ -0,0 +1,545 @@
+/**
+ * Gemini rate governor - process-wide request shaping for Gemini API calls
+ * Token-bucket rate limit, concurrency cap, quota-aware jittered backoff,
+ * and keep-alive connection pooling for direct HTTP calls.
+ */
+
+import * as http from 'http';
+import * as https from 'https';
+import { logger } from '../utils/logger.js';
+
+/**
+ * Governor configuration
+ */
+export interface RateGovernorOptions {
+    requestsPerMinute?: number;     // Sustained token refill rate
+    burst?: number;                 // Bucket capacity
+    maxConcurrency?: number;        // Requests in flight at once
+    maxRetries?: number;            // Retries after the first attempt
+    baseBackoffMs?: number;         // First backoff ceiling, doubled per retry
+    maxBackoffMs?: number;          // Ceiling for any backoff or quota pause, server hints included
+    random?: () => number;          // Jitter source (injectable for tests)
+}
+
+/**
+ * Rate information parsed from a response or error
+ */
+export interface QuotaHint {
+    status?: number;
+    retryAfterMs?: number;          // From Retry-After or google.rpc.RetryInfo
+    remaining?: number;             // x-ratelimit-remaining
+    resetMs?: number;               // x-ratelimit-reset, as a delay from now
+}
+
+/**
+ * Snapshot of governor activity
+ */
+export interface GovernorMetrics {
+    requests: number;
+    retries: number;
+    quotaErrors: number;
+    inFlight: number;
+    queued: number;
+    queueWaitMs: {
+        last: number;
+        mean: number;
+        max: number;
+        total: number;
+    };
+}
+
+/**
+ * Result of a governed call
+ */
+export interface GovernedResult<T> {
+    value: T;
+    queueWaitMs: number;            // Time spent waiting for a slot and a token, all attempts
+    attempts: number;
+}
+
+/**
+ * Response from postJson
+ */
+export interface JsonResponse {
+    status: number;
+    headers: http.IncomingHttpHeaders;
+    body: unknown;
+}
+
+/**
+ * Options for postJson
+ */
+export interface PostJsonOptions {
+    headers?: Record<string, string>;
+    timeoutMs?: number;
+    agent?: http.Agent;
+}
+
+// Defaults sized for the free/paid Gemini tiers without tripping burst quotas
+const DEFAULT_REQUESTS_PER_MINUTE = 60;
+const DEFAULT_BURST = 10;
+const DEFAULT_MAX_CONCURRENCY = 4;
+const DEFAULT_MAX_RETRIES = 4;
+const DEFAULT_BASE_BACKOFF_MS = 1000;
+const DEFAULT_MAX_BACKOFF_MS = 60000;
+const DEFAULT_TIMEOUT_MS = 120000;
+const MAX_SOCKETS = 16;
+
+const QUOTA_STATUS = 429;
+const RETRYABLE_STATUSES = new Set([QUOTA_STATUS, 500, 502, 503, 504]);
+const RETRYABLE_NETWORK_CODES = new Set([
+    'ECONNRESET',
+    'ETIMEDOUT',
+    'EPIPE',
+    'ECONNREFUSED',
+    'EAI_AGAIN',
+    'UND_ERR_SOCKET',
+    'UND_ERR_CONNECT_TIMEOUT',
+    'UND_ERR_HEADERS_TIMEOUT',
+]);
+// How far down an error's cause chain to look for a network code
+const MAX_CAUSE_DEPTH = 4;
+
+/**
+ * HTTP error carrying status and headers for quota parsing
+ */
+export class GeminiHttpError extends Error {
+    readonly status: number;
+    readonly headers: http.IncomingHttpHeaders;
+    readonly body: unknown;
+
+    constructor(status: number, headers: http.IncomingHttpHeaders, body: unknown) {
+        super(`Gemini HTTP ${status}`);
+        this.name = 'GeminiHttpError';
+        this.status = status;
+        this.headers = headers;
+        this.body = body;
+    }
+}
+
+/**
+ * Token bucket with lazy refill
+ */
+export class TokenBucket {
+    private readonly capacity: number;
+    private readonly refillPerMs: number;
+    private readonly now: () => number;
+    private tokens: number;
+    private lastRefill: number;
+
+    constructor(capacity: number, refillPerSecond: number, now: () => number = Date.now) {
+        this.capacity = capacity;
+        this.refillPerMs = refillPerSecond / 1000;
+        this.now = now;
+        this.tokens = capacity;
+        this.lastRefill = now();
+    }
+
+    /**
+     * Take one token. Returns 0 on success, otherwise ms until one is available.
+     */
+    take(): number {
+        this.refill();
+        if (this.tokens >= 1) {
+            this.tokens -= 1;
+            return 0;
+        }
+        return Math.ceil((1 - this.tokens) / this.refillPerMs);
+    }
+
+    /**
+     * Empty the bucket (server reported exhausted quota)
+     */
+    drain(): void {
+        this.refill();
+        this.tokens = 0;
+    }
+
+    private refill(): void {
+        const now = this.now();
+        this.tokens = Math.min(this.capacity, this.tokens + (now - this.lastRefill) * this.refillPerMs);
+        this.lastRefill = now;
+    }
+}
+
+/**
+ * Parse Retry-After (seconds or HTTP date) and x-ratelimit-* headers
+ */
+export function parseQuotaHeaders(headers: http.IncomingHttpHeaders): QuotaHint {
+    const hint: QuotaHint = {};
+
+    const retryAfter = headerValue(headers['retry-after']);
+    if (retryAfter !== undefined) {
+        const seconds = Number(retryAfter);
+        if (Number.isFinite(seconds)) {
+            hint.retryAfterMs = Math.max(0, seconds * 1000);
+        } else {
+            const date = Date.parse(retryAfter);
+            if (!Number.isNaN(date)) {
+                hint.retryAfterMs = Math.max(0, date - Date.now());
+            }
+        }
+    }
+
+    const remaining = Number(headerValue(headers['x-ratelimit-remaining']));
+    if (Number.isFinite(remaining)) {
+        hint.remaining = remaining;
+    }
+
+    // Either delta seconds or an epoch timestamp in seconds; a delta is
+    // never larger than the current epoch time
+    const reset = Number(headerValue(headers['x-ratelimit-reset']));
+    if (Number.isFinite(reset)) {
+        const nowMs = Date.now();
+        hint.resetMs = reset > nowMs / 1000
+            ? Math.max(0, reset * 1000 - nowMs)
+            : Math.max(0, reset * 1000);
+    }
+
+    return hint;
+}
+
+/**
+ * Transient network failure: a retryable code on the error or anywhere in
+ * its cause chain, or undici's bare `TypeError: fetch failed` (which the
+ * SDK rethrows as "Error fetching from <url>: fetch failed").
+ */
+function isRetryableNetworkError(error: unknown): boolean {
+    let current: unknown = error;
+    for (let depth = 0; depth <= MAX_CAUSE_DEPTH && current && typeof current === 'object'; depth++) {
+        const { code, message } = current as { code?: unknown; message?: unknown };
+        if (typeof code === 'string' && RETRYABLE_NETWORK_CODES.has(code)) {
+            return true;
+        }
+        if (typeof message === 'string' && (message === 'fetch failed' || message.endsWith(': fetch failed'))) {
+            return true;
+        }
+        current = (current as { cause?: unknown }).cause;
+    }
+    return false;
+}
+
+/**
+ * Classify an error from postJson or the @google/generative-ai SDK.
+ * Returns null when the error is not worth retrying.
+ */
+export function extractQuotaHint(error: unknown): QuotaHint | null {
+    if (!error || typeof error !== 'object') {
+        return null;
+    }
+
+    const err = error as {
+        status?: number;
+        headers?: http.IncomingHttpHeaders;
+        errorDetails?: Array<{ '@type'?: string; retryDelay?: string }>;
+    };
+
+    if (isRetryableNetworkError(error)) {
+        return {};
+    }
+
+    if (typeof err.status !== 'number' || !RETRYABLE_STATUSES.has(err.status)) {
+        return null;
+    }
+
+    const hint: QuotaHint = { status: err.status, ...(err.headers ? parseQuotaHeaders(err.headers) : {}) };
+
+    // SDK errors carry google.rpc.RetryInfo instead of headers, e.g. retryDelay: "13s"
+    const retryInfo = err.errorDetails?.find(d => d['@type']?.endsWith('google.rpc.RetryInfo'));
+    if (hint.retryAfterMs === undefined && retryInfo?.retryDelay) {
+        const seconds = parseFloat(retryInfo.retryDelay);
+        if (Number.isFinite(seconds)) {
+            hint.retryAfterMs = seconds * 1000;
+        }
+    }
+
+    return hint;
+}
+
+/**
+ * Backoff before retry number `retry` (0-based).
+ * Server hints win, with a little jitter so waiting clients don't return in lockstep;
+ * otherwise full-jitter exponential backoff. Never exceeds maxBackoffMs.
+ */
+export function computeBackoffMs(
+    retry: number,
+    hint: QuotaHint,
+    baseBackoffMs: number = DEFAULT_BASE_BACKOFF_MS,
+    maxBackoffMs: number = DEFAULT_MAX_BACKOFF_MS,
+    random: () => number = Math.random
+): number {
+    const serverDelay = hint.retryAfterMs ?? (hint.remaining === 0 ? hint.resetMs : undefined);
+    if (serverDelay !== undefined) {
+        return Math.round(Math.min(maxBackoffMs, serverDelay + random() * baseBackoffMs * 0.25));
+    }
+    const ceiling = Math.min(maxBackoffMs, baseBackoffMs * 2 ** retry);
+    return Math.round(random() * ceiling);
+}
+
+/**
+ * Process-wide governor for Gemini calls
+ */
+export class GeminiRateGovernor {
+    private readonly bucket: TokenBucket;
+    private readonly maxConcurrency: number;
+    private readonly maxRetries: number;
+    private readonly baseBackoffMs: number;
+    private readonly maxBackoffMs: number;
+    private readonly random: () => number;
+
+    private readonly waiters: Array<() => void> = [];
+    private inFlight = 0;
+    private pausedUntil = 0;
+
+    private requests = 0;
+    private retries = 0;
+    private quotaErrors = 0;
+    private waitCount = 0;
+    private waitTotal = 0;
+    private waitMax = 0;
+    private waitLast = 0;
+
+    constructor(options: RateGovernorOptions = {}) {
+        const requestsPerMinute = options.requestsPerMinute ?? DEFAULT_REQUESTS_PER_MINUTE;
+        this.bucket = new TokenBucket(options.burst ?? DEFAULT_BURST, requestsPerMinute / 60);
+        this.maxConcurrency = Math.max(1, options.maxConcurrency ?? DEFAULT_MAX_CONCURRENCY);
+        this.maxRetries = options.maxRetries ?? DEFAULT_MAX_RETRIES;
+        this.baseBackoffMs = options.baseBackoffMs ?? DEFAULT_BASE_BACKOFF_MS;
+        this.maxBackoffMs = options.maxBackoffMs ?? DEFAULT_MAX_BACKOFF_MS;
+        this.random = options.random ?? Math.random;
+    }
+
+    /**
+     * Run a call under the rate limit and concurrency cap, retrying
+     * quota and transient errors. The last error is rethrown.
+     */
+    async run<T>(task: () => Promise<T>, label: string = 'gemini_request'): Promise<GovernedResult<T>> {
+        let queueWaitMs = 0;
+
+        for (let attempt = 1; ; attempt++) {
+            queueWaitMs += await this.acquire();
+            this.requests++;
+
+            let delayMs = 0;
+            try {
+                const value = await task();
+                return { value, queueWaitMs, attempts: attempt };
+            } catch (error) {
+                const hint = extractQuotaHint(error);
+                if (!hint || attempt > this.maxRetries) {
+                    throw error;
+                }
+
+                delayMs = computeBackoffMs(attempt - 1, hint, this.baseBackoffMs, this.maxBackoffMs, this.random);
+                this.retries++;
+                if (hint.status === QUOTA_STATUS) {
+                    // Quota is shared: hold every caller, not just this one
+                    this.quotaErrors++;
+                    this.pause(delayMs);
+                }
+
+                logger.warn({
+                    event: 'gemini_backoff',
+                    label,
+                    attempt,
+                    status: hint.status,
+                    retryAfterMs: hint.retryAfterMs,
+                    delayMs,
+                }, `Gemini request failed, retrying in ${delayMs}ms`);
+            } finally {
+                this.release();
+            }
+
+            // Back off without holding a concurrency slot
+            await sleep(delayMs);
+        }
+    }
+
+    /**
+     * POST JSON through the governor on a pooled keep-alive connection
+     */
+    async postJson(url: string, body: unknown, options: PostJsonOptions = {}): Promise<GovernedResult<JsonResponse>> {
+        return this.run(async () => {
+            const response = await postJson(url, body, options);
+            this.observeQuota(parseQuotaHeaders(response.headers));
+            return response;
+        }, `POST ${new URL(url).pathname}`);
+    }
+
+    /**
+     * Apply quota headers from a successful response: an exhausted
+     * window drains the bucket and holds callers until it resets.
+     */
+    observeQuota(hint: QuotaHint): void {
+        if (hint.remaining === 0) {
+            this.bucket.drain();
+            if (hint.resetMs !== undefined) {
+                this.pause(Math.min(hint.resetMs, this.maxBackoffMs));
+            }
+        }
+    }
+
+    /**
+     * Current activity and queue-wait statistics
+     */
+    getMetrics(): GovernorMetrics {
+        return {
+            requests: this.requests,
+            retries: this.retries,
+            quotaErrors: this.quotaErrors,
+            inFlight: this.inFlight,
+            queued: this.waiters.length,
+            queueWaitMs: {
+                last: this.waitLast,
+                mean: this.waitCount > 0 ? this.waitTotal / this.waitCount : 0,
+                max: this.waitMax,
+                total: this.waitTotal,
+            },
+        };
+    }
+
+    /**
+     * Wait for a concurrency slot, any quota pause, and a token.
+     * Returns the time spent waiting.
+     */
+    private async acquire(): Promise<number> {
+        const start = Date.now();
+
+        if (this.inFlight < this.maxConcurrency && this.waiters.length === 0) {
+            this.inFlight++;
+        } else {
+            // release() hands its slot straight to the next waiter
+            await new Promise<void>(resolve => this.waiters.push(resolve));
+        }
+
+        for (;;) {
+            const pauseMs = this.pausedUntil - Date.now();
+            if (pauseMs > 0) {
+                await sleep(pauseMs);
+                continue;
+            }
+            const tokenMs = this.bucket.take();
+            if (tokenMs === 0) break;
+            await sleep(tokenMs);
+        }
+
+        const waited = Date.now() - start;
+        this.waitCount++;
+        this.waitTotal += waited;
+        this.waitMax = Math.max(this.waitMax, waited);
+        this.waitLast = waited;
+
+        if (waited > 0) {
+            logger.debug({ queueWaitMs: waited, inFlight: this.inFlight, queued: this.waiters.length }, 'Gemini request dequeued');
+        }
+
+        return waited;
+    }
+
+    private release(): void {
+        const next = this.waiters.shift();
+        if (next) {
+            next();
+        } else {
+            this.inFlight--;
+        }
+    }
+
+    private pause(ms: number): void {
+        this.pausedUntil = Math.max(this.pausedUntil, Date.now() + ms);
+    }
+}
+
+// Shared keep-alive agents, one per protocol
+let httpAgent: http.Agent | null = null;
+let httpsAgent: https.Agent | null = null;
+
+/**
+ * Get the pooled keep-alive agent for a URL
+ */
+export function getKeepAliveAgent(url: string): http.Agent {
+    if (new URL(url).protocol === 'http:') {
+        httpAgent ??= new http.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS });
+        return httpAgent;
+    }
+    httpsAgent ??= new https.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS });
+    return httpsAgent;
+}
+
+/**
+ * POST a JSON body and parse the JSON response.
+ * Rejects with GeminiHttpError for non-2xx statuses.
+ */
+export function postJson(url: string, body: unknown, options: PostJsonOptions = {}): Promise<JsonResponse> {
+    const target = new URL(url);
+    const transport = target.protocol === 'http:' ? http : https;
+    const payload = JSON.stringify(body);
+
+    return new Promise((resolve, reject) => {
+        const req = transport.request(target, {
+            method: 'POST',
+            agent: options.agent ?? getKeepAliveAgent(url),
+            headers: {
+                'content-type': 'application/json',
+                'content-length': Buffer.byteLength(payload),
+                ...options.headers,
+            },
+            timeout: options.timeoutMs ?? DEFAULT_TIMEOUT_MS,
+        }, res => {
+            const chunks: Buffer[] = [];
+            res.on('data', (chunk: Buffer) => chunks.push(chunk));
+            res.on('error', reject);
+            res.on('end', () => {
+                const text = Buffer.concat(chunks).toString('utf-8');
+                let parsed: unknown = text;
+                try {
+                    parsed = text ? JSON.parse(text) : null;
+                } catch {
+                    // Keep raw text
+                }
+
+                const status = res.statusCode ?? 0;
+                if (status < 200 || status >= 300) {
+                    reject(new GeminiHttpError(status, res.headers, parsed));
+                    return;
+                }
+                resolve({ status, headers: res.headers, body: parsed });
+            });
+        });
+
+        req.on('timeout', () => {
+            req.destroy(Object.assign(new Error(`Request timeout after ${options.timeoutMs ?? DEFAULT_TIMEOUT_MS}ms`), { code: 'ETIMEDOUT' }));
+        });
+        req.on('error', reject);
+        req.end(payload);
+    });
+}
+
+// Process-wide governor
+let defaultGovernor: GeminiRateGovernor | null = null;
+
+/**
+ * Get the process-wide Gemini rate governor
+ */
+export function getGeminiRateGovernor(): GeminiRateGovernor {
+    if (!defaultGovernor) {
+        defaultGovernor = new GeminiRateGovernor();
+    }
+    return defaultGovernor;
+}
+
+/**
+ * Replace the process-wide governor (e.g., with manifest or tier limits)
+ */
+export function configureGeminiRateGovernor(options: RateGovernorOptions): GeminiRateGovernor {
+    defaultGovernor = new GeminiRateGovernor(options);
+    return defaultGovernor;
+}
+
+function headerValue(value: string | string[] | undefined): string | undefined {
+    return Array.isArray(value) ? value[0] : value;
+}
+
+function sleep(ms: number): Promise<void> {
+    return new Promise(resolve => setTimeout(resolve, ms));
+}
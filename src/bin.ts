@@ -8,19 +8,7 @@ import { Command } from 'commander';
 import { readFileSync } from 'fs';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
-import { registerDoctorCommand } from './commands/doctor.js';
-import { registerSchemaCommand } from './commands/schema.js';
-import { registerSpikeCommand } from './commands/spike.js';
-import { registerRunCommand } from './commands/run.js';
-import { registerValidateCommand } from './commands/validate.js';
-import { registerPromoteCommand } from './commands/promote.js';
-import { registerInspectCommand } from './commands/inspect.js';
-import { registerCleanCommand } from './commands/clean.js';
-import { registerNewManifestCommand } from './commands/new-manifest.js';
-import { registerGuideCommand } from './commands/guide.js';
-import { registerDemoCommand } from './commands/demo.js';
-import { registerGenCommand } from './commands/gen.js';
-import { logger } from './utils/logger.js';
+import { registerCommands, resolveCommandsToLoad } from './commands/command-registry.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -33,25 +21,16 @@ program
     .description('AI-powered sprite sheet generation pipeline')
     .version(pkg.version, '-V, --version', 'Output the current version');
 
-// Register commands
-registerDoctorCommand(program);
-registerSchemaCommand(program);
-registerSpikeCommand(program);
-registerRunCommand(program);
-registerValidateCommand(program);
-registerPromoteCommand(program);
-registerInspectCommand(program);
-registerCleanCommand(program);
-registerNewManifestCommand(program);
-registerGuideCommand(program);
-registerDemoCommand(program);
-registerGenCommand(program);
+// Register only the commands this invocation needs (lazy module loading)
+const INLINE_COMMANDS = ['director', 'export'];
+await registerCommands(program, resolveCommandsToLoad(process.argv.slice(2), INLINE_COMMANDS));
 
 // Placeholder commands - to be implemented in subsequent stories
 program
     .command('director')
     .description('Launch Director Mode standalone (normally use gen --interactive)')
-    .action(() => {
+    .action(async () => {
+        const { logger } = await import('./utils/logger.js');
         logger.info({ command: 'director' }, 'director command - use gen --interactive instead');
         console.log('Use: banana gen --move=<move> --interactive');
     });
@@ -59,7 +38,8 @@ program
 program
     .command('export')
     .description('Export sprites to texture atlas (normally automatic after gen)')
-    .action(() => {
+    .action(async () => {
+        const { logger } = await import('./utils/logger.js');
         logger.info({ command: 'export' }, 'export command - export runs automatically after gen');
         console.log('Export runs automatically after generation.');
         console.log('For manual export, use: banana gen --move=<move>');
@@ -31,6 +31,9 @@ function displayResults(result: CleanupResult, dryRun: boolean): void {
     console.log(`Runs ${dryRun ? 'to delete' : 'deleted'}:    ${chalk.red(result.runsDeleted.toString())}`);
     console.log(`Runs preserved:  ${chalk.green(result.runsPreserved.toString())}`);
     console.log(`Space ${dryRun ? 'to free' : 'freed'}:     ${chalk.yellow(formatBytes(result.spaceFreedBytes))}`);
+    if (result.blobsDeleted > 0) {
+        console.log(`Shared frames ${dryRun ? 'to free' : 'freed'}: ${result.blobsDeleted}`);
+    }
 
     if (result.deletedRuns.length > 0 && result.deletedRuns.length <= 10) {
         console.log('');
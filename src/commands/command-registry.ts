@@ -0,0 +1,77 @@
+/**
+ * Command registry - lazy loading of CLI command modules
+ * Only the invoked command's module is imported, so lightweight commands
+ * don't pay for sharp, puppeteer-core, or @google/generative-ai at startup.
+ */
+
+import { Command } from 'commander';
+
+/**
+ * Registers a command (and its options) on the program
+ */
+export type CommandRegistrar = (program: Command) => void;
+
+/**
+ * Command name -> module loader, in help listing order
+ */
+const COMMAND_LOADERS: Record<string, () => Promise<CommandRegistrar>> = {
+    'doctor': async () => (await import('./doctor.js')).registerDoctorCommand,
+    'schema': async () => (await import('./schema.js')).registerSchemaCommand,
+    'spike': async () => (await import('./spike.js')).registerSpikeCommand,
+    'run': async () => (await import('./run.js')).registerRunCommand,
+    'validate': async () => (await import('./validate.js')).registerValidateCommand,
+    'promote': async () => (await import('./promote.js')).registerPromoteCommand,
+    'inspect': async () => (await import('./inspect.js')).registerInspectCommand,
+    'clean': async () => (await import('./clean.js')).registerCleanCommand,
+    'new-manifest': async () => (await import('./new-manifest.js')).registerNewManifestCommand,
+    'guide': async () => (await import('./guide.js')).registerGuideCommand,
+    'demo': async () => (await import('./demo.js')).registerDemoCommand,
+    'gen': async () => (await import('./gen.js')).registerGenCommand,
+};
+
+/**
+ * Names of all lazily loaded commands
+ */
+export const LAZY_COMMAND_NAMES: readonly string[] = Object.keys(COMMAND_LOADERS);
+
+/**
+ * Decide which command modules an invocation needs.
+ *
+ * - `banana <cmd> ...` / `banana help <cmd>`: just that command
+ * - `banana --version` or an inline command (director, export): none
+ * - top-level help, no arguments, or an unknown command: all, so the
+ *   help listing and "did you mean" suggestions are complete
+ *
+ * @param args - CLI arguments without node and script path (process.argv.slice(2))
+ */
+export function resolveCommandsToLoad(args: string[], inlineCommands: string[] = []): string[] {
+    const positional = args.filter(arg => !arg.startsWith('-'));
+    const [first, second] = positional;
+
+    if (first === undefined) {
+        const wantsVersion = args.includes('-V') || args.includes('--version');
+        return wantsVersion ? [] : [...LAZY_COMMAND_NAMES];
+    }
+
+    if (first === 'help') {
+        return second !== undefined && second in COMMAND_LOADERS ? [second] : [...LAZY_COMMAND_NAMES];
+    }
+
+    if (first in COMMAND_LOADERS) {
+        return [first];
+    }
+
+    return inlineCommands.includes(first) ? [] : [...LAZY_COMMAND_NAMES];
+}
+
+/**
+ * Import the named command modules in parallel and register them in
+ * listing order
+ */
+export async function registerCommands(program: Command, names: string[]): Promise<void> {
+    const ordered = LAZY_COMMAND_NAMES.filter(name => names.includes(name));
+    const registrars = await Promise.all(ordered.map(name => COMMAND_LOADERS[name]()));
+    for (const register of registrars) {
+        register(program);
+    }
+}
@@ -271,7 +271,8 @@ async function executeGen(options: GenOptions): Promise<void> {
             directorServer = await startDirectorServer(
                 runPaths.root,
                 runId,
-                options.port
+                options.port,
+                runPaths.runsDir
             );
 
             runReporter.directorLaunch(options.port);
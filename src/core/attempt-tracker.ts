@@ -28,6 +28,21 @@ export interface AttemptRecord {
     durationMs: number;
     /** Retry strategy used */
     strategy?: string;
+    /** Perceptual hash of the candidate image */
+    phash?: string;
+    /** Earlier attempt this candidate near-duplicates */
+    duplicateOf?: DuplicateMatch;
+}
+
+/**
+ * Reference to the earlier attempt a duplicate candidate matched
+ */
+export interface DuplicateMatch {
+    runId: string;
+    frameIndex: number;
+    attemptIndex: number;
+    /** Hamming distance between perceptual hashes */
+    distance: number;
 }
 
 /**
@@ -54,6 +69,8 @@ export interface RunStateWithAttempts extends RunState {
     totalAttempts: number;
     /** Per-frame attempt details */
     frameAttempts: Record<number, FrameAttemptState>;
+    /** Attempts whose candidate duplicated an earlier one (absent in older state files) */
+    duplicateAttempts?: number;
 }
 
 /**
@@ -77,6 +94,7 @@ export function initializeAttemptTracking(
         ...state,
         totalAttempts: 0,
         frameAttempts,
+        duplicateAttempts: 0,
     };
 }
 
@@ -222,6 +240,74 @@ export function checkCircuitBreaker(
     };
 }
 
+/**
+ * Mark the latest attempt for a frame as a duplicate of an earlier candidate
+ * and record the candidate's perceptual hash
+ */
+export function recordDuplicateAttempt(
+    state: RunStateWithAttempts,
+    frameIndex: number,
+    phash: string,
+    match: DuplicateMatch
+): RunStateWithAttempts {
+    const frameState = state.frameAttempts[frameIndex];
+    if (!frameState || frameState.attempts.length === 0) {
+        return state;
+    }
+
+    const attempts = [...frameState.attempts];
+    attempts[attempts.length - 1] = {
+        ...attempts[attempts.length - 1],
+        phash,
+        duplicateOf: match,
+    };
+
+    const newState = { ...state };
+    newState.frameAttempts = { ...state.frameAttempts };
+    newState.frameAttempts[frameIndex] = {
+        ...frameState,
+        attempts,
+    };
+    newState.duplicateAttempts = (state.duplicateAttempts ?? 0) + 1;
+
+    const stats = getDuplicateStats(newState);
+    logger.info({
+        event: 'duplicate_candidate',
+        frameIndex,
+        attemptIndex: attempts[attempts.length - 1].attemptIndex,
+        duplicateOf: match,
+        duplicateAttempts: stats.duplicateAttempts,
+        duplicateRate: stats.duplicateRate,
+    }, `Frame ${frameIndex}: Candidate duplicates attempt ${match.attemptIndex} of frame ${match.frameIndex} (distance ${match.distance})`);
+
+    return newState;
+}
+
+/**
+ * Duplicate candidate statistics
+ */
+export interface DuplicateStats {
+    duplicateAttempts: number;
+    totalAttempts: number;
+    duplicateRate: number;
+    estimatedWastedCost: number;
+}
+
+/**
+ * Calculate duplicate rate and wasted generation spend
+ */
+export function getDuplicateStats(state: RunStateWithAttempts): DuplicateStats {
+    const duplicateAttempts = state.duplicateAttempts ?? 0;
+    const totalAttempts = state.totalAttempts;
+
+    return {
+        duplicateAttempts,
+        totalAttempts,
+        duplicateRate: totalAttempts > 0 ? duplicateAttempts / totalAttempts : 0,
+        estimatedWastedCost: duplicateAttempts * ESTIMATED_COST_PER_ATTEMPT,
+    };
+}
+
 /**
  * Get attempt history for a frame
  */
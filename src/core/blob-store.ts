@@ -0,0 +1,366 @@
+/**
+ * Blob Store - content-addressed storage for run artifacts
+ * Frames are stored once under <runsDir>/.blobs/sha256/ and hardlinked into
+ * run folders (approved, rejected, export staging), so copying a
+ * frame between folders or runs costs a directory entry instead of its bytes.
+ *
+ * Reference counting uses the filesystem link count: a blob whose only link
+ * is the store's own entry is unreferenced and removed by collectGarbage().
+ *
+ * Blobs are read-only (0444), and so is every run-folder file linked to one:
+ * approved, rejected, and export staging frames. Replace such a file with
+ * link-and-rename (as linkFile/writeBuffer do) rather than writing in place.
+ *
+ * The store is only used where the configured runs root is known (see
+ * getBlobStore); callers without one fall back to plain copies.
+ */
+
+import { promises as fs, constants as fsConstants, createReadStream } from 'fs';
+import { createHash, randomBytes } from 'crypto';
+import { dirname, join } from 'path';
+import { BLOB_STORE_DIR } from '../domain/constants/run-folders.js';
+import { pathExists } from '../utils/fs-helpers.js';
+import { logger } from '../utils/logger.js';
+
+/**
+ * How a file was placed at its destination
+ * - hardlink: shares the blob's inode (no extra bytes)
+ * - clone: reflink where the filesystem supports it, plain copy otherwise
+ */
+export type MaterializeMethod = 'hardlink' | 'clone';
+
+/**
+ * Result of placing a blob at a destination path
+ */
+export interface MaterializeResult {
+    digest: string;
+    path: string;
+    method: MaterializeMethod;
+    deduplicated: boolean;      // Blob already existed in the store
+    bytes: number;
+}
+
+/**
+ * Blob placed in (or found in) the store
+ */
+interface IngestResult {
+    digest: string;
+    deduplicated: boolean;
+    bytes: number;
+}
+
+/**
+ * Garbage collection options
+ */
+export interface BlobGcOptions {
+    dryRun?: boolean;
+}
+
+/**
+ * Garbage collection result
+ */
+export interface BlobGcResult {
+    blobsScanned: number;
+    blobsReferenced: number;
+    blobsDeleted: number;
+    bytesFreed: number;
+}
+
+// Filesystems or layouts that can't hardlink: fall back to clone/copy
+const LINK_FALLBACK_CODES = new Set(['EXDEV', 'EPERM', 'ENOTSUP', 'EOPNOTSUPP', 'EMLINK']);
+// A concurrent collectGarbage() can delete a blob between ingest and link;
+// the blob is re-ingested and linked again this many times before giving up
+const MAX_STORE_ATTEMPTS = 3;
+// Interrupted ingests leave temp files; collect them once they're clearly stale
+const STALE_TEMP_MS = 60 * 60 * 1000;
+// Content not yet hashed is written here (beside the shards, so GC sweeps stale temps)
+const INCOMING_DIR = 'incoming';
+
+/**
+ * Content-addressed blob store
+ */
+export class BlobStore {
+    readonly root: string;
+
+    constructor(root: string) {
+        this.root = root;
+    }
+
+    /**
+     * Path of a blob in the store
+     */
+    blobPath(digest: string): string {
+        return join(this.root, 'sha256', digest.slice(0, 2), digest);
+    }
+
+    /**
+     * Store a file's content and link it at destPath (replacing any file there).
+     * Drop-in replacement for fs.copyFile between run folders.
+     *
+     * @param knownDigest - SHA-256 of the source already computed by the
+     *   caller (e.g. from a frame fact sheet). Only used to find an existing
+     *   blob, which is then linked without reading the source; a new blob is
+     *   addressed by hashing the copy that was actually written, so neither a
+     *   stale digest nor a source rewritten mid-copy can store bytes under
+     *   the wrong address.
+     */
+    async linkFile(sourcePath: string, destPath: string, knownDigest?: string): Promise<MaterializeResult> {
+        const digest = knownDigest && await pathExists(this.blobPath(knownDigest))
+            ? knownDigest
+            : null;
+        return this.store(digest, destPath, tempPath =>
+            fs.copyFile(sourcePath, tempPath, fsConstants.COPYFILE_FICLONE)
+        );
+    }
+
+    /**
+     * Store a buffer and link it at destPath (replacing any file there).
+     * Drop-in replacement for fs.writeFile of frame data.
+     */
+    async writeBuffer(buffer: Buffer, destPath: string): Promise<MaterializeResult> {
+        const digest = createHash('sha256').update(buffer).digest('hex');
+        return this.store(digest, destPath, tempPath => fs.writeFile(tempPath, buffer));
+    }
+
+    /**
+     * Delete blobs no run folder links to any more
+     */
+    async collectGarbage(options: BlobGcOptions = {}): Promise<BlobGcResult> {
+        const result: BlobGcResult = {
+            blobsScanned: 0,
+            blobsReferenced: 0,
+            blobsDeleted: 0,
+            bytesFreed: 0,
+        };
+
+        const shardsDir = join(this.root, 'sha256');
+        let shards: string[];
+        try {
+            shards = await fs.readdir(shardsDir);
+        } catch {
+            return result; // Store never used
+        }
+
+        for (const shard of shards) {
+            const shardDir = join(shardsDir, shard);
+            let names: string[];
+            try {
+                names = await fs.readdir(shardDir);
+            } catch {
+                continue;
+            }
+
+            for (const name of names) {
+                const blobPath = join(shardDir, name);
+                const stats = await fs.stat(blobPath).catch(() => null);
+                if (!stats?.isFile()) continue;
+
+                if (name.endsWith('.tmp')) {
+                    if (Date.now() - stats.mtimeMs > STALE_TEMP_MS && !options.dryRun) {
+                        await fs.rm(blobPath, { force: true });
+                    }
+                    continue;
+                }
+
+                result.blobsScanned++;
+                if (stats.nlink > 1) {
+                    result.blobsReferenced++;
+                    continue;
+                }
+
+                if (!options.dryRun) {
+                    await fs.rm(blobPath, { force: true });
+                }
+                result.blobsDeleted++;
+                result.bytesFreed += stats.size;
+            }
+        }
+
+        logger.info({
+            event: 'blob_gc_complete',
+            root: this.root,
+            dryRun: options.dryRun,
+            ...result,
+        }, `Blob GC: ${result.blobsDeleted} unreferenced blobs ${options.dryRun ? 'found' : 'deleted'}`);
+
+        return result;
+    }
+
+    /**
+     * Ingest then materialize. If the blob disappears in between (a
+     * concurrent collectGarbage saw it with no other links), ingest it again.
+     * A null digest means the content is hashed as it is written.
+     */
+    private async store(
+        digest: string | null,
+        destPath: string,
+        write: (tempPath: string) => Promise<void>
+    ): Promise<MaterializeResult> {
+        for (let attempt = 1; ; attempt++) {
+            const ingested = digest
+                ? await this.ingest(digest, write)
+                : await this.ingestUnaddressed(write);
+            try {
+                return await this.materialize(ingested.digest, destPath, ingested);
+            } catch (error) {
+                const code = (error as NodeJS.ErrnoException).code;
+                if (code !== 'ENOENT' || attempt >= MAX_STORE_ATTEMPTS || await pathExists(this.blobPath(ingested.digest))) {
+                    throw error;
+                }
+                logger.debug({ event: 'blob_collected_before_link', digest: ingested.digest, destPath, attempt });
+            }
+        }
+    }
+
+    /**
+     * Write a blob into the store unless it is already there.
+     * Blobs are written to a temp name and renamed, so concurrent ingests
+     * of the same content are safe.
+     */
+    private async ingest(
+        digest: string,
+        write: (tempPath: string) => Promise<void>
+    ): Promise<IngestResult> {
+        const blobPath = this.blobPath(digest);
+
+        const existing = await fs.stat(blobPath).catch(() => null);
+        if (existing) {
+            return { digest, deduplicated: true, bytes: existing.size };
+        }
+
+        await fs.mkdir(dirname(blobPath), { recursive: true });
+        const tempPath = `${blobPath}.${process.pid}.${randomBytes(4).toString('hex')}.tmp`;
+        try {
+            await write(tempPath);
+            await this.commitBlob(tempPath, blobPath);
+        } catch (error) {
+            await fs.rm(tempPath, { force: true });
+            throw error;
+        }
+
+        const stats = await fs.stat(blobPath);
+        return { digest, deduplicated: false, bytes: stats.size };
+    }
+
+    /**
+     * Write content whose digest isn't known yet: write it to a temp file,
+     * hash the temp file, and rename it to the address of what was written
+     */
+    private async ingestUnaddressed(write: (tempPath: string) => Promise<void>): Promise<IngestResult> {
+        const incomingDir = join(this.root, 'sha256', INCOMING_DIR);
+        await fs.mkdir(incomingDir, { recursive: true });
+        const tempPath = join(incomingDir, `${process.pid}.${randomBytes(4).toString('hex')}.tmp`);
+        try {
+            await write(tempPath);
+            const digest = await hashFile(tempPath);
+            const blobPath = this.blobPath(digest);
+
+            const existing = await fs.stat(blobPath).catch(() => null);
+            if (existing) {
+                await fs.rm(tempPath, { force: true });
+                return { digest, deduplicated: true, bytes: existing.size };
+            }
+
+            await fs.mkdir(dirname(blobPath), { recursive: true });
+            await this.commitBlob(tempPath, blobPath);
+            const stats = await fs.stat(blobPath);
+            return { digest, deduplicated: false, bytes: stats.size };
+        } catch (error) {
+            await fs.rm(tempPath, { force: true });
+            throw error;
+        }
+    }
+
+    /**
+     * Make a fully written temp file read-only and move it to its blob path
+     */
+    private async commitBlob(tempPath: string, blobPath: string): Promise<void> {
+        // Read-only: an in-place write through any link fails instead of
+        // silently changing every run that shares the blob
+        if (process.platform !== 'win32') {
+            await fs.chmod(tempPath, 0o444);
+        }
+        await fs.rename(tempPath, blobPath);
+    }
+
+    /**
+     * Link a stored blob at destPath, falling back to a clone when the
+     * destination can't be hardlinked (e.g. another filesystem)
+     */
+    private async materialize(
+        digest: string,
+        destPath: string,
+        ingested: IngestResult
+    ): Promise<MaterializeResult> {
+        const blobPath = this.blobPath(digest);
+        await fs.mkdir(dirname(destPath), { recursive: true });
+
+        // Link to a temp name and rename, so an existing destination is
+        // replaced rather than written through
+        const tempPath = `${destPath}.${process.pid}.${randomBytes(4).toString('hex')}.tmp`;
+        let method: MaterializeMethod = 'hardlink';
+        try {
+            try {
+                await fs.link(blobPath, tempPath);
+            } catch (error) {
+                const code = (error as NodeJS.ErrnoException).code;
+                if (!code || !LINK_FALLBACK_CODES.has(code)) {
+                    throw error;
+                }
+                await fs.copyFile(blobPath, tempPath, fsConstants.COPYFILE_FICLONE);
+                method = 'clone';
+            }
+            await fs.rename(tempPath, destPath);
+        } catch (error) {
+            await fs.rm(tempPath, { force: true });
+            throw error;
+        }
+
+        logger.debug({
+            event: 'blob_materialized',
+            digest,
+            destPath,
+            method,
+            deduplicated: ingested.deduplicated,
+        });
+
+        return {
+            digest,
+            path: destPath,
+            method,
+            deduplicated: ingested.deduplicated,
+            bytes: ingested.bytes,
+        };
+    }
+}
+
+/**
+ * Get the blob store shared by all runs in a runs directory.
+ * Pass the configured runs root (e.g. --runs-dir), not a path derived from
+ * a run folder: runs created elsewhere would otherwise get a store of their own.
+ */
+export function getBlobStore(runsDir: string): BlobStore {
+    return new BlobStore(join(runsDir, BLOB_STORE_DIR));
+}
+
+/**
+ * Copy a file outside the runs directory (e.g. promoted release assets).
+ * Uses a reflink where the filesystem supports it, so the copy shares
+ * extents without the aliasing of a hardlink; plain copy otherwise.
+ */
+export async function cloneFile(sourcePath: string, destPath: string): Promise<void> {
+    await fs.copyFile(sourcePath, destPath, fsConstants.COPYFILE_FICLONE);
+}
+
+/**
+ * SHA-256 of a file's contents, streamed
+ */
+export function hashFile(filePath: string): Promise<string> {
+    return new Promise((resolve, reject) => {
+        const hash = createHash('sha256');
+        createReadStream(filePath)
+            .on('error', reject)
+            .on('data', chunk => hash.update(chunk))
+            .on('end', () => resolve(hash.digest('hex')));
+    });
+}
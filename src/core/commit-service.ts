@@ -10,6 +10,7 @@ import { Result } from './config-resolver.js';
 import type { DirectorSessionManager } from './director-session-manager.js';
 import type { DirectorFrameState, HumanAlignmentDelta } from '../domain/types/director-session.js';
 import { logger } from '../utils/logger.js';
+import { getBlobStore, type BlobStore } from './blob-store.js';
 
 /**
  * Commit request parameters
@@ -44,10 +45,24 @@ export type CommitErrorCode =
   | 'FILE_WRITE_ERROR'
   | 'SESSION_UPDATE_ERROR';
 
+/**
+ * Commit service configuration
+ */
+export interface CommitServiceOptions {
+  /** Configured runs root; approved frames are stored in its blob store when set */
+  runsDir?: string;
+}
+
 /**
  * Service for committing Director sessions
  */
 export class CommitService {
+  private readonly blobStore: BlobStore | null;
+
+  constructor(options: CommitServiceOptions = {}) {
+    this.blobStore = options.runsDir ? getBlobStore(options.runsDir) : null;
+  }
+
   /**
    * Commit the current Director session
    *
@@ -239,7 +254,11 @@ export class CommitService {
 
     // Write to approved folder (AC #3)
     try {
-      await fs.writeFile(outputPath, imageBuffer);
+      if (this.blobStore) {
+        await this.blobStore.writeBuffer(imageBuffer, outputPath);
+      } else {
+        await fs.writeFile(outputPath, imageBuffer);
+      }
     } catch (error) {
       return Result.err({
         code: 'FILE_WRITE_ERROR',
@@ -56,7 +56,7 @@ export class DirectorServer extends EventEmitter {
     private patchService: PatchService;
     private commitService: CommitService;
 
-    constructor(runPath: string, runId: string, port: number = 3000) {
+    constructor(runPath: string, runId: string, port: number = 3000, runsDir?: string) {
         super();
 
         // Set max listeners to prevent memory leak warnings
@@ -73,7 +73,7 @@ export class DirectorServer extends EventEmitter {
         // Initialize services
         this.sessionManager = new DirectorSessionManager(runId, runPath);
         this.patchService = new PatchService();
-        this.commitService = new CommitService();
+        this.commitService = new CommitService({ runsDir });
     }
 
     /**
@@ -664,9 +664,10 @@ export class DirectorServer extends EventEmitter {
 export async function startDirectorServer(
     runPath: string,
     runId: string,
-    port: number = 3000
+    port: number = 3000,
+    runsDir?: string
 ): Promise<DirectorServer> {
-    const server = new DirectorServer(runPath, runId, port);
+    const server = new DirectorServer(runPath, runId, port, runsDir);
     await server.start();
     return server;
 }
@@ -166,6 +166,7 @@ export async function exportAtlas(
         runId,
         runsDir,
         moveId: move,
+        factSheet: preValidation.factSheet,
     });
 
     if (prepareResult.isErr()) {
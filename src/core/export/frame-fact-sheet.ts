@@ -0,0 +1,213 @@
+/**
+ * Frame Fact Sheet - per-frame facts gathered once for export validation
+ *
+ * Each approved frame is read from disk exactly once; hash, size, header
+ * metadata, and opaque bounds all come from that buffer. Frames are read
+ * with bounded parallelism, and the sheet is handed to every check and to
+ * later export stages instead of each walking the folder again.
+ */
+
+import { promises as fs } from 'fs';
+import path from 'path';
+import crypto from 'crypto';
+import sharp from 'sharp';
+import { logger } from '../../utils/logger.js';
+import { DEFAULT_IO_CONCURRENCY, mapWithConcurrency } from '../../utils/concurrency.js';
+
+/**
+ * Opaque bounding box of a frame
+ */
+export interface OpaqueBounds {
+    left: number;
+    top: number;
+    right: number;
+    bottom: number;
+    width: number;
+    height: number;
+}
+
+/**
+ * Frame information collected during validation
+ */
+export interface FrameInfo {
+    index: number;
+    path: string;
+    filename: string;
+    metadata?: sharp.Metadata;
+    hash?: string;              // SHA-256, same digest the blob store uses
+    fileSize?: number;
+    mtimeMs?: number;           // Modification time when collected (staleness check)
+    opaqueBounds?: OpaqueBounds;
+}
+
+/**
+ * Facts about every frame in an approved folder
+ */
+export interface FrameFactSheet {
+    approvedPath: string;
+    entries: string[];          // Full directory listing (stray file check, staging)
+    frames: FrameInfo[];        // PNG frames, sorted by filename
+    collectedAt: string;
+    durationMs: number;
+    concurrency: number;
+}
+
+/**
+ * Fact collection options
+ */
+export interface FrameFactSheetOptions {
+    concurrency?: number;       // Frames read/decoded in parallel (default: DEFAULT_IO_CONCURRENCY)
+}
+
+/**
+ * Extract frame index from filename
+ * Expected format: frame_XXXX.png
+ */
+export function extractFrameIndex(filename: string): number | null {
+    const match = filename.match(/frame_(\d{4})\.png$/i);
+    if (match) {
+        return parseInt(match[1], 10);
+    }
+    return null;
+}
+
+/**
+ * Calculate opaque bounding box of an image (path or encoded buffer)
+ */
+export async function calculateOpaqueBounds(input: string | Buffer): Promise<OpaqueBounds | null> {
+    try {
+        const { data, info } = await sharp(input)
+            .ensureAlpha()
+            .raw()
+            .toBuffer({ resolveWithObject: true });
+
+        let minX = info.width;
+        let minY = info.height;
+        let maxX = 0;
+        let maxY = 0;
+        let hasOpaque = false;
+
+        for (let y = 0; y < info.height; y++) {
+            for (let x = 0; x < info.width; x++) {
+                const alpha = data[(y * info.width + x) * 4 + 3];
+                if (alpha > 0) {
+                    hasOpaque = true;
+                    if (x < minX) minX = x;
+                    if (y < minY) minY = y;
+                    if (x > maxX) maxX = x;
+                    if (y > maxY) maxY = y;
+                }
+            }
+        }
+
+        if (!hasOpaque) {
+            return null;
+        }
+
+        return {
+            left: minX,
+            top: minY,
+            right: maxX,
+            bottom: maxY,
+            width: maxX - minX + 1,
+            height: maxY - minY + 1,
+        };
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * Gather facts for one frame from a single read
+ */
+async function collectFrameFacts(filePath: string, filename: string, fallbackIndex: number): Promise<FrameInfo> {
+    const frame: FrameInfo = {
+        index: extractFrameIndex(filename) ?? fallbackIndex,
+        path: filePath,
+        filename,
+    };
+
+    // Stat before reading: a write after the stat moves mtime on, so
+    // isFrameFactCurrent() can't mistake newer bytes for these
+    let buffer: Buffer;
+    try {
+        const stats = await fs.stat(filePath);
+        buffer = await fs.readFile(filePath);
+        frame.mtimeMs = stats.mtimeMs;
+    } catch {
+        return frame; // Unreadable: reported by the corruption check
+    }
+
+    frame.fileSize = buffer.length;
+    frame.hash = crypto.createHash('sha256').update(buffer).digest('hex');
+
+    try {
+        frame.metadata = await sharp(buffer).metadata();
+    } catch {
+        return frame; // Corrupted image
+    }
+
+    const bounds = await calculateOpaqueBounds(buffer);
+    if (bounds) {
+        frame.opaqueBounds = bounds;
+    }
+
+    return frame;
+}
+
+/**
+ * Whether a frame's file still matches its collected facts (size and mtime).
+ * Callers reusing the sheet's hash should check this first.
+ */
+export async function isFrameFactCurrent(frame: FrameInfo): Promise<boolean> {
+    if (frame.fileSize === undefined || frame.mtimeMs === undefined) {
+        return false;
+    }
+    try {
+        const stats = await fs.stat(frame.path);
+        return stats.size === frame.fileSize && stats.mtimeMs === frame.mtimeMs;
+    } catch {
+        return false;
+    }
+}
+
+/**
+ * Collect the fact sheet for an approved frames folder
+ *
+ * @param approvedPath - Path to approved frames folder
+ * @param options - Collection options
+ * @returns Facts for every PNG frame, in filename order
+ */
+export async function collectFrameFactSheet(
+    approvedPath: string,
+    options: FrameFactSheetOptions = {}
+): Promise<FrameFactSheet> {
+    const startTime = Date.now();
+    const concurrency = options.concurrency ?? DEFAULT_IO_CONCURRENCY;
+
+    const entries = await fs.readdir(approvedPath);
+    const pngFiles = entries.filter(f => f.toLowerCase().endsWith('.png')).sort();
+
+    const frames = await mapWithConcurrency(pngFiles, concurrency, (filename, i) =>
+        collectFrameFacts(path.join(approvedPath, filename), filename, i)
+    );
+
+    const durationMs = Date.now() - startTime;
+
+    logger.debug({
+        event: 'frame_fact_sheet_collected',
+        approved_path: approvedPath,
+        frame_count: frames.length,
+        concurrency,
+        duration_ms: durationMs,
+    });
+
+    return {
+        approvedPath,
+        entries,
+        frames,
+        collectedAt: new Date().toISOString(),
+        durationMs,
+        concurrency,
+    };
+}
@@ -16,6 +16,9 @@ import {
 } from '../../utils/frame-naming.js';
 import { writeJsonAtomic, pathExists } from '../../utils/fs-helpers.js';
 import { logger } from '../../utils/logger.js';
+import { getBlobStore } from '../blob-store.js';
+import { DEFAULT_IO_CONCURRENCY, mapWithConcurrency } from '../../utils/concurrency.js';
+import { isFrameFactCurrent, type FrameFactSheet, type FrameInfo } from './frame-fact-sheet.js';
 
 /**
  * Frame preparation result
@@ -33,10 +36,26 @@ export interface FramePreparerContext {
     runId: string;
     runsDir: string;
     moveId: string;
+    factSheet?: FrameFactSheet;     // From pre-export validation: reuses listing and digests
+    concurrency?: number;           // Frames linked in parallel
 }
 
 /**
- * Prepare approved frames for export by copying them to a staging folder
+ * A frame that failed to link into staging
+ */
+class FrameLinkError extends Error {
+    constructor(
+        readonly originalFile: string,
+        readonly originalPath: string,
+        readonly newPath: string,
+        readonly reason: unknown
+    ) {
+        super(`Failed to link frame: ${originalFile}`);
+    }
+}
+
+/**
+ * Prepare approved frames for export by linking them into a staging folder
  * with Phaser-compatible naming (4-digit zero padding)
  *
  * @param approvedPath - Path to the approved frames folder
@@ -48,6 +67,9 @@ export async function prepareFramesForExport(
     context: FramePreparerContext
 ): Promise<Result<FramePreparationResult, SystemError>> {
     const { runId, runsDir, moveId } = context;
+    const factSheet = context.factSheet && path.resolve(context.factSheet.approvedPath) === path.resolve(approvedPath)
+        ? context.factSheet
+        : undefined;
 
     logger.info({
         event: 'frame_preparation_start',
@@ -80,7 +102,7 @@ export async function prepareFramesForExport(
     // List approved frames (sorted for determinism)
     let approvedFiles: string[];
     try {
-        const files = await fs.readdir(approvedPath);
+        const files = factSheet ? factSheet.entries : await fs.readdir(approvedPath);
         approvedFiles = files
             .filter(f => f.endsWith('.png'))
             .sort((a, b) => a.localeCompare(b, undefined, { numeric: true }));
@@ -100,31 +122,53 @@ export async function prepareFramesForExport(
         });
     }
 
-    // Copy frames with new naming convention
-    const mappings: FrameMappingEntry[] = [];
-
-    for (let i = 0; i < approvedFiles.length; i++) {
-        const originalFile = approvedFiles[i];
-        const originalPath = path.join(approvedPath, originalFile);
-        const newName = `${generateFrameName(moveId, i).replace('/', '_')}.png`;
-        const newPath = path.join(stagingPath, newName);
-
-        try {
-            await fs.copyFile(originalPath, newPath);
-            mappings.push(createFrameMapping(originalPath, moveId, i));
-        } catch (error) {
-            return Result.err({
-                code: 'SYS_COPY_FAILED',
-                message: `Failed to copy frame: ${originalFile}`,
-                context: {
-                    originalPath,
-                    newPath,
-                    error: String(error),
-                },
-            });
+    // Digests already computed by validation, so linking doesn't re-read frames
+    const knownFrames = new Map<string, FrameInfo>();
+    for (const frame of factSheet?.frames ?? []) {
+        if (frame.hash) {
+            knownFrames.set(frame.filename, frame);
         }
     }
 
+    // Link frames with new naming convention (blob store, no byte copy)
+    const blobStore = getBlobStore(runsDir);
+    let mappings: FrameMappingEntry[];
+
+    try {
+        mappings = await mapWithConcurrency(
+            approvedFiles,
+            context.concurrency ?? DEFAULT_IO_CONCURRENCY,
+            async (originalFile, i) => {
+                const originalPath = path.join(approvedPath, originalFile);
+                const newName = `${generateFrameName(moveId, i).replace('/', '_')}.png`;
+                const newPath = path.join(stagingPath, newName);
+
+                try {
+                    // A frame changed since validation is hashed again
+                    const known = knownFrames.get(originalFile);
+                    const knownDigest = known && await isFrameFactCurrent(known) ? known.hash : undefined;
+                    await blobStore.linkFile(originalPath, newPath, knownDigest);
+                } catch (error) {
+                    throw new FrameLinkError(originalFile, originalPath, newPath, error);
+                }
+                return createFrameMapping(originalPath, moveId, i);
+            }
+        );
+    } catch (error) {
+        if (!(error instanceof FrameLinkError)) {
+            throw error;
+        }
+        return Result.err({
+            code: 'SYS_COPY_FAILED',
+            message: `Failed to copy frame: ${error.originalFile}`,
+            context: {
+                originalPath: error.originalPath,
+                newPath: error.newPath,
+                error: String(error.reason),
+            },
+        });
+    }
+
     // Create mapping log
     const mappingLog = createFrameMappingLog(runId, moveId, mappings);
 
@@ -146,6 +190,7 @@ export async function prepareFramesForExport(
         move_id: moveId,
         staging_path: stagingPath,
         frame_count: approvedFiles.length,
+        reused_digests: knownFrames.size,
     });
 
     return Result.ok({
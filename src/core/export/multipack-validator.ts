@@ -294,6 +294,35 @@ export async function validateMultipack(
     });
 }
 
+/**
+ * Get all frame keys from parsed atlas JSON (single or multipack)
+ *
+ * @param json - Parsed atlas JSON
+ * @returns Array of frame keys or empty array if the structure is unrecognized
+ */
+export function extractFrameKeys(json: unknown): string[] {
+    if (typeof json !== 'object' || json === null) {
+        return [];
+    }
+    const atlas = json as { textures?: unknown; frames?: Record<string, unknown> };
+
+    if ('textures' in atlas && Array.isArray(atlas.textures)) {
+        // Multipack format
+        const keys: string[] = [];
+        for (const texture of atlas.textures) {
+            if (texture?.frames) {
+                keys.push(...Object.keys(texture.frames));
+            }
+        }
+        return keys;
+    } else if ('frames' in atlas && atlas.frames) {
+        // Single format
+        return Object.keys(atlas.frames);
+    }
+
+    return [];
+}
+
 /**
  * Get all frame keys from a multipack atlas
  *
@@ -303,23 +332,7 @@ export async function validateMultipack(
 export async function getMultipackFrameKeys(jsonPath: string): Promise<string[]> {
     try {
         const content = await fs.readFile(jsonPath, 'utf-8');
-        const json = JSON.parse(content);
-
-        if ('textures' in json && Array.isArray(json.textures)) {
-            // Multipack format
-            const keys: string[] = [];
-            for (const texture of json.textures) {
-                if (texture.frames) {
-                    keys.push(...Object.keys(texture.frames));
-                }
-            }
-            return keys;
-        } else if ('frames' in json) {
-            // Single format
-            return Object.keys(json.frames);
-        }
-
-        return [];
+        return extractFrameKeys(JSON.parse(content));
     } catch {
         return [];
     }
@@ -4,6 +4,7 @@
  *
  * Validates exported atlas files after TexturePacker completes.
  * Performs JSON structure, frame data, PNG integrity, and bounds validation.
+ * Atlas JSON and PNG headers are read once and shared by all checks.
  */
 
 import { promises as fs } from 'fs';
@@ -12,7 +13,8 @@ import sharp from 'sharp';
 import { Result, SystemError } from '../result.js';
 import { logger } from '../../utils/logger.js';
 import { pathExists, writeJsonAtomic } from '../../utils/fs-helpers.js';
-import { getMultipackFrameKeys } from './multipack-validator.js';
+import { DEFAULT_IO_CONCURRENCY, mapWithConcurrency } from '../../utils/concurrency.js';
+import { extractFrameKeys } from './multipack-validator.js';
 import { isValidFrameKey, FRAME_KEY_PATTERN } from '../../domain/schemas/atlas.js';
 import type { Manifest } from '../../domain/schemas/manifest.js';
 import type { AtlasPaths } from './atlas-exporter.js';
@@ -47,50 +49,155 @@ export interface PostExportValidationResult {
     };
 }
 
+/**
+ * A PNG sheet's header, read once
+ */
+interface PngFacts {
+    exists: boolean;
+    metadata?: sharp.Metadata;
+    error?: unknown;
+}
+
+/**
+ * Everything the post-export checks need, gathered once:
+ * the atlas JSON is read and parsed a single time and each PNG sheet's
+ * header is read a single time, in parallel.
+ */
+interface AtlasFacts {
+    jsonPath: string;
+    jsonExists: boolean;
+    json?: any;
+    jsonError?: unknown;
+    frameKeys: string[];
+    png: PngFacts;                  // Primary sheet (atlasPaths.png)
+    sheets: Array<{
+        index: number;
+        image: string;
+        pngPath: string;
+        expectedSize?: { w: number; h: number };
+        facts?: PngFacts;
+    }>;
+    expectedSize?: { w: number; h: number };
+    isMultipack: boolean;
+}
+
+/**
+ * Read a PNG header
+ */
+async function readPngFacts(pngPath: string): Promise<PngFacts> {
+    if (!(await pathExists(pngPath))) {
+        return { exists: false };
+    }
+    try {
+        return { exists: true, metadata: await sharp(pngPath).metadata() };
+    } catch (error) {
+        return { exists: true, error };
+    }
+}
+
+/**
+ * Gather atlas facts (single JSON read, parallel PNG header reads)
+ */
+async function collectAtlasFacts(atlasPaths: AtlasPaths): Promise<AtlasFacts> {
+    const facts: AtlasFacts = {
+        jsonPath: atlasPaths.json,
+        jsonExists: await pathExists(atlasPaths.json),
+        frameKeys: [],
+        png: { exists: false },
+        sheets: [],
+        isMultipack: false,
+    };
+
+    if (facts.jsonExists) {
+        try {
+            facts.json = JSON.parse(await fs.readFile(atlasPaths.json, 'utf-8'));
+            facts.frameKeys = extractFrameKeys(facts.json);
+        } catch (error) {
+            facts.jsonError = error;
+        }
+    }
+
+    // Expected sizes from JSON for PNG validation; detect multipack
+    const json = facts.json;
+    if (json?.textures && Array.isArray(json.textures)) {
+        facts.isMultipack = true;
+        const baseDir = path.dirname(atlasPaths.json);
+        facts.sheets = json.textures.map((texture: Record<string, unknown>, index: number) => {
+            const image = typeof texture?.image === 'string' ? texture.image : '';
+            const size = texture?.size as { w: number; h: number } | undefined;
+            const expected = size && typeof size.w === 'number' && typeof size.h === 'number'
+                ? { w: size.w, h: size.h }
+                : undefined;
+            return {
+                index,
+                image,
+                pngPath: image ? path.join(baseDir, image) : '',
+                expectedSize: expected,
+            };
+        });
+    } else if (json?.meta?.size) {
+        facts.expectedSize = json.meta.size;
+    }
+
+    // Each distinct PNG is read once, even if the primary sheet is also a texture
+    const pngPaths = [...new Set([
+        atlasPaths.png,
+        ...facts.sheets.map(sheet => sheet.pngPath).filter(Boolean),
+    ])];
+    const pngFacts = await mapWithConcurrency(pngPaths, DEFAULT_IO_CONCURRENCY, readPngFacts);
+    const byPath = new Map(pngPaths.map((pngPath, i) => [pngPath, pngFacts[i]]));
+
+    facts.png = byPath.get(atlasPaths.png)!;
+    for (const sheet of facts.sheets) {
+        sheet.facts = sheet.pngPath ? byPath.get(sheet.pngPath) : undefined;
+    }
+
+    return facts;
+}
+
 /**
  * Validate JSON structure
  */
-async function validateJsonStructure(jsonPath: string): Promise<CheckResult> {
-    if (!(await pathExists(jsonPath))) {
+function validateJsonStructure(facts: AtlasFacts): CheckResult {
+    if (!facts.jsonExists) {
         return {
             passed: false,
-            message: `Atlas JSON not found: ${jsonPath}`,
+            message: `Atlas JSON not found: ${facts.jsonPath}`,
         };
     }
 
-    try {
-        const content = await fs.readFile(jsonPath, 'utf-8');
-        const json = JSON.parse(content);
-
-        // Check for single vs multipack
-        if (json.frames && typeof json.frames === 'object') {
-            return {
-                passed: true,
-                message: 'Valid single-pack structure',
-                details: { format: 'single' },
-            };
-        } else if (json.textures && Array.isArray(json.textures)) {
-            return {
-                passed: true,
-                message: 'Valid multipack structure',
-                details: { format: 'multipack', textureCount: json.textures.length },
-            };
-        } else {
+    if (facts.jsonError !== undefined) {
+        if (facts.jsonError instanceof SyntaxError) {
             return {
                 passed: false,
-                message: "Invalid atlas structure: missing 'frames' or 'textures'",
-            };
-        }
-    } catch (error) {
-        if (error instanceof SyntaxError) {
-            return {
-                passed: false,
-                message: `JSON parse error: ${error.message}`,
+                message: `JSON parse error: ${facts.jsonError.message}`,
             };
         }
         return {
             passed: false,
-            message: `Error reading JSON: ${error}`,
+            message: `Error reading JSON: ${facts.jsonError}`,
+        };
+    }
+
+    const json = facts.json;
+
+    // Check for single vs multipack
+    if (json?.frames && typeof json.frames === 'object') {
+        return {
+            passed: true,
+            message: 'Valid single-pack structure',
+            details: { format: 'single' },
+        };
+    } else if (json?.textures && Array.isArray(json.textures)) {
+        return {
+            passed: true,
+            message: 'Valid multipack structure',
+            details: { format: 'multipack', textureCount: json.textures.length },
+        };
+    } else {
+        return {
+            passed: false,
+            message: "Invalid atlas structure: missing 'frames' or 'textures'",
         };
     }
 }
@@ -98,12 +205,11 @@ async function validateJsonStructure(jsonPath: string): Promise<CheckResult> {
 /**
  * Validate frame count matches manifest
  */
-async function validateFrameCount(
-    jsonPath: string,
+function validateFrameCount(
+    frameKeys: string[],
     expectedCount: number,
     moveId: string
-): Promise<CheckResult> {
-    const frameKeys = await getMultipackFrameKeys(jsonPath);
+): CheckResult {
     const found = frameKeys.length;
 
     if (found === expectedCount) {
@@ -139,12 +245,10 @@ async function validateFrameCount(
 /**
  * Validate frame key format
  */
-async function validateFrameKeyFormat(
-    jsonPath: string,
+function validateFrameKeyFormat(
+    frameKeys: string[],
     moveId: string
-): Promise<CheckResult> {
-    const frameKeys = await getMultipackFrameKeys(jsonPath);
-
+): CheckResult {
     if (frameKeys.length === 0) {
         return {
             passed: false,
@@ -182,80 +286,73 @@ async function validateFrameKeyFormat(
 /**
  * Validate PNG integrity
  */
-async function validatePngIntegrity(
+function validatePngIntegrity(
     pngPath: string,
+    png: PngFacts,
     expectedSize?: { w: number; h: number }
-): Promise<CheckResult> {
-    if (!(await pathExists(pngPath))) {
+): CheckResult {
+    if (!png.exists) {
         return {
             passed: false,
             message: `Atlas PNG not found: ${pngPath}`,
         };
     }
 
-    try {
-        const metadata = await sharp(pngPath).metadata();
-
-        const issues: string[] = [];
+    const metadata = png.metadata;
+    if (!metadata) {
+        return {
+            passed: false,
+            message: `Error reading PNG: ${png.error}`,
+        };
+    }
 
-        if (metadata.format !== 'png') {
-            issues.push(`Expected PNG format, got: ${metadata.format}`);
-        }
+    const issues: string[] = [];
 
-        if (metadata.channels !== 4) {
-            issues.push(`Expected 4 channels (RGBA), got: ${metadata.channels}`);
-        }
+    if (metadata.format !== 'png') {
+        issues.push(`Expected PNG format, got: ${metadata.format}`);
+    }
 
-        if (expectedSize) {
-            if (metadata.width !== expectedSize.w || metadata.height !== expectedSize.h) {
-                issues.push(
-                    `Dimensions ${metadata.width}x${metadata.height} don't match ` +
-                    `meta.size ${expectedSize.w}x${expectedSize.h}`
-                );
-            }
-        }
+    if (metadata.channels !== 4) {
+        issues.push(`Expected 4 channels (RGBA), got: ${metadata.channels}`);
+    }
 
-        if (issues.length > 0) {
-            return {
-                passed: false,
-                message: issues.join('; '),
-                details: {
-                    width: metadata.width,
-                    height: metadata.height,
-                    format: metadata.format,
-                    channels: metadata.channels,
-                },
-            };
+    if (expectedSize) {
+        if (metadata.width !== expectedSize.w || metadata.height !== expectedSize.h) {
+            issues.push(
+                `Dimensions ${metadata.width}x${metadata.height} don't match ` +
+                `meta.size ${expectedSize.w}x${expectedSize.h}`
+            );
         }
+    }
 
+    if (issues.length > 0) {
         return {
-            passed: true,
-            message: 'PNG is valid',
+            passed: false,
+            message: issues.join('; '),
             details: {
-                dimensions: { w: metadata.width, h: metadata.height },
+                width: metadata.width,
+                height: metadata.height,
                 format: metadata.format,
                 channels: metadata.channels,
             },
         };
-    } catch (error) {
-        return {
-            passed: false,
-            message: `Error reading PNG: ${error}`,
-        };
     }
+
+    return {
+        passed: true,
+        message: 'PNG is valid',
+        details: {
+            dimensions: { w: metadata.width, h: metadata.height },
+            format: metadata.format,
+            channels: metadata.channels,
+        },
+    };
 }
 
 /**
  * Validate PNG integrity for all multipack sheets
  */
-async function validatePngIntegrityMulti(
-    sheets: Array<{
-        index: number;
-        image: string;
-        pngPath: string;
-        expectedSize?: { w: number; h: number };
-    }>
-): Promise<CheckResult> {
+function validatePngIntegrityMulti(sheets: AtlasFacts['sheets']): CheckResult {
     if (sheets.length === 0) {
         return {
             passed: false,
@@ -266,7 +363,7 @@ async function validatePngIntegrityMulti(
     const results: Array<{ index: number; image: string; result: CheckResult }> = [];
 
     for (const sheet of sheets) {
-        if (!sheet.pngPath) {
+        if (!sheet.pngPath || !sheet.facts) {
             results.push({
                 index: sheet.index,
                 image: sheet.image || `texture_${sheet.index}`,
@@ -278,7 +375,7 @@ async function validatePngIntegrityMulti(
             continue;
         }
 
-        const result = await validatePngIntegrity(sheet.pngPath, sheet.expectedSize);
+        const result = validatePngIntegrity(sheet.pngPath, sheet.facts, sheet.expectedSize);
         results.push({
             index: sheet.index,
             image: sheet.image || path.basename(sheet.pngPath),
@@ -316,132 +413,135 @@ async function validatePngIntegrityMulti(
 /**
  * Validate frame bounds are within PNG dimensions
  */
-async function validateFrameBounds(
-    jsonPath: string,
-    pngPath: string
-): Promise<CheckResult> {
-    try {
-        const content = await fs.readFile(jsonPath, 'utf-8');
-        const json = JSON.parse(content);
-        const metadata = await sharp(pngPath).metadata();
+function validateFrameBounds(facts: AtlasFacts): CheckResult {
+    if (!facts.jsonExists || facts.jsonError !== undefined) {
+        return {
+            passed: false,
+            message: `Error validating bounds: ${facts.jsonError ?? `Atlas JSON not found: ${facts.jsonPath}`}`,
+        };
+    }
+    if (!facts.png.exists || facts.png.error !== undefined) {
+        return {
+            passed: false,
+            message: `Error validating bounds: ${facts.png.error ?? 'Atlas PNG not found'}`,
+        };
+    }
 
-        if (!metadata.width || !metadata.height) {
-            return {
-                passed: false,
-                message: 'Could not determine PNG dimensions',
-            };
+    const json = facts.json;
+    const metadata = facts.png.metadata;
+
+    if (!metadata?.width || !metadata.height) {
+        return {
+            passed: false,
+            message: 'Could not determine PNG dimensions',
+        };
+    }
+
+    const issues: string[] = [];
+    let framesChecked = 0;
+
+    // Handle both single and multipack formats
+    const processFrames = (frames: Record<string, any>) => {
+        for (const [key, data] of Object.entries(frames)) {
+            const frame = data?.frame;
+            if (!frame) continue;
+
+            framesChecked++;
+            const { x, y, w, h } = frame;
+
+            if (x + w > metadata.width!) {
+                issues.push(
+                    `${key}: x(${x}) + w(${w}) = ${x + w} > PNG width ${metadata.width}`
+                );
+            }
+            if (y + h > metadata.height!) {
+                issues.push(
+                    `${key}: y(${y}) + h(${h}) = ${y + h} > PNG height ${metadata.height}`
+                );
+            }
         }
+    };
 
-        const issues: string[] = [];
-        let framesChecked = 0;
+    if (json?.frames) {
+        processFrames(json.frames);
+    } else if (json?.textures && Array.isArray(json.textures)) {
+        // Multipack: validate each texture against its own declared size
+        for (let i = 0; i < json.textures.length; i++) {
+            const texture = json.textures[i];
+            const size = texture?.size as { w: number; h: number } | undefined;
+
+            if (!size || typeof size.w !== 'number' || typeof size.h !== 'number') {
+                issues.push(`Texture ${i}: Missing or invalid size`);
+                continue;
+            }
 
-        // Handle both single and multipack formats
-        const processFrames = (frames: Record<string, any>) => {
-            for (const [key, data] of Object.entries(frames)) {
-                const frame = data.frame;
+            if (!texture.frames || typeof texture.frames !== 'object') {
+                continue;
+            }
+
+            for (const [key, data] of Object.entries(texture.frames)) {
+                const frame = (data as { frame?: { x: number; y: number; w: number; h: number } }).frame;
                 if (!frame) continue;
 
                 framesChecked++;
                 const { x, y, w, h } = frame;
 
-                if (x + w > metadata.width!) {
+                if (x + w > size.w) {
                     issues.push(
-                        `${key}: x(${x}) + w(${w}) = ${x + w} > PNG width ${metadata.width}`
+                        `Texture ${i}, ${key}: x(${x}) + w(${w}) = ${x + w} > width ${size.w}`
                     );
                 }
-                if (y + h > metadata.height!) {
+                if (y + h > size.h) {
                     issues.push(
-                        `${key}: y(${y}) + h(${h}) = ${y + h} > PNG height ${metadata.height}`
+                        `Texture ${i}, ${key}: y(${y}) + h(${h}) = ${y + h} > height ${size.h}`
                     );
                 }
             }
-        };
-
-        if (json.frames) {
-            processFrames(json.frames);
-        } else if (json.textures && Array.isArray(json.textures)) {
-            // Multipack: validate each texture against its own declared size
-            const issues: string[] = [];
-
-            for (let i = 0; i < json.textures.length; i++) {
-                const texture = json.textures[i];
-                const size = texture.size as { w: number; h: number } | undefined;
-
-                if (!size || typeof size.w !== 'number' || typeof size.h !== 'number') {
-                    issues.push(`Texture ${i}: Missing or invalid size`);
-                    continue;
-                }
-
-                if (!texture.frames || typeof texture.frames !== 'object') {
-                    continue;
-                }
-
-                for (const [key, data] of Object.entries(texture.frames)) {
-                    const frame = (data as { frame?: { x: number; y: number; w: number; h: number } }).frame;
-                    if (!frame) continue;
-
-                    framesChecked++;
-                    const { x, y, w, h } = frame;
-
-                    if (x + w > size.w) {
-                        issues.push(
-                            `Texture ${i}, ${key}: x(${x}) + w(${w}) = ${x + w} > width ${size.w}`
-                        );
-                    }
-                    if (y + h > size.h) {
-                        issues.push(
-                            `Texture ${i}, ${key}: y(${y}) + h(${h}) = ${y + h} > height ${size.h}`
-                        );
-                    }
-                }
-            }
-
-            if (issues.length > 0) {
-                return {
-                    passed: false,
-                    message: `${issues.length} frame(s) extend beyond multipack bounds`,
-                    details: {
-                        issues: issues.slice(0, 10),
-                        framesChecked,
-                        format: 'multipack',
-                    },
-                };
-            }
-
-            return {
-                passed: true,
-                message: `All ${framesChecked} multipack frames within bounds`,
-                details: { framesChecked, format: 'multipack' },
-            };
         }
 
         if (issues.length > 0) {
             return {
                 passed: false,
-                message: `${issues.length} frames extend beyond atlas bounds`,
+                message: `${issues.length} frame(s) extend beyond multipack bounds`,
                 details: {
                     issues: issues.slice(0, 10),
                     framesChecked,
+                    format: 'multipack',
                 },
             };
         }
 
         return {
             passed: true,
-            message: `All ${framesChecked} frames within bounds`,
-            details: { framesChecked },
+            message: `All ${framesChecked} multipack frames within bounds`,
+            details: { framesChecked, format: 'multipack' },
         };
-    } catch (error) {
+    }
+
+    if (issues.length > 0) {
         return {
             passed: false,
-            message: `Error validating bounds: ${error}`,
+            message: `${issues.length} frames extend beyond atlas bounds`,
+            details: {
+                issues: issues.slice(0, 10),
+                framesChecked,
+            },
         };
     }
+
+    return {
+        passed: true,
+        message: `All ${framesChecked} frames within bounds`,
+        details: { framesChecked },
+    };
 }
 
 /**
  * Run full post-export validation
  *
+ * The atlas JSON is read once and each PNG sheet header once; all checks
+ * evaluate against those facts.
+ *
  * @param atlasPaths - Paths to JSON and PNG files
  * @param manifest - Run manifest
  * @param runId - Run identifier
@@ -462,50 +562,16 @@ export async function runPostExportValidation(
         png_path: atlasPaths.png,
     });
 
-    // Get expected size from JSON for PNG validation and detect multipack
-    let expectedSize: { w: number; h: number } | undefined;
-    let isMultipack = false;
-    let multipackSheets: Array<{
-        index: number;
-        image: string;
-        pngPath: string;
-        expectedSize?: { w: number; h: number };
-    }> = [];
-    try {
-        const content = await fs.readFile(atlasPaths.json, 'utf-8');
-        const json = JSON.parse(content);
-
-        if (json.textures && Array.isArray(json.textures)) {
-            isMultipack = true;
-            const baseDir = path.dirname(atlasPaths.json);
-            multipackSheets = json.textures.map((texture: Record<string, unknown>, index: number) => {
-                const image = typeof texture.image === 'string' ? texture.image : '';
-                const size = texture.size as { w: number; h: number } | undefined;
-                const expected = size && typeof size.w === 'number' && typeof size.h === 'number'
-                    ? { w: size.w, h: size.h }
-                    : undefined;
-                return {
-                    index,
-                    image,
-                    pngPath: image ? path.join(baseDir, image) : '',
-                    expectedSize: expected,
-                };
-            });
-        } else if (json.meta?.size) {
-            expectedSize = json.meta.size;
-        }
-    } catch {
-        // Will be caught by jsonStructure check
-    }
+    const facts = await collectAtlasFacts(atlasPaths);
 
     // Run all checks
-    const jsonStructure = await validateJsonStructure(atlasPaths.json);
-    const frameCount = await validateFrameCount(atlasPaths.json, frame_count, move);
-    const frameKeys = await validateFrameKeyFormat(atlasPaths.json, move);
-    const pngIntegrity = isMultipack
-        ? await validatePngIntegrityMulti(multipackSheets)
-        : await validatePngIntegrity(atlasPaths.png, expectedSize);
-    const boundsCheck = await validateFrameBounds(atlasPaths.json, atlasPaths.png);
+    const jsonStructure = validateJsonStructure(facts);
+    const frameCount = validateFrameCount(facts.frameKeys, frame_count, move);
+    const frameKeys = validateFrameKeyFormat(facts.frameKeys, move);
+    const pngIntegrity = facts.isMultipack
+        ? validatePngIntegrityMulti(facts.sheets)
+        : validatePngIntegrity(atlasPaths.png, facts.png, facts.expectedSize);
+    const boundsCheck = validateFrameBounds(facts);
 
     // Collect issues
     if (!jsonStructure.passed) issues.push(jsonStructure.message || 'JSON structure invalid');
@@ -515,10 +581,9 @@ export async function runPostExportValidation(
     if (!boundsCheck.passed) issues.push(boundsCheck.message || 'Bounds check failed');
 
     // Calculate valid frames
-    const frameKeysList = await getMultipackFrameKeys(atlasPaths.json);
-    const totalFrames = frameKeysList.length;
+    const totalFrames = facts.frameKeys.length;
     const validFrames = frameKeys.passed ? totalFrames :
-        frameKeysList.filter(k => new RegExp(`^${move}/\\d{4}$`).test(k)).length;
+        facts.frameKeys.filter(k => new RegExp(`^${move}/\\d{4}$`).test(k)).length;
 
     const passed = jsonStructure.passed &&
                    frameCount.passed &&
@@ -6,34 +6,18 @@
  * Implements 12-item validation checklist.
  */
 
-import { promises as fs } from 'fs';
 import path from 'path';
-import crypto from 'crypto';
-import sharp from 'sharp';
 import { Result, SystemError } from '../result.js';
 import { logger } from '../../utils/logger.js';
 import { writeJsonAtomic, pathExists } from '../../utils/fs-helpers.js';
 import type { Manifest } from '../../domain/schemas/manifest.js';
+import {
+    collectFrameFactSheet,
+    type FrameFactSheet,
+    type FrameInfo,
+} from './frame-fact-sheet.js';
 
-/**
- * Frame information collected during validation
- */
-export interface FrameInfo {
-    index: number;
-    path: string;
-    filename: string;
-    metadata?: sharp.Metadata;
-    hash?: string;
-    fileSize?: number;
-    opaqueBounds?: {
-        left: number;
-        top: number;
-        right: number;
-        bottom: number;
-        width: number;
-        height: number;
-    };
-}
+export type { FrameInfo } from './frame-fact-sheet.js';
 
 /**
  * Result of a single check
@@ -52,7 +36,7 @@ export interface PreExportCheck {
     id: string;
     name: string;
     severity: 'critical' | 'warning';
-    check: (frames: FrameInfo[], manifest: Manifest) => Promise<CheckResult>;
+    check: (frames: FrameInfo[], manifest: Manifest, sheet: FrameFactSheet) => Promise<CheckResult>;
 }
 
 /**
@@ -80,6 +64,15 @@ export interface ValidationReport {
     }>;
     blocking: boolean;
     blockingReason?: string;
+    factSheet?: FrameFactSheet;     // Frame facts the checks ran against (not persisted)
+}
+
+/**
+ * Pre-export validation options
+ */
+export interface PreExportValidationOptions {
+    factSheet?: FrameFactSheet;     // Reuse facts already collected for this folder
+    concurrency?: number;           // Parallel frame reads when collecting facts
 }
 
 /** Common system files to ignore */
@@ -91,76 +84,6 @@ const IGNORED_FILES = new Set([
     '.gitignore',
 ]);
 
-/**
- * Calculate SHA256 hash of a file
- */
-async function calculateFileHash(filePath: string): Promise<string> {
-    const content = await fs.readFile(filePath);
-    return crypto.createHash('sha256').update(content).digest('hex');
-}
-
-/**
- * Extract frame index from filename
- * Expected format: frame_XXXX.png
- */
-function extractFrameIndex(filename: string): number | null {
-    const match = filename.match(/frame_(\d{4})\.png$/i);
-    if (match) {
-        return parseInt(match[1], 10);
-    }
-    return null;
-}
-
-/**
- * Calculate opaque bounding box of an image
- */
-async function calculateOpaqueBounds(
-    imagePath: string
-): Promise<{ left: number; top: number; right: number; bottom: number; width: number; height: number } | null> {
-    try {
-        const image = sharp(imagePath);
-        const { data, info } = await image
-            .ensureAlpha()
-            .raw()
-            .toBuffer({ resolveWithObject: true });
-
-        let minX = info.width;
-        let minY = info.height;
-        let maxX = 0;
-        let maxY = 0;
-        let hasOpaque = false;
-
-        for (let y = 0; y < info.height; y++) {
-            for (let x = 0; x < info.width; x++) {
-                const idx = (y * info.width + x) * 4;
-                const alpha = data[idx + 3];
-                if (alpha > 0) {
-                    hasOpaque = true;
-                    minX = Math.min(minX, x);
-                    minY = Math.min(minY, y);
-                    maxX = Math.max(maxX, x);
-                    maxY = Math.max(maxY, y);
-                }
-            }
-        }
-
-        if (!hasOpaque) {
-            return null;
-        }
-
-        return {
-            left: minX,
-            top: minY,
-            right: maxX,
-            bottom: maxY,
-            width: maxX - minX + 1,
-            height: maxY - minY + 1,
-        };
-    } catch {
-        return null;
-    }
-}
-
 // ============================================
 // Individual Check Implementations
 // ============================================
@@ -383,39 +306,26 @@ async function checkColorDepth(frames: FrameInfo[], _manifest: Manifest): Promis
 /**
  * Check 9: No stray files
  */
-async function checkStrayFiles(
-    frames: FrameInfo[],
-    _manifest: Manifest,
-    approvedPath?: string
-): Promise<CheckResult> {
-    if (!approvedPath) {
-        return { passed: true, message: 'Stray file check skipped (no path provided)' };
-    }
-
-    try {
-        const allFiles = await fs.readdir(approvedPath);
-        const expectedFiles = new Set(frames.map(f => f.filename.toLowerCase()));
-        const strayFiles: string[] = [];
-
-        for (const file of allFiles) {
-            const lower = file.toLowerCase();
-            if (!expectedFiles.has(lower) && !IGNORED_FILES.has(lower)) {
-                strayFiles.push(file);
-            }
-        }
-
-        if (strayFiles.length === 0) {
-            return { passed: true, message: 'No stray files found' };
+async function checkStrayFiles(frames: FrameInfo[], entries: string[]): Promise<CheckResult> {
+    const expectedFiles = new Set(frames.map(f => f.filename.toLowerCase()));
+    const strayFiles: string[] = [];
+
+    for (const file of entries) {
+        const lower = file.toLowerCase();
+        if (!expectedFiles.has(lower) && !IGNORED_FILES.has(lower)) {
+            strayFiles.push(file);
         }
+    }
 
-        return {
-            passed: false,
-            message: `${strayFiles.length} stray file(s) found`,
-            details: { strayFiles },
-        };
-    } catch {
-        return { passed: true, message: 'Stray file check skipped (read error)' };
+    if (strayFiles.length === 0) {
+        return { passed: true, message: 'No stray files found' };
     }
+
+    return {
+        passed: false,
+        message: `${strayFiles.length} stray file(s) found`,
+        details: { strayFiles },
+    };
 }
 
 /**
@@ -534,7 +444,7 @@ const PRE_EXPORT_CHECKS: PreExportCheck[] = [
     { id: 'duplicates', name: 'Duplicate Detection', severity: 'warning', check: checkDuplicates },
     { id: 'file_size', name: 'File Size Bounds', severity: 'warning', check: checkFileSizeBounds },
     { id: 'color_depth', name: 'Color Depth (32-bit)', severity: 'critical', check: checkColorDepth },
-    { id: 'stray_files', name: 'Stray Files', severity: 'warning', check: async () => ({ passed: true, message: 'Stray file check (handled separately)' }) },
+    { id: 'stray_files', name: 'Stray Files', severity: 'warning', check: (frames, _manifest, sheet) => checkStrayFiles(frames, sheet.entries) },
     { id: 'sequence', name: 'Sequence Contiguity', severity: 'critical', check: checkSequenceContiguity },
     { id: 'total_size', name: 'Total Size', severity: 'warning', check: checkTotalSize },
     { id: 'bounding_box', name: 'Bounding Box Consistency', severity: 'warning', check: checkBoundingBoxConsistency },
@@ -544,78 +454,24 @@ const PRE_EXPORT_CHECKS: PreExportCheck[] = [
 // Main Validator
 // ============================================
 
-/**
- * Collect information about all frames in the approved folder
- */
-async function collectFrameInfo(approvedPath: string): Promise<FrameInfo[]> {
-    const files = await fs.readdir(approvedPath);
-    const pngFiles = files.filter(f => f.toLowerCase().endsWith('.png')).sort();
-
-    const frames: FrameInfo[] = [];
-
-    for (const filename of pngFiles) {
-        const filePath = path.join(approvedPath, filename);
-        const index = extractFrameIndex(filename) ?? frames.length;
-
-        let metadata: sharp.Metadata | undefined;
-        let hash: string | undefined;
-        let fileSize: number | undefined;
-        let opaqueBounds: FrameInfo['opaqueBounds'] | undefined;
-
-        try {
-            metadata = await sharp(filePath).metadata();
-        } catch {
-            // Corrupted image
-        }
-
-        try {
-            hash = await calculateFileHash(filePath);
-        } catch {
-            // Hash calculation failed
-        }
-
-        try {
-            const stats = await fs.stat(filePath);
-            fileSize = stats.size;
-        } catch {
-            // Stat failed
-        }
-
-        try {
-            const bounds = await calculateOpaqueBounds(filePath);
-            if (bounds) {
-                opaqueBounds = bounds;
-            }
-        } catch {
-            // Bounds calculation failed
-        }
-
-        frames.push({
-            index,
-            path: filePath,
-            filename,
-            metadata,
-            hash,
-            fileSize,
-            opaqueBounds,
-        });
-    }
-
-    return frames;
-}
-
 /**
  * Run all pre-export validation checks
  *
+ * Facts for every frame are gathered once (bounded parallel reads, see
+ * frame-fact-sheet.ts) and all checks evaluate against them concurrently.
+ * The sheet is returned on the report so export stages can reuse it.
+ *
  * @param approvedPath - Path to approved frames folder
  * @param manifest - Run manifest
  * @param runId - Run identifier
+ * @param options - Fact sheet reuse and read concurrency
  * @returns Validation report
  */
 export async function runPreExportValidation(
     approvedPath: string,
     manifest: Manifest,
-    runId: string
+    runId: string,
+    options: PreExportValidationOptions = {}
 ): Promise<Result<ValidationReport, SystemError>> {
     logger.info({
         event: 'pre_export_validation_start',
@@ -632,24 +488,42 @@ export async function runPreExportValidation(
         });
     }
 
-    // Collect frame info
-    const frames = await collectFrameInfo(approvedPath);
+    // Collect frame facts (single read per frame)
+    let sheet: FrameFactSheet;
+    if (options.factSheet && path.resolve(options.factSheet.approvedPath) === path.resolve(approvedPath)) {
+        sheet = options.factSheet;
+    } else {
+        try {
+            sheet = await collectFrameFactSheet(approvedPath, { concurrency: options.concurrency });
+        } catch (error) {
+            return Result.err({
+                code: 'SYS_READ_FAILED',
+                message: `Failed to read approved frames: ${approvedPath}`,
+                context: { approvedPath, error: String(error) },
+            });
+        }
+    }
+    const { frames } = sheet;
+
+    // Run all checks against the sheet; results keep registry order
+    const outcomes = await Promise.all(PRE_EXPORT_CHECKS.map(async (check): Promise<{
+        check: PreExportCheck;
+        result?: CheckResult;
+        error?: unknown;
+    }> => {
+        try {
+            return { check, result: await check.check(frames, manifest, sheet) };
+        } catch (error) {
+            return { check, error };
+        }
+    }));
 
-    // Run all checks
     const checkResults: ValidationReport['checks'] = [];
     let criticalFailed = false;
     let blockingReason: string | undefined;
 
-    for (const check of PRE_EXPORT_CHECKS) {
-        try {
-            // Special handling for stray files check which needs the path
-            let result: CheckResult;
-            if (check.id === 'stray_files') {
-                result = await checkStrayFiles(frames, manifest, approvedPath);
-            } else {
-                result = await check.check(frames, manifest);
-            }
-
+    for (const { check, result, error } of outcomes) {
+        if (result) {
             checkResults.push({
                 id: check.id,
                 name: check.name,
@@ -666,7 +540,7 @@ export async function runPreExportValidation(
                     blockingReason = `Critical check '${check.name}' failed: ${result.message}`;
                 }
             }
-        } catch (error) {
+        } else {
             checkResults.push({
                 id: check.id,
                 name: check.name,
@@ -703,6 +577,7 @@ export async function runPreExportValidation(
         checks: checkResults,
         blocking: criticalFailed,
         blockingReason,
+        factSheet: sheet,
     };
 
     logger.info({
@@ -713,6 +588,8 @@ export async function runPreExportValidation(
         passed_checks: report.summary.passed,
         failed_checks: report.summary.failed,
         warnings: report.summary.warnings,
+        frames: frames.length,
+        fact_sheet_ms: sheet.durationMs,
     });
 
     return Result.ok(report);
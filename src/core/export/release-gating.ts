@@ -9,6 +9,8 @@
 import { promises as fs } from 'fs';
 import path from 'path';
 import { Result, SystemError } from '../result.js';
+import { cloneFile } from '../blob-store.js';
+import { DEFAULT_IO_CONCURRENCY, mapWithConcurrency } from '../../utils/concurrency.js';
 
 // =============================================================================
 // Types
@@ -379,13 +381,12 @@ export async function promoteToRelease(
         });
     }
 
-    // Copy files
+    // Copy files (reflink where supported; release output is never hardlinked
+    // into the blob store, so edits there can't reach run artifacts)
     try {
-        for (const file of files) {
-            const src = path.join(exportDir, file);
-            const dest = path.join(outputPath, file);
-            await fs.copyFile(src, dest);
-        }
+        await mapWithConcurrency(files, DEFAULT_IO_CONCURRENCY, file =>
+            cloneFile(path.join(exportDir, file), path.join(outputPath, file))
+        );
     } catch {
         return Result.err({
             code: 'SYS_WRITE_FAILED',
@@ -3,9 +3,9 @@
  * Per Story 3.6: Identify edge artifacts from poor transparency handling
  */
 
-import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 
 /**
  * Alpha artifact detection result
@@ -56,87 +56,20 @@ export async function detectAlphaArtifacts(
     const startTime = Date.now();
 
     try {
-        const { data, info } = await sharp(imagePath)
-            .ensureAlpha()
-            .raw()
-            .toBuffer({ resolveWithObject: true });
-
-        const { width, height, channels } = info;
-
-        let haloPixels = 0;
-        let fringePixels = 0;
-        let edgePixels = 0;
-        const artifactLocations: AlphaArtifactResult['artifact_locations'] = [];
-
-        // Scan for edge pixels (opaque adjacent to transparent)
-        for (let y = 1; y < height - 1; y++) {
-            for (let x = 1; x < width - 1; x++) {
-                const idx = (y * width + x) * channels;
-                const alpha = data[idx + 3];
-
-                // Skip fully transparent or fully opaque interiors
-                if (alpha === 0) continue;
-
-                // Check if this is an edge pixel
-                const isEdge = isEdgePixel(data, x, y, width, height, channels);
-                if (!isEdge) continue;
-
-                edgePixels++;
-
-                // Check for halo (semi-transparent edge)
-                if (alpha > HALO_ALPHA_MIN && alpha < HALO_ALPHA_MAX) {
-                    haloPixels++;
-                    if (artifactLocations.length < 100) {
-                        artifactLocations.push({ x, y, type: 'halo' });
-                    }
-                }
-
-                // Check for fringe (bright edge pixel)
-                const brightness = (data[idx] + data[idx + 1] + data[idx + 2]) / 3;
-                if (brightness > FRINGE_BRIGHTNESS_THRESHOLD && alpha > 200) {
-                    fringePixels++;
-                    if (artifactLocations.length < 100) {
-                        artifactLocations.push({ x, y, type: 'fringe' });
-                    }
-                }
-            }
-        }
-
-        // Calculate severity score
-        const totalArtifacts = haloPixels + fringePixels;
-        const severityScore = edgePixels > 0
-            ? Math.min(1.0, totalArtifacts / edgePixels)
-            : 0;
-
-        const haloDetected = haloPixels > 5;
-        const fringeDetected = fringePixels > 5;
-        const passed = severityScore <= threshold;
-        const computationTimeMs = Date.now() - startTime;
+        const image = await loadRawImage(imagePath);
+        const result = scoreAlphaArtifacts(image, threshold, startTime);
 
         logger.debug({
             imagePath,
-            severityScore,
-            haloPixels,
-            fringePixels,
-            edgePixels,
-            passed,
-            computationTimeMs,
+            severityScore: result.severity_score,
+            haloPixels: result.artifact_counts.halo_pixels,
+            fringePixels: result.artifact_counts.fringe_pixels,
+            edgePixels: result.artifact_counts.edge_pixels,
+            passed: result.passed,
+            computationTimeMs: result.computation_time_ms,
         }, 'Alpha artifact detection complete');
 
-        return Result.ok({
-            severity_score: severityScore,
-            halo_detected: haloDetected,
-            fringe_detected: fringeDetected,
-            artifact_counts: {
-                halo_pixels: haloPixels,
-                fringe_pixels: fringePixels,
-                edge_pixels: edgePixels,
-            },
-            artifact_locations: artifactLocations,
-            passed,
-            threshold,
-            computation_time_ms: computationTimeMs,
-        });
+        return Result.ok(result);
     } catch (error) {
         return Result.err({
             code: 'ALPHA_ARTIFACT_DETECTION_FAILED',
@@ -146,11 +79,84 @@ export async function detectAlphaArtifacts(
     }
 }
 
+/**
+ * Detect alpha artifacts in already-decoded pixels
+ * Pure pixel work, safe to run inside an audit worker thread
+ */
+export function scoreAlphaArtifacts(
+    image: RawImage,
+    threshold: number = DEFAULT_ARTIFACT_THRESHOLD,
+    startTime: number = Date.now()
+): AlphaArtifactResult {
+    const { data, width, height } = image;
+    const channels = 4;
+
+    let haloPixels = 0;
+    let fringePixels = 0;
+    let edgePixels = 0;
+    const artifactLocations: AlphaArtifactResult['artifact_locations'] = [];
+
+    // Scan for edge pixels (opaque adjacent to transparent)
+    for (let y = 1; y < height - 1; y++) {
+        for (let x = 1; x < width - 1; x++) {
+            const idx = (y * width + x) * channels;
+            const alpha = data[idx + 3];
+
+            // Skip fully transparent or fully opaque interiors
+            if (alpha === 0) continue;
+
+            // Check if this is an edge pixel
+            const isEdge = isEdgePixel(data, x, y, width, height, channels);
+            if (!isEdge) continue;
+
+            edgePixels++;
+
+            // Check for halo (semi-transparent edge)
+            if (alpha > HALO_ALPHA_MIN && alpha < HALO_ALPHA_MAX) {
+                haloPixels++;
+                if (artifactLocations.length < 100) {
+                    artifactLocations.push({ x, y, type: 'halo' });
+                }
+            }
+
+            // Check for fringe (bright edge pixel)
+            const brightness = (data[idx] + data[idx + 1] + data[idx + 2]) / 3;
+            if (brightness > FRINGE_BRIGHTNESS_THRESHOLD && alpha > 200) {
+                fringePixels++;
+                if (artifactLocations.length < 100) {
+                    artifactLocations.push({ x, y, type: 'fringe' });
+                }
+            }
+        }
+    }
+
+    // Calculate severity score
+    const totalArtifacts = haloPixels + fringePixels;
+    const severityScore = edgePixels > 0
+        ? Math.min(1.0, totalArtifacts / edgePixels)
+        : 0;
+
+    return {
+        severity_score: severityScore,
+        halo_detected: haloPixels > 5,
+        fringe_detected: fringePixels > 5,
+        artifact_counts: {
+            halo_pixels: haloPixels,
+            fringe_pixels: fringePixels,
+            edge_pixels: edgePixels,
+        },
+        artifact_locations: artifactLocations,
+        passed: severityScore <= threshold,
+        threshold,
+        computation_time_ms: Date.now() - startTime,
+    };
+}
+
 /**
  * Check if a pixel is at the edge (adjacent to transparent)
  */
 function isEdgePixel(
-    data: Buffer,
+    data: Uint8Array,
     x: number,
     y: number,
     width: number,
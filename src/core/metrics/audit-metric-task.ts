@@ -0,0 +1,117 @@
+/**
+ * Audit metric tasks - unit of work for the audit worker pool
+ * Dispatches a single metric over decoded pixels; runs identically in-process
+ * and inside a worker thread.
+ */
+
+import { Result } from '../config-resolver.js';
+import type { RawImage } from './raw-image.js';
+import { scoreSSIM, type SSIMResult, type SSIMError } from './ssim-calculator.js';
+import { scoreMAPD, type MAPDResult, type MAPDError } from './mapd-calculator.js';
+import {
+    scorePaletteFidelity,
+    type PaletteFidelityResult,
+    type PaletteFidelityError,
+} from './palette-fidelity.js';
+import {
+    scoreAlphaArtifacts,
+    type AlphaArtifactResult,
+    type AlphaArtifactError,
+} from './alpha-artifact-detector.js';
+import {
+    scoreOrphanPixels,
+    type OrphanPixelResult,
+    type OrphanPixelError,
+} from './orphan-pixel-detector.js';
+import {
+    scoreBaselineDrift,
+    type BaselineDriftResult,
+    type BaselineDriftError,
+} from './baseline-drift-detector.js';
+
+/**
+ * A single metric computation over decoded frames
+ */
+export type AuditMetricTask =
+    | { metric: 'ssim'; candidate: RawImage; anchor: RawImage; threshold?: number }
+    | { metric: 'palette'; candidate: RawImage; palette: string[]; threshold?: number; tolerance?: number }
+    | { metric: 'alpha'; candidate: RawImage; threshold?: number }
+    | { metric: 'orphan'; candidate: RawImage }
+    | { metric: 'mapd'; previous: RawImage; candidate: RawImage; moveType: string }
+    | { metric: 'baseline'; candidate: RawImage; anchorBaselineY: number; threshold?: number };
+
+/**
+ * Result type produced by each metric
+ */
+export interface AuditMetricOutcomes {
+    ssim: Result<SSIMResult, SSIMError>;
+    palette: Result<PaletteFidelityResult, PaletteFidelityError>;
+    alpha: Result<AlphaArtifactResult, AlphaArtifactError>;
+    orphan: Result<OrphanPixelResult, OrphanPixelError>;
+    mapd: Result<MAPDResult, MAPDError>;
+    baseline: Result<BaselineDriftResult, BaselineDriftError>;
+}
+
+export type AuditMetricName = keyof AuditMetricOutcomes;
+
+export type AuditMetricOutcome = AuditMetricOutcomes[AuditMetricName];
+
+/**
+ * Message exchanged with audit worker threads
+ */
+export interface AuditWorkerRequest {
+    id: number;
+    task: AuditMetricTask;
+}
+
+export interface AuditWorkerResponse {
+    id: number;
+    outcome: AuditMetricOutcome;
+}
+
+// Failure codes, matching the path-based calculators
+const FAILURE_CODES: Record<AuditMetricName, string> = {
+    ssim: 'SSIM_CALCULATION_FAILED',
+    palette: 'PALETTE_FIDELITY_FAILED',
+    alpha: 'ALPHA_ARTIFACT_DETECTION_FAILED',
+    orphan: 'ORPHAN_DETECTION_FAILED',
+    mapd: 'MAPD_CALCULATION_FAILED',
+    baseline: 'BASELINE_DRIFT_FAILED',
+};
+
+/**
+ * Run one metric task against decoded pixels
+ */
+export function runMetricTask(task: AuditMetricTask): AuditMetricOutcome {
+    const startTime = Date.now();
+
+    try {
+        switch (task.metric) {
+            case 'ssim':
+                return scoreSSIM(task.candidate, task.anchor, task.threshold, startTime);
+            case 'palette':
+                return scorePaletteFidelity(task.candidate, task.palette, task.threshold, task.tolerance, startTime);
+            case 'alpha':
+                return Result.ok(scoreAlphaArtifacts(task.candidate, task.threshold, startTime));
+            case 'orphan':
+                return Result.ok(scoreOrphanPixels(task.candidate, startTime));
+            case 'mapd':
+                return scoreMAPD(task.previous, task.candidate, task.moveType, startTime);
+            case 'baseline':
+                return scoreBaselineDrift(task.candidate, task.anchorBaselineY, task.threshold, startTime);
+        }
+    } catch (error) {
+        return createTaskFailure(task.metric, error);
+    }
+}
+
+/**
+ * Build the error result for a task that could not complete
+ */
+export function createTaskFailure(metric: AuditMetricName, cause: unknown): AuditMetricOutcome {
+    return Result.err({
+        code: FAILURE_CODES[metric],
+        message: `Failed to compute ${metric} metric`,
+        cause,
+    });
+}
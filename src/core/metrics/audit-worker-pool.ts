@@ -0,0 +1,365 @@
+/**
+ * Audit Worker Pool - runs pixel-level metrics on worker threads
+ * Keeps SSIM/MAPD/palette/detector loops off the event loop so the director
+ * server, progress reporting, and in-flight API calls stay responsive.
+ */
+
+import { Worker } from 'worker_threads';
+import { availableParallelism } from 'os';
+import { logger } from '../../utils/logger.js';
+import type { AuditorThresholds } from '../../domain/defaults/auditor-defaults.js';
+import { toSharedRawImage, type RawImage } from './raw-image.js';
+import {
+    runMetricTask,
+    type AuditMetricTask,
+    type AuditMetricOutcome,
+    type AuditMetricOutcomes,
+    type AuditWorkerRequest,
+    type AuditWorkerResponse,
+} from './audit-metric-task.js';
+
+/**
+ * Pool configuration
+ */
+export interface AuditWorkerPoolOptions {
+    size?: number;                  // Worker threads (default: cores - 1, min 1)
+    inProcessMaxPixels?: number;    // Frames at or below this size skip the pool
+}
+
+/**
+ * Decoded inputs for auditing a single candidate frame
+ * Optional inputs enable the metrics that need them.
+ */
+export interface AuditFrameRequest {
+    candidate: RawImage;
+    anchor?: RawImage;              // Enables SSIM
+    previous?: RawImage;            // Enables MAPD (with moveType)
+    moveType?: string;
+    palette?: string[];             // Enables palette fidelity
+    paletteTolerance?: number;
+    anchorBaselineY?: number;       // Enables baseline drift
+    thresholds?: Partial<AuditorThresholds>;
+}
+
+/**
+ * Metric results for one frame, same types as the path-based calculators
+ */
+export interface AuditMetricSet {
+    ssim?: AuditMetricOutcomes['ssim'];
+    palette?: AuditMetricOutcomes['palette'];
+    alpha: AuditMetricOutcomes['alpha'];
+    orphan: AuditMetricOutcomes['orphan'];
+    mapd?: AuditMetricOutcomes['mapd'];
+    baseline?: AuditMetricOutcomes['baseline'];
+    execution: 'worker' | 'in_process';     // 'worker' only if every metric completed on a worker thread
+    computation_time_ms: number;
+}
+
+/**
+ * Queued task awaiting a free worker
+ */
+interface QueuedTask {
+    id: number;
+    task: AuditMetricTask;
+    resolve: (outcome: AuditMetricOutcome, inWorker: boolean) => void;
+}
+
+/**
+ * Metric outcome and where it was computed
+ */
+interface TaskCompletion<T> {
+    outcome: T;
+    inWorker: boolean;
+}
+
+/**
+ * Worker slot in the pool
+ */
+interface PoolWorker {
+    worker: Worker;
+    current: QueuedTask | null;
+    completed: number;
+    dead: boolean;
+}
+
+// Below this many pixels the worker round-trip costs more than the loops
+const DEFAULT_IN_PROCESS_MAX_PIXELS = 128 * 128;
+
+/**
+ * Resolve the worker entry point next to this module.
+ * Source checkouts (tsx/vitest) load the .ts entry through the tsx loader.
+ */
+function resolveWorkerScript(): { url: URL; execArgv: string[] } {
+    const isSource = import.meta.url.endsWith('.ts');
+    return {
+        url: new URL(isSource ? './audit-worker.ts' : './audit-worker.js', import.meta.url),
+        execArgv: isSource ? ['--import', 'tsx'] : [],
+    };
+}
+
+/**
+ * Worker pool for pixel-level audit metrics
+ */
+export class AuditWorkerPool {
+    private readonly size: number;
+    private readonly inProcessMaxPixels: number;
+    private readonly workers: PoolWorker[] = [];
+    private readonly queue: QueuedTask[] = [];
+    private nextTaskId = 1;
+    private completedInWorker = 0;
+    private workersUnavailable = false;
+    private closed = false;
+
+    constructor(options: AuditWorkerPoolOptions = {}) {
+        this.size = Math.max(1, options.size ?? availableParallelism() - 1);
+        this.inProcessMaxPixels = options.inProcessMaxPixels ?? DEFAULT_IN_PROCESS_MAX_PIXELS;
+    }
+
+    /**
+     * Run the full metric set for one candidate frame.
+     * Metrics are dispatched concurrently; tiny frames run in-process.
+     */
+    async auditFrame(request: AuditFrameRequest): Promise<AuditMetricSet> {
+        const startTime = Date.now();
+        const useWorkers = this.shouldUseWorkers(request.candidate);
+
+        // Share pixel memory with workers once instead of copying per task
+        const share = (image: RawImage): RawImage => useWorkers ? toSharedRawImage(image) : image;
+        const candidate = share(request.candidate);
+        const thresholds = request.thresholds ?? {};
+
+        // Tasks can still fall back in-process (worker crash, close), so
+        // execution is decided by where they actually completed
+        let allInWorker = useWorkers;
+        const run = async <T extends AuditMetricTask>(task: T): Promise<AuditMetricOutcomes[T['metric']]> => {
+            if (!useWorkers) {
+                return runMetricTask(task) as AuditMetricOutcomes[T['metric']];
+            }
+            const { outcome, inWorker } = await this.dispatch(task);
+            allInWorker &&= inWorker;
+            return outcome;
+        };
+
+        const [alpha, orphan, ssim, palette, mapd, baseline] = await Promise.all([
+            run({ metric: 'alpha', candidate, threshold: thresholds.alpha_artifact_max }),
+            run({ metric: 'orphan', candidate }),
+            request.anchor
+                ? run({ metric: 'ssim', candidate, anchor: share(request.anchor), threshold: thresholds.identity_min })
+                : undefined,
+            request.palette
+                ? run({
+                    metric: 'palette',
+                    candidate,
+                    palette: request.palette,
+                    threshold: thresholds.palette_min,
+                    tolerance: request.paletteTolerance,
+                })
+                : undefined,
+            request.previous && request.moveType
+                ? run({ metric: 'mapd', previous: share(request.previous), candidate, moveType: request.moveType })
+                : undefined,
+            request.anchorBaselineY !== undefined
+                ? run({
+                    metric: 'baseline',
+                    candidate,
+                    anchorBaselineY: request.anchorBaselineY,
+                    threshold: thresholds.baseline_drift_max,
+                })
+                : undefined,
+        ]);
+
+        const computationTimeMs = Date.now() - startTime;
+        const execution = allInWorker ? 'worker' : 'in_process';
+
+        logger.debug({
+            width: candidate.width,
+            height: candidate.height,
+            execution,
+            computationTimeMs,
+        }, 'Frame audit metrics complete');
+
+        return {
+            ssim,
+            palette,
+            alpha,
+            orphan,
+            mapd,
+            baseline,
+            execution,
+            computation_time_ms: computationTimeMs,
+        };
+    }
+
+    /**
+     * Run a single metric task on the pool
+     */
+    async runTask<T extends AuditMetricTask>(task: T): Promise<AuditMetricOutcomes[T['metric']]> {
+        return (await this.dispatch(task)).outcome;
+    }
+
+    /**
+     * Number of live worker threads
+     */
+    get threadCount(): number {
+        return this.workers.length;
+    }
+
+    /**
+     * Tasks whose result came back from a worker thread (not an in-process fallback)
+     */
+    get tasksCompletedInWorker(): number {
+        return this.completedInWorker;
+    }
+
+    /**
+     * Terminate all workers. Later tasks run in-process.
+     */
+    async close(): Promise<void> {
+        this.closed = true;
+        const workers = this.workers.splice(0);
+        await Promise.all(workers.map(entry => {
+            entry.dead = true;
+            return entry.worker.terminate();
+        }));
+
+        // Anything that was in flight finishes in-process
+        for (const entry of workers) {
+            if (entry.current) {
+                entry.current.resolve(runMetricTask(entry.current.task), false);
+            }
+        }
+        this.drain();
+    }
+
+    /**
+     * Queue a task and report whether a worker computed it
+     */
+    private dispatch<T extends AuditMetricTask>(task: T): Promise<TaskCompletion<AuditMetricOutcomes[T['metric']]>> {
+        return new Promise(resolve => {
+            this.queue.push({
+                id: this.nextTaskId++,
+                task,
+                resolve: (outcome, inWorker) => resolve({
+                    outcome: outcome as AuditMetricOutcomes[T['metric']],
+                    inWorker,
+                }),
+            });
+            this.drain();
+        });
+    }
+
+    /**
+     * Decide whether a frame is large enough to benefit from worker threads
+     */
+    private shouldUseWorkers(image: RawImage): boolean {
+        return !this.closed &&
+            !this.workersUnavailable &&
+            image.width * image.height > this.inProcessMaxPixels;
+    }
+
+    /**
+     * Hand queued tasks to idle workers, spawning up to the pool size
+     */
+    private drain(): void {
+        while (this.queue.length > 0) {
+            if (this.closed || this.workersUnavailable) {
+                const queued = this.queue.shift()!;
+                queued.resolve(runMetricTask(queued.task), false);
+                continue;
+            }
+
+            let idle = this.workers.find(entry => entry.current === null);
+            if (!idle && this.workers.length < this.size) {
+                idle = this.spawnWorker() ?? undefined;
+            }
+            if (!idle) {
+                if (this.workersUnavailable) continue;
+                return;
+            }
+
+            const queued = this.queue.shift()!;
+            idle.current = queued;
+            idle.worker.ref();
+            const request: AuditWorkerRequest = { id: queued.id, task: queued.task };
+            idle.worker.postMessage(request);
+        }
+    }
+
+    /**
+     * Start a worker thread and wire up its lifecycle
+     */
+    private spawnWorker(): PoolWorker | null {
+        let worker: Worker;
+        try {
+            const { url, execArgv } = resolveWorkerScript();
+            worker = new Worker(url, { execArgv });
+        } catch (error) {
+            logger.warn({ error }, 'Audit worker failed to start, falling back to in-process metrics');
+            this.workersUnavailable = true;
+            return null;
+        }
+
+        const entry: PoolWorker = { worker, current: null, completed: 0, dead: false };
+
+        worker.on('message', (response: AuditWorkerResponse) => {
+            // A terminated worker's task was already finished in-process
+            if (entry.dead) return;
+            const queued = entry.current;
+            entry.current = null;
+            entry.completed++;
+            worker.unref();
+
+            if (queued && queued.id === response.id) {
+                this.completedInWorker++;
+                queued.resolve(response.outcome, true);
+            }
+            this.drain();
+        });
+        worker.on('error', error => this.handleWorkerFailure(entry, error));
+        worker.on('exit', code => {
+            if (!entry.dead) {
+                this.handleWorkerFailure(entry, new Error(`Audit worker exited with code ${code}`));
+            }
+        });
+
+        // Idle workers must not keep the CLI alive
+        worker.unref();
+        this.workers.push(entry);
+
+        logger.debug({ threads: this.workers.length, size: this.size }, 'Audit worker started');
+
+        return entry;
+    }
+
+    /**
+     * Drop a crashed worker and finish its task in-process
+     */
+    private handleWorkerFailure(entry: PoolWorker, error: unknown): void {
+        if (entry.dead) return;
+        entry.dead = true;
+
+        const index = this.workers.indexOf(entry);
+        if (index !== -1) {
+            this.workers.splice(index, 1);
+        }
+
+        // A worker that never completed a task means workers can't run here
+        if (entry.completed === 0) {
+            this.workersUnavailable = true;
+        }
+
+        logger.warn({
+            error,
+            workersUnavailable: this.workersUnavailable,
+        }, 'Audit worker failed, running task in-process');
+
+        if (entry.current) {
+            const queued = entry.current;
+            entry.current = null;
+            queued.resolve(runMetricTask(queued.task), false);
+        }
+
+        void entry.worker.terminate();
+        this.drain();
+    }
+}
@@ -0,0 +1,25 @@
+/**
+ * Audit worker entry point - runs metric tasks off the main thread
+ * Spawned by AuditWorkerPool; never imported directly.
+ */
+
+import { parentPort } from 'worker_threads';
+import {
+    runMetricTask,
+    type AuditWorkerRequest,
+    type AuditWorkerResponse,
+} from './audit-metric-task.js';
+
+if (!parentPort) {
+    throw new Error('audit-worker must be started as a worker thread');
+}
+
+const port = parentPort;
+
+port.on('message', (request: AuditWorkerRequest) => {
+    const response: AuditWorkerResponse = {
+        id: request.id,
+        outcome: runMetricTask(request.task),
+    };
+    port.postMessage(response);
+});
@@ -3,9 +3,9 @@
  * Per Story 3.7: Compare candidate baseline to anchor baseline
  */
 
-import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 import { type AnchorAnalysis } from '../anchor-analyzer.js';
 
 /**
@@ -56,42 +56,19 @@ export async function measureBaselineDrift(
             return Result.err(candidateBaseline.error);
         }
 
-        const candidateBaselineY = candidateBaseline.value;
-        const driftPixels = candidateBaselineY - anchorBaselineY;
-        const driftAbsolute = Math.abs(driftPixels);
-
-        let driftDirection: 'none' | 'floating' | 'sinking';
-        if (driftPixels === 0) {
-            driftDirection = 'none';
-        } else if (driftPixels > 0) {
-            driftDirection = 'sinking';
-        } else {
-            driftDirection = 'floating';
-        }
-
-        const passed = driftAbsolute <= threshold;
-        const computationTimeMs = Date.now() - startTime;
+        const result = buildDriftResult(anchorBaselineY, candidateBaseline.value, threshold, startTime);
 
         logger.debug({
             candidatePath,
             anchorBaselineY,
-            candidateBaselineY,
-            driftPixels,
-            driftDirection,
-            passed,
-            computationTimeMs,
+            candidateBaselineY: result.candidate_baseline_y,
+            driftPixels: result.drift_pixels,
+            driftDirection: result.drift_direction,
+            passed: result.passed,
+            computationTimeMs: result.computation_time_ms,
         }, 'Baseline drift measurement complete');
 
-        return Result.ok({
-            anchor_baseline_y: anchorBaselineY,
-            candidate_baseline_y: candidateBaselineY,
-            drift_pixels: driftPixels,
-            drift_absolute: driftAbsolute,
-            drift_direction: driftDirection,
-            passed,
-            threshold,
-            computation_time_ms: computationTimeMs,
-        });
+        return Result.ok(result);
     } catch (error) {
         return Result.err({
             code: 'BASELINE_DRIFT_FAILED',
@@ -101,6 +78,57 @@ export async function measureBaselineDrift(
     }
 }
 
+/**
+ * Measure baseline drift for already-decoded candidate pixels
+ * Pure pixel work, safe to run inside an audit worker thread
+ */
+export function scoreBaselineDrift(
+    image: RawImage,
+    anchorBaselineY: number,
+    threshold: number = DEFAULT_DRIFT_THRESHOLD,
+    startTime: number = Date.now()
+): Result<BaselineDriftResult, BaselineDriftError> {
+    const candidateBaselineY = findBaselineRow(image);
+    if (candidateBaselineY === null) {
+        return Result.err(noContentError());
+    }
+
+    return Result.ok(buildDriftResult(anchorBaselineY, candidateBaselineY, threshold, startTime));
+}
+
+/**
+ * Build drift result from anchor and candidate baselines
+ */
+function buildDriftResult(
+    anchorBaselineY: number,
+    candidateBaselineY: number,
+    threshold: number,
+    startTime: number
+): BaselineDriftResult {
+    const driftPixels = candidateBaselineY - anchorBaselineY;
+    const driftAbsolute = Math.abs(driftPixels);
+
+    let driftDirection: 'none' | 'floating' | 'sinking';
+    if (driftPixels === 0) {
+        driftDirection = 'none';
+    } else if (driftPixels > 0) {
+        driftDirection = 'sinking';
+    } else {
+        driftDirection = 'floating';
+    }
+
+    return {
+        anchor_baseline_y: anchorBaselineY,
+        candidate_baseline_y: candidateBaselineY,
+        drift_pixels: driftPixels,
+        drift_absolute: driftAbsolute,
+        drift_direction: driftDirection,
+        passed: driftAbsolute <= threshold,
+        threshold,
+        computation_time_ms: Date.now() - startTime,
+    };
+}
+
 /**
  * Detect baseline (bottom-most opaque row) in an image
  */
@@ -108,28 +136,15 @@ async function detectBaseline(
     imagePath: string
 ): Promise<Result<number, BaselineDriftError>> {
     try {
-        const { data, info } = await sharp(imagePath)
-            .ensureAlpha()
-            .raw()
-            .toBuffer({ resolveWithObject: true });
-
-        const { width, height, channels } = info;
-
-        // Scan from bottom to find first row with opaque pixels
-        for (let y = height - 1; y >= 0; y--) {
-            for (let x = 0; x < width; x++) {
-                const idx = (y * width + x) * channels;
-                if (data[idx + 3] >= ALPHA_THRESHOLD) {
-                    return Result.ok(y);
-                }
-            }
-        }
+        const image = await loadRawImage(imagePath);
+        const baselineY = findBaselineRow(image);
 
         // No opaque pixels found
-        return Result.err({
-            code: 'BASELINE_NO_CONTENT',
-            message: 'No opaque pixels found to determine baseline',
-        });
+        if (baselineY === null) {
+            return Result.err(noContentError());
+        }
+
+        return Result.ok(baselineY);
     } catch (error) {
         return Result.err({
             code: 'BASELINE_DETECTION_FAILED',
@@ -139,7 +154,37 @@ async function detectBaseline(
     }
 }
 
+/**
+ * Find the bottom-most row containing an opaque pixel, or null if none
+ */
+function findBaselineRow(image: RawImage): number | null {
+    const { data, width, height } = image;
+    const channels = 4;
+
+    // Scan from bottom to find first row with opaque pixels
+    for (let y = height - 1; y >= 0; y--) {
+        for (let x = 0; x < width; x++) {
+            const idx = (y * width + x) * channels;
+            if (data[idx + 3] >= ALPHA_THRESHOLD) {
+                return y;
+            }
+        }
+    }
+
+    return null;
+}
+
+/**
+ * Error for images with no opaque content
+ */
+function noContentError(): BaselineDriftError {
+    return {
+        code: 'BASELINE_NO_CONTENT',
+        message: 'No opaque pixels found to determine baseline',
+    };
+}
+
 /**
  * Export baseline detector for reuse
  */
-export { detectBaseline };
+export { detectBaseline, findBaselineRow };
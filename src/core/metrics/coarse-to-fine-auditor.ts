@@ -0,0 +1,310 @@
+/**
+ * Coarse-to-Fine Auditor - multi-resolution early accept/reject for soft metrics
+ * Scores SSIM, MAPD, and palette fidelity on a downsampled pyramid level first
+ * and only pays for full-resolution metrics when the composite is borderline.
+ */
+
+import { Result } from '../config-resolver.js';
+import { logger } from '../../utils/logger.js';
+import type { AuditorThresholds } from '../../domain/defaults/auditor-defaults.js';
+import { downsampleRawImage, toSharedRawImage, type RawImage } from './raw-image.js';
+import { scoreSSIM, type SSIMResult } from './ssim-calculator.js';
+import { scoreMAPD, type MAPDResult } from './mapd-calculator.js';
+import { scorePaletteFidelity, type PaletteFidelityResult } from './palette-fidelity.js';
+import {
+    calculateCompositeScore,
+    DEFAULT_COMPOSITE_THRESHOLD,
+    type CompositeScore,
+    type MetricInputs,
+} from './soft-metric-aggregator.js';
+import {
+    runMetricTask,
+    type AuditMetricTask,
+    type AuditMetricOutcomes,
+} from './audit-metric-task.js';
+import type { AuditWorkerPool } from './audit-worker-pool.js';
+import type { IdentitySimilarityResult } from './identity-embedding.js';
+
+/**
+ * Decoded inputs for a coarse-to-fine audit
+ */
+export interface CoarseToFineRequest {
+    candidate: RawImage;
+    anchor?: RawImage;              // Enables identity (SSIM)
+    identity?: IdentitySimilarityResult;    // Embedding identity, scored in batches by IdentityEmbeddingEngine
+    previous?: RawImage;            // Enables stability (MAPD, with moveType)
+    moveType?: string;
+    palette?: string[];             // Enables palette fidelity
+    paletteTolerance?: number;
+    thresholds?: Partial<AuditorThresholds>;
+}
+
+/**
+ * Coarse-to-fine tuning
+ */
+export interface CoarseToFineOptions {
+    margin?: number;            // Composite distance from threshold that decides at coarse level
+    minCoarseSize?: number;     // Smallest coarse level side, in pixels
+    maxFactor?: number;         // Largest downsample factor
+    pool?: AuditWorkerPool;     // Optional pool for full-resolution metrics
+}
+
+/**
+ * Soft metric results at the resolution that decided the verdict
+ */
+export interface CoarseToFineResult {
+    resolution: 'coarse' | 'full';
+    pyramid_factor: number;             // 1 when full resolution decided
+    composite: CompositeScore;
+    coarse_composite_score?: number;    // Set when a coarse pass ran
+    ssim?: SSIMResult;
+    identity?: IdentitySimilarityResult;
+    mapd?: MAPDResult;
+    palette?: PaletteFidelityResult;
+    computation_time_ms: number;
+}
+
+/**
+ * Error for coarse-to-fine auditing
+ */
+export interface CoarseToFineError {
+    code: string;
+    message: string;
+    cause?: unknown;
+}
+
+// Default decision band around the composite threshold
+const DEFAULT_MARGIN = 0.10;
+// Coarse level must stay large enough for 11px SSIM blocks to mean something
+const DEFAULT_MIN_COARSE_SIZE = 64;
+const DEFAULT_MAX_FACTOR = 8;
+
+/**
+ * Soft metrics computed at one resolution
+ */
+interface SoftMetricSet {
+    ssim?: SSIMResult;
+    identity?: IdentitySimilarityResult;
+    mapd?: MAPDResult;
+    palette?: PaletteFidelityResult;
+}
+
+/**
+ * Pick the largest power-of-two downsample factor that keeps the coarse
+ * level at least minCoarseSize on its shorter side. Returns 1 when the
+ * canvas is too small for a coarse pass.
+ */
+export function selectPyramidFactor(
+    width: number,
+    height: number,
+    minCoarseSize: number = DEFAULT_MIN_COARSE_SIZE,
+    maxFactor: number = DEFAULT_MAX_FACTOR
+): number {
+    const shortSide = Math.min(width, height);
+    let factor = 1;
+    while (factor * 2 <= maxFactor && shortSide / (factor * 2) >= minCoarseSize) {
+        factor *= 2;
+    }
+    return factor;
+}
+
+/**
+ * Map soft metric results onto composite score inputs.
+ * Stability is the complement of MAPD; bypassed moves don't contribute.
+ * Embedding identity from a calibrated backend takes precedence over SSIM
+ * (see calculateCompositeScore).
+ */
+export function toMetricInputs(metrics: SoftMetricSet): MetricInputs {
+    const inputs: MetricInputs = {};
+    if (metrics.ssim) {
+        inputs.identity = metrics.ssim.score;
+    }
+    if (metrics.identity) {
+        inputs.dino_similarity = metrics.identity.dino_similarity;
+        inputs.identity_backend = metrics.identity.backend;
+    }
+    if (metrics.palette) {
+        inputs.palette = metrics.palette.fidelity_score;
+    }
+    if (metrics.mapd && !metrics.mapd.bypassed) {
+        inputs.stability = Math.max(0, 1 - metrics.mapd.mapd_score);
+    }
+    return inputs;
+}
+
+/**
+ * Audit a candidate coarse-to-fine
+ */
+export async function auditCoarseToFine(
+    request: CoarseToFineRequest,
+    options: CoarseToFineOptions = {}
+): Promise<Result<CoarseToFineResult, CoarseToFineError>> {
+    const startTime = Date.now();
+    const margin = options.margin ?? DEFAULT_MARGIN;
+    const threshold = request.thresholds?.composite_min ?? DEFAULT_COMPOSITE_THRESHOLD;
+    const factor = selectPyramidFactor(
+        request.candidate.width,
+        request.candidate.height,
+        options.minCoarseSize,
+        options.maxFactor
+    );
+
+    try {
+        let coarseCompositeScore: number | undefined;
+
+        if (factor > 1) {
+            const coarseMetrics = computeCoarseMetrics(request, factor);
+            if (!coarseMetrics.ok) {
+                return Result.err(coarseMetrics.error);
+            }
+
+            const coarseComposite = calculateCompositeScore(toMetricInputs(coarseMetrics.value), threshold);
+            coarseCompositeScore = coarseComposite.composite_score;
+
+            // Clear of the threshold band - decide without touching full resolution
+            if (Math.abs(coarseCompositeScore - threshold) >= margin) {
+                logger.debug({
+                    factor,
+                    coarseCompositeScore,
+                    threshold,
+                    margin,
+                    passed: coarseComposite.passed,
+                }, 'Coarse audit decided candidate');
+
+                return Result.ok({
+                    resolution: 'coarse',
+                    pyramid_factor: factor,
+                    composite: coarseComposite,
+                    coarse_composite_score: coarseCompositeScore,
+                    ...coarseMetrics.value,
+                    computation_time_ms: Date.now() - startTime,
+                });
+            }
+        }
+
+        const fullMetrics = await computeFullMetrics(request, options.pool);
+        if (!fullMetrics.ok) {
+            return Result.err(fullMetrics.error);
+        }
+
+        const composite = calculateCompositeScore(toMetricInputs(fullMetrics.value), threshold);
+
+        logger.debug({
+            factor,
+            coarseCompositeScore,
+            compositeScore: composite.composite_score,
+            threshold,
+            passed: composite.passed,
+        }, 'Full-resolution audit decided candidate');
+
+        return Result.ok({
+            resolution: 'full',
+            pyramid_factor: 1,
+            composite,
+            coarse_composite_score: coarseCompositeScore,
+            ...fullMetrics.value,
+            computation_time_ms: Date.now() - startTime,
+        });
+    } catch (error) {
+        return Result.err({
+            code: 'COARSE_TO_FINE_FAILED',
+            message: 'Failed to run coarse-to-fine audit',
+            cause: error,
+        });
+    }
+}
+
+/**
+ * Score soft metrics on the downsampled pyramid level (in-process; the
+ * coarse level is small enough that a worker round-trip isn't worth it)
+ */
+function computeCoarseMetrics(
+    request: CoarseToFineRequest,
+    factor: number
+): Result<SoftMetricSet, CoarseToFineError> {
+    const candidate = downsampleRawImage(request.candidate, factor);
+    const metrics: SoftMetricSet = {};
+
+    // Resolution-independent: computed once by the embedding engine
+    if (request.identity) {
+        metrics.identity = request.identity;
+    }
+
+    if (request.anchor) {
+        const ssim = scoreSSIM(candidate, downsampleRawImage(request.anchor, factor), request.thresholds?.identity_min);
+        if (!ssim.ok) return Result.err(ssim.error);
+        metrics.ssim = ssim.value;
+    }
+
+    if (request.previous && request.moveType) {
+        const mapd = scoreMAPD(downsampleRawImage(request.previous, factor), candidate, request.moveType);
+        if (!mapd.ok) return Result.err(mapd.error);
+        metrics.mapd = mapd.value;
+    }
+
+    if (request.palette) {
+        const palette = scorePaletteFidelity(
+            candidate,
+            request.palette,
+            request.thresholds?.palette_min,
+            request.paletteTolerance
+        );
+        if (!palette.ok) return Result.err(palette.error);
+        metrics.palette = palette.value;
+    }
+
+    return Result.ok(metrics);
+}
+
+/**
+ * Score soft metrics at full resolution, on the worker pool when provided
+ */
+async function computeFullMetrics(
+    request: CoarseToFineRequest,
+    pool?: AuditWorkerPool
+): Promise<Result<SoftMetricSet, CoarseToFineError>> {
+    const share = (image: RawImage): RawImage => pool ? toSharedRawImage(image) : image;
+    const candidate = share(request.candidate);
+    const thresholds = request.thresholds ?? {};
+
+    const run = <T extends AuditMetricTask>(task: T): Promise<AuditMetricOutcomes[T['metric']]> => pool
+        ? pool.runTask(task)
+        : Promise.resolve(runMetricTask(task) as AuditMetricOutcomes[T['metric']]);
+
+    const [ssim, mapd, palette] = await Promise.all([
+        request.anchor
+            ? run({ metric: 'ssim', candidate, anchor: share(request.anchor), threshold: thresholds.identity_min })
+            : undefined,
+        request.previous && request.moveType
+            ? run({ metric: 'mapd', previous: share(request.previous), candidate, moveType: request.moveType })
+            : undefined,
+        request.palette
+            ? run({
+                metric: 'palette',
+                candidate,
+                palette: request.palette,
+                threshold: thresholds.palette_min,
+                tolerance: request.paletteTolerance,
+            })
+            : undefined,
+    ]);
+
+    const metrics: SoftMetricSet = {};
+    if (request.identity) {
+        metrics.identity = request.identity;
+    }
+    if (ssim) {
+        if (!ssim.ok) return Result.err(ssim.error);
+        metrics.ssim = ssim.value;
+    }
+    if (mapd) {
+        if (!mapd.ok) return Result.err(mapd.error);
+        metrics.mapd = mapd.value;
+    }
+    if (palette) {
+        if (!palette.ok) return Result.err(palette.error);
+        metrics.palette = palette.value;
+    }
+
+    return Result.ok(metrics);
+}
@@ -0,0 +1,721 @@
+/**
+ * Identity Embedding Engine - CPU embedding similarity for identity checks
+ * Scores candidates by cosine similarity of image embeddings against the
+ * character's anchor (and approved frames) instead of block SSIM, which
+ * penalizes any pose change or shift as identity drift.
+ *
+ * Backends:
+ * - onnx: a DINOv2-style ViT exported to ONNX, run with onnxruntime-node
+ *   (optional dependency; weights are not bundled, point modelPath or
+ *   BANANA_IDENTITY_MODEL at the .onnx file)
+ * - descriptor: dependency-free fallback built from silhouette, color,
+ *   layout, and edge-orientation features of the cropped sprite. Its scores
+ *   are uncalibrated, so the composite score keeps SSIM for identity.
+ *
+ * Candidate embeddings are micro-batched across concurrent callers, and
+ * anchor/approved-frame embeddings are cached per character.
+ */
+
+import { createHash } from 'crypto';
+import { availableParallelism } from 'os';
+import { Result } from '../config-resolver.js';
+import { logger } from '../../utils/logger.js';
+import type { RawImage } from './raw-image.js';
+
+/**
+ * Computes L2-normalized embeddings for a batch of images.
+ * Ids: 'onnx:<modelPath>' for the ONNX model, 'descriptor' for the fallback.
+ */
+export interface EmbeddingBackend {
+    readonly id: string;
+    embedBatch(images: RawImage[]): Promise<Float32Array[]>;
+    dispose?(): Promise<void>;
+}
+
+/**
+ * Embedding similarity result (inputs to the soft metric aggregator)
+ */
+export interface IdentitySimilarityResult {
+    dino_similarity: number;            // 0.0 - 1.0 blended identity similarity (DINOv2-calibrated only for onnx backends)
+    anchor_similarity: number;          // Cosine similarity to the anchor
+    approved_similarity?: number;       // Best cosine similarity to an approved frame
+    backend: string;                    // EmbeddingBackend id that produced the scores
+    passed?: boolean;                   // Unset for uncalibrated backends unless a threshold was given
+    threshold?: number;
+    computation_time_ms: number;
+}
+
+/**
+ * Error for identity embedding
+ */
+export interface IdentityEmbeddingError {
+    code: string;
+    message: string;
+    cause?: unknown;
+}
+
+/**
+ * Engine configuration
+ */
+export interface IdentityEmbeddingOptions {
+    maxBatchSize?: number;              // Candidates per backend call
+    maxCacheEntriesPerCharacter?: number;
+}
+
+/**
+ * ONNX backend configuration
+ */
+export interface OnnxEmbeddingOptions {
+    modelPath: string;
+    inputSize?: number;                 // Square input side (224 for DINOv2 ViT-S/14)
+    intraOpThreads?: number;
+}
+
+/**
+ * The parts of onnxruntime-node used here. Declared locally so the module
+ * type-checks on installs that skipped the optional dependency.
+ */
+interface OrtTensor {
+    readonly data: unknown;
+    readonly dims: readonly number[];
+}
+
+interface OrtInferenceSession {
+    readonly inputNames: readonly string[];
+    readonly outputNames: readonly string[];
+    run(feeds: Record<string, OrtTensor>): Promise<Record<string, OrtTensor>>;
+    release?(): Promise<void>;
+}
+
+interface OrtModule {
+    InferenceSession: {
+        create(modelPath: string, options: {
+            executionProviders: string[];
+            intraOpNumThreads: number;
+            graphOptimizationLevel: 'all';
+        }): Promise<OrtInferenceSession>;
+    };
+    Tensor: new (type: 'float32', data: Float32Array, dims: number[]) => OrtTensor;
+}
+
+/**
+ * Throughput benchmark result
+ */
+export interface EmbeddingThroughput {
+    backend: string;
+    frames: number;
+    batch_size: number;
+    duration_ms: number;
+    frames_per_second: number;
+}
+
+/**
+ * Reference frame roles cached per character
+ */
+export type ReferenceRole = 'anchor' | 'approved';
+
+// Default identity threshold for embedding similarity (tuned for DINOv2)
+export const DEFAULT_DINO_SIMILARITY_THRESHOLD = 0.80;
+const ONNX_BACKEND_PREFIX = 'onnx:';
+// Non-literal specifier: tsc must not resolve the optional package's types
+const ONNX_RUNTIME_MODULE: string = 'onnxruntime-node';
+// Anchor stays the ground truth; approved frames add pose coverage
+const ANCHOR_WEIGHT = 0.6;
+const DEFAULT_MAX_BATCH_SIZE = 16;
+const DEFAULT_MAX_CACHE_ENTRIES = 256;
+
+// ImageNet normalization used by DINOv2
+const IMAGENET_MEAN = [0.485, 0.456, 0.406];
+const IMAGENET_STD = [0.229, 0.224, 0.225];
+
+// Descriptor layout
+const DESCRIPTOR_GRID = 32;             // Cropped sprite resampled to 32x32
+const SILHOUETTE_CELLS = 8;             // 8x8 alpha occupancy
+const LAYOUT_CELLS = 4;                 // 4x4 mean color
+const EDGE_CELLS = 4;                   // 4x4 cells x 8 orientations
+const EDGE_BINS = 8;
+const COLOR_LEVELS = 4;                 // 4x4x4 joint RGB histogram
+const ALPHA_THRESHOLD = 128;
+const BLOCK_WEIGHTS = { silhouette: 1.0, color: 1.0, layout: 0.8, edges: 0.8 };
+
+/**
+ * Cosine similarity of two L2-normalized embeddings
+ */
+export function cosineSimilarity(a: Float32Array, b: Float32Array): number {
+    const length = Math.min(a.length, b.length);
+    let dot = 0;
+    for (let i = 0; i < length; i++) {
+        dot += a[i] * b[i];
+    }
+    return dot;
+}
+
+/**
+ * L2-normalize in place (zero vectors stay zero)
+ */
+function normalize(vector: Float32Array, from: number = 0, to: number = vector.length): void {
+    let sum = 0;
+    for (let i = from; i < to; i++) {
+        sum += vector[i] * vector[i];
+    }
+    if (sum === 0) return;
+    const scale = 1 / Math.sqrt(sum);
+    for (let i = from; i < to; i++) {
+        vector[i] *= scale;
+    }
+}
+
+/**
+ * Opaque bounds of an RGBA image, or null if fully transparent
+ */
+function findOpaqueBounds(image: RawImage): { x: number; y: number; w: number; h: number } | null {
+    const { data, width, height } = image;
+    let minX = width;
+    let minY = height;
+    let maxX = -1;
+    let maxY = -1;
+
+    for (let y = 0; y < height; y++) {
+        const row = y * width * 4;
+        for (let x = 0; x < width; x++) {
+            if (data[row + x * 4 + 3] >= ALPHA_THRESHOLD) {
+                if (x < minX) minX = x;
+                if (x > maxX) maxX = x;
+                if (y < minY) minY = y;
+                if (y > maxY) maxY = y;
+            }
+        }
+    }
+
+    return maxX < 0 ? null : { x: minX, y: minY, w: maxX - minX + 1, h: maxY - minY + 1 };
+}
+
+/**
+ * Embed one sprite as a hand-built descriptor.
+ * The sprite is cropped to its opaque bounds and fit (aspect preserved)
+ * into a 32x32 grid, so the descriptor ignores placement on the canvas.
+ */
+export function computeDescriptor(image: RawImage): Float32Array {
+    const silhouetteSize = SILHOUETTE_CELLS * SILHOUETTE_CELLS;
+    const colorSize = COLOR_LEVELS ** 3;
+    const layoutSize = LAYOUT_CELLS * LAYOUT_CELLS * 3;
+    const edgeSize = EDGE_CELLS * EDGE_CELLS * EDGE_BINS;
+    const descriptor = new Float32Array(silhouetteSize + colorSize + layoutSize + edgeSize);
+
+    const bounds = findOpaqueBounds(image);
+    if (!bounds) {
+        return descriptor;
+    }
+
+    const { data, width } = image;
+    const grid = DESCRIPTOR_GRID;
+    const scale = grid / Math.max(bounds.w, bounds.h);
+    const offsetX = (grid - bounds.w * scale) / 2;
+    const offsetY = (grid - bounds.h * scale) / 2;
+
+    // Joint color histogram over opaque pixels (alpha weighted)
+    const colorBase = silhouetteSize;
+    const quant = 256 / COLOR_LEVELS;
+    for (let y = bounds.y; y < bounds.y + bounds.h; y++) {
+        for (let x = bounds.x; x < bounds.x + bounds.w; x++) {
+            const idx = (y * width + x) * 4;
+            if (data[idx + 3] >= ALPHA_THRESHOLD) {
+                const bin = Math.floor(data[idx] / quant) * COLOR_LEVELS * COLOR_LEVELS
+                    + Math.floor(data[idx + 1] / quant) * COLOR_LEVELS
+                    + Math.floor(data[idx + 2] / quant);
+                descriptor[colorBase + bin] += data[idx + 3] / 255;
+            }
+        }
+    }
+
+    // Box-resample the crop: premultiplied RGB and alpha per grid cell.
+    // Each cell averages the source pixels it covers (at least one), so
+    // sprites smaller than the grid are upsampled without holes.
+    const cellAlpha = new Float32Array(grid * grid);
+    const cellRgb = new Float32Array(grid * grid * 3);
+    const sourceSpan = (cell: number, offset: number, extent: number): [number, number] => {
+        const from = Math.max(0, Math.floor((cell - offset) / scale));
+        const to = Math.min(extent, Math.ceil((cell + 1 - offset) / scale));
+        return [from, to];
+    };
+
+    for (let gy = 0; gy < grid; gy++) {
+        const [sy0, sy1] = sourceSpan(gy, offsetY, bounds.h);
+        if (sy0 >= sy1) continue;
+        for (let gx = 0; gx < grid; gx++) {
+            const [sx0, sx1] = sourceSpan(gx, offsetX, bounds.w);
+            if (sx0 >= sx1) continue;
+
+            const cell = gy * grid + gx;
+            for (let y = sy0; y < sy1; y++) {
+                for (let x = sx0; x < sx1; x++) {
+                    const idx = ((bounds.y + y) * width + bounds.x + x) * 4;
+                    const alpha = data[idx + 3] / 255;
+                    cellAlpha[cell] += alpha;
+                    cellRgb[cell * 3] += data[idx] * alpha;
+                    cellRgb[cell * 3 + 1] += data[idx + 1] * alpha;
+                    cellRgb[cell * 3 + 2] += data[idx + 2] * alpha;
+                }
+            }
+
+            const count = (sy1 - sy0) * (sx1 - sx0);
+            cellAlpha[cell] /= count;
+            cellRgb[cell * 3] /= count;
+            cellRgb[cell * 3 + 1] /= count;
+            cellRgb[cell * 3 + 2] /= count;
+        }
+    }
+
+    const luma = new Float32Array(grid * grid);
+    for (let cell = 0; cell < grid * grid; cell++) {
+        luma[cell] = (0.299 * cellRgb[cell * 3] + 0.587 * cellRgb[cell * 3 + 1] + 0.114 * cellRgb[cell * 3 + 2]) / 255;
+    }
+
+    // Silhouette: mean alpha per coarse cell
+    const silhouetteStep = grid / SILHOUETTE_CELLS;
+    for (let gy = 0; gy < grid; gy++) {
+        for (let gx = 0; gx < grid; gx++) {
+            const cell = Math.floor(gy / silhouetteStep) * SILHOUETTE_CELLS + Math.floor(gx / silhouetteStep);
+            descriptor[cell] += cellAlpha[gy * grid + gx];
+        }
+    }
+
+    // Layout: mean premultiplied color per coarse cell
+    const layoutBase = colorBase + colorSize;
+    const layoutStep = grid / LAYOUT_CELLS;
+    for (let gy = 0; gy < grid; gy++) {
+        for (let gx = 0; gx < grid; gx++) {
+            const cell = Math.floor(gy / layoutStep) * LAYOUT_CELLS + Math.floor(gx / layoutStep);
+            const src = (gy * grid + gx) * 3;
+            descriptor[layoutBase + cell * 3] += cellRgb[src] / 255;
+            descriptor[layoutBase + cell * 3 + 1] += cellRgb[src + 1] / 255;
+            descriptor[layoutBase + cell * 3 + 2] += cellRgb[src + 2] / 255;
+        }
+    }
+
+    // Edges: gradient orientation histograms over premultiplied luma + alpha
+    const edgeBase = layoutBase + layoutSize;
+    const edgeStep = grid / EDGE_CELLS;
+    const at = (x: number, y: number) => luma[y * grid + x] + cellAlpha[y * grid + x];
+    for (let gy = 1; gy < grid - 1; gy++) {
+        for (let gx = 1; gx < grid - 1; gx++) {
+            const dx = at(gx + 1, gy) - at(gx - 1, gy);
+            const dy = at(gx, gy + 1) - at(gx, gy - 1);
+            const magnitude = Math.sqrt(dx * dx + dy * dy);
+            if (magnitude === 0) continue;
+
+            // Unsigned orientation in [0, pi)
+            let angle = Math.atan2(dy, dx);
+            if (angle < 0) angle += Math.PI;
+            const bin = Math.min(EDGE_BINS - 1, Math.floor((angle / Math.PI) * EDGE_BINS));
+            const cell = Math.floor(gy / edgeStep) * EDGE_CELLS + Math.floor(gx / edgeStep);
+            descriptor[edgeBase + cell * EDGE_BINS + bin] += magnitude;
+        }
+    }
+
+    // Normalize each block, weight, then normalize the whole vector
+    const blocks: Array<[number, number, number]> = [
+        [0, silhouetteSize, BLOCK_WEIGHTS.silhouette],
+        [colorBase, colorBase + colorSize, BLOCK_WEIGHTS.color],
+        [layoutBase, layoutBase + layoutSize, BLOCK_WEIGHTS.layout],
+        [edgeBase, edgeBase + edgeSize, BLOCK_WEIGHTS.edges],
+    ];
+    for (const [from, to, weight] of blocks) {
+        // Square root first: damps dominant bins (large flat color areas)
+        for (let i = from; i < to; i++) {
+            descriptor[i] = Math.sqrt(descriptor[i]);
+        }
+        normalize(descriptor, from, to);
+        for (let i = from; i < to; i++) {
+            descriptor[i] *= weight;
+        }
+    }
+    normalize(descriptor);
+
+    return descriptor;
+}
+
+/**
+ * Whether a backend's similarities are calibrated for identity decisions.
+ * Only the ONNX ViT model is; the descriptor is an uncalibrated heuristic
+ * and must not replace SSIM or be judged against the DINOv2 threshold.
+ */
+export function isCalibratedEmbeddingBackend(backendId: string): boolean {
+    return backendId.startsWith(ONNX_BACKEND_PREFIX);
+}
+
+/**
+ * Dependency-free descriptor backend
+ */
+export function createDescriptorEmbeddingBackend(): EmbeddingBackend {
+    return {
+        id: 'descriptor',
+        embedBatch: async images => images.map(computeDescriptor),
+    };
+}
+
+/**
+ * Convert RGBA images into a normalized NCHW float batch.
+ * Transparent areas are composited onto mid-grey, then bilinearly resized.
+ */
+export function toNchwBatch(images: RawImage[], size: number): Float32Array {
+    const plane = size * size;
+    const batch = new Float32Array(images.length * 3 * plane);
+
+    images.forEach((image, n) => {
+        const { data, width, height } = image;
+        const base = n * 3 * plane;
+        const sx = width / size;
+        const sy = height / size;
+        // Channel value composited onto mid-grey, 0-1
+        const sample = (px: number, py: number, c: number) => {
+            const idx = (py * width + px) * 4;
+            const alpha = data[idx + 3] / 255;
+            return (data[idx + c] * alpha + 128 * (1 - alpha)) / 255;
+        };
+
+        for (let y = 0; y < size; y++) {
+            const fy = Math.max(0, Math.min(height - 1, (y + 0.5) * sy - 0.5));
+            const y0 = Math.floor(fy);
+            const y1 = Math.min(height - 1, y0 + 1);
+            const wy = fy - y0;
+
+            for (let x = 0; x < size; x++) {
+                const fx = Math.max(0, Math.min(width - 1, (x + 0.5) * sx - 0.5));
+                const x0 = Math.floor(fx);
+                const x1 = Math.min(width - 1, x0 + 1);
+                const wx = fx - x0;
+
+                for (let c = 0; c < 3; c++) {
+                    const top = sample(x0, y0, c) * (1 - wx) + sample(x1, y0, c) * wx;
+                    const bottom = sample(x0, y1, c) * (1 - wx) + sample(x1, y1, c) * wx;
+                    const value = top * (1 - wy) + bottom * wy;
+                    batch[base + c * plane + y * size + x] = (value - IMAGENET_MEAN[c]) / IMAGENET_STD[c];
+                }
+            }
+        }
+    });
+
+    return batch;
+}
+
+/**
+ * Load a ViT embedding model with onnxruntime-node (CPU execution provider).
+ * Returns an error when the runtime isn't installed or the model can't load.
+ */
+export async function loadOnnxEmbeddingBackend(
+    options: OnnxEmbeddingOptions
+): Promise<Result<EmbeddingBackend, IdentityEmbeddingError>> {
+    const inputSize = options.inputSize ?? 224;
+
+    // Optional dependency: loaded on demand, absent on installs that skipped it
+    let ort: OrtModule;
+    try {
+        ort = await import(ONNX_RUNTIME_MODULE) as OrtModule;
+    } catch (error) {
+        return Result.err({
+            code: 'EMBEDDING_RUNTIME_UNAVAILABLE',
+            message: 'onnxruntime-node is not installed',
+            cause: error,
+        });
+    }
+
+    let session: OrtInferenceSession;
+    try {
+        session = await ort.InferenceSession.create(options.modelPath, {
+            executionProviders: ['cpu'],
+            intraOpNumThreads: options.intraOpThreads ?? Math.max(1, availableParallelism() - 1),
+            graphOptimizationLevel: 'all',
+        });
+    } catch (error) {
+        return Result.err({
+            code: 'EMBEDDING_MODEL_LOAD_FAILED',
+            message: `Failed to load embedding model: ${options.modelPath}`,
+            cause: error,
+        });
+    }
+
+    const inputName = session.inputNames[0];
+    const outputName = session.outputNames[0];
+
+    return Result.ok({
+        id: `${ONNX_BACKEND_PREFIX}${options.modelPath}`,
+        async embedBatch(images: RawImage[]): Promise<Float32Array[]> {
+            if (images.length === 0) return [];
+
+            const input = new ort.Tensor('float32', toNchwBatch(images, inputSize), [images.length, 3, inputSize, inputSize]);
+            const outputs = await session.run({ [inputName]: input });
+            const output = outputs[outputName];
+            const values = output.data as Float32Array;
+            const dims = output.dims;
+
+            // [N, D] pooled output, or [N, T, D] tokens: use the CLS token
+            const dim = dims[dims.length - 1];
+            const stride = dims.length === 3 ? dims[1] * dim : dim;
+
+            return images.map((_, n) => {
+                const embedding = values.slice(n * stride, n * stride + dim);
+                normalize(embedding);
+                return embedding;
+            });
+        },
+        async dispose(): Promise<void> {
+            await session.release?.();
+        },
+    });
+}
+
+/**
+ * Identity embedding engine: batching, per-character reference cache, scoring
+ */
+export class IdentityEmbeddingEngine {
+    private readonly backend: EmbeddingBackend;
+    private readonly maxBatchSize: number;
+    private readonly maxCacheEntries: number;
+    private readonly cache = new Map<string, Map<string, { role: ReferenceRole; embedding: Float32Array }>>();
+    private pending: Array<{
+        image: RawImage;
+        resolve: (embedding: Float32Array) => void;
+        reject: (error: unknown) => void;
+    }> = [];
+    private flushScheduled = false;
+    private cacheHits = 0;
+    private cacheMisses = 0;
+    private batchesRun = 0;
+
+    constructor(backend: EmbeddingBackend, options: IdentityEmbeddingOptions = {}) {
+        this.backend = backend;
+        this.maxBatchSize = Math.max(1, options.maxBatchSize ?? DEFAULT_MAX_BATCH_SIZE);
+        this.maxCacheEntries = Math.max(1, options.maxCacheEntriesPerCharacter ?? DEFAULT_MAX_CACHE_ENTRIES);
+    }
+
+    get backendId(): string {
+        return this.backend.id;
+    }
+
+    /**
+     * Embed one image. Calls made in the same tick are batched together.
+     */
+    embed(image: RawImage): Promise<Float32Array> {
+        return new Promise((resolve, reject) => {
+            this.pending.push({ image, resolve, reject });
+            if (this.pending.length >= this.maxBatchSize) {
+                void this.flush();
+            } else if (!this.flushScheduled) {
+                this.flushScheduled = true;
+                setImmediate(() => {
+                    this.flushScheduled = false;
+                    void this.flush();
+                });
+            }
+        });
+    }
+
+    /**
+     * Embed many images in backend batches of maxBatchSize
+     */
+    embedBatch(images: RawImage[]): Promise<Float32Array[]> {
+        return Promise.all(images.map(image => this.embed(image)));
+    }
+
+    /**
+     * Embed a reference frame (anchor or approved) for a character,
+     * reusing the cached embedding when the pixels are unchanged
+     */
+    async cacheReference(characterId: string, image: RawImage, role: ReferenceRole = 'approved'): Promise<Float32Array> {
+        let entries = this.cache.get(characterId);
+        if (!entries) {
+            entries = new Map();
+            this.cache.set(characterId, entries);
+        }
+
+        const key = `${role}:${contentKey(image)}`;
+        const cached = entries.get(key);
+        if (cached) {
+            this.cacheHits++;
+            return cached.embedding;
+        }
+
+        this.cacheMisses++;
+        const embedding = await this.embed(image);
+        entries.set(key, { role, embedding });
+
+        // Evict oldest approved frames first; anchors are kept
+        if (entries.size > this.maxCacheEntries) {
+            for (const [oldKey, entry] of entries) {
+                if (entry.role === 'approved') {
+                    entries.delete(oldKey);
+                    break;
+                }
+            }
+        }
+
+        return embedding;
+    }
+
+    /**
+     * Score candidates against a character's anchor and approved frames.
+     * Approved frames must have been added with cacheReference().
+     * Calibrated backends are judged against the DINOv2 threshold by default;
+     * uncalibrated ones only get a pass/fail when a threshold is given.
+     */
+    async scoreCandidates(
+        characterId: string,
+        anchor: RawImage,
+        candidates: RawImage[],
+        threshold?: number
+    ): Promise<Result<IdentitySimilarityResult[], IdentityEmbeddingError>> {
+        const startTime = Date.now();
+        const passThreshold = threshold
+            ?? (isCalibratedEmbeddingBackend(this.backend.id) ? DEFAULT_DINO_SIMILARITY_THRESHOLD : undefined);
+
+        try {
+            const [anchorEmbedding, candidateEmbeddings] = await Promise.all([
+                this.cacheReference(characterId, anchor, 'anchor'),
+                this.embedBatch(candidates),
+            ]);
+
+            const approved = [...(this.cache.get(characterId)?.values() ?? [])]
+                .filter(entry => entry.role === 'approved')
+                .map(entry => entry.embedding);
+            const elapsedMs = Date.now() - startTime;
+
+            const results = candidateEmbeddings.map(embedding => {
+                const anchorSimilarity = clamp01(cosineSimilarity(embedding, anchorEmbedding));
+                let approvedSimilarity: number | undefined;
+                for (const reference of approved) {
+                    const similarity = clamp01(cosineSimilarity(embedding, reference));
+                    if (approvedSimilarity === undefined || similarity > approvedSimilarity) {
+                        approvedSimilarity = similarity;
+                    }
+                }
+
+                const dinoSimilarity = approvedSimilarity === undefined
+                    ? anchorSimilarity
+                    : ANCHOR_WEIGHT * anchorSimilarity + (1 - ANCHOR_WEIGHT) * approvedSimilarity;
+
+                return {
+                    dino_similarity: dinoSimilarity,
+                    anchor_similarity: anchorSimilarity,
+                    approved_similarity: approvedSimilarity,
+                    backend: this.backend.id,
+                    passed: passThreshold === undefined ? undefined : dinoSimilarity >= passThreshold,
+                    threshold: passThreshold,
+                    computation_time_ms: elapsedMs,
+                };
+            });
+
+            logger.debug({
+                characterId,
+                candidates: candidates.length,
+                approvedReferences: approved.length,
+                backend: this.backend.id,
+                computationTimeMs: elapsedMs,
+            }, 'Identity embeddings scored');
+
+            return Result.ok(results);
+        } catch (error) {
+            return Result.err({
+                code: 'EMBEDDING_FAILED',
+                message: 'Failed to compute identity embeddings',
+                cause: error,
+            });
+        }
+    }
+
+    /**
+     * Drop a character's cached references (e.g. after the anchor changes)
+     */
+    clearCharacter(characterId: string): void {
+        this.cache.delete(characterId);
+    }
+
+    /**
+     * Cache and batching counters
+     */
+    getStats(): { cacheHits: number; cacheMisses: number; cachedCharacters: number; batchesRun: number } {
+        return {
+            cacheHits: this.cacheHits,
+            cacheMisses: this.cacheMisses,
+            cachedCharacters: this.cache.size,
+            batchesRun: this.batchesRun,
+        };
+    }
+
+    async dispose(): Promise<void> {
+        await this.backend.dispose?.();
+    }
+
+    private async flush(): Promise<void> {
+        while (this.pending.length > 0) {
+            const batch = this.pending.splice(0, this.maxBatchSize);
+            this.batchesRun++;
+            try {
+                const embeddings = await this.backend.embedBatch(batch.map(item => item.image));
+                batch.forEach((item, i) => item.resolve(embeddings[i]));
+            } catch (error) {
+                batch.forEach(item => item.reject(error));
+            }
+        }
+    }
+}
+
+/**
+ * Create an engine on the best available backend: the ONNX model when one
+ * is configured and loads, the descriptor backend otherwise
+ */
+export async function createIdentityEmbeddingEngine(
+    options: IdentityEmbeddingOptions & Partial<OnnxEmbeddingOptions> = {}
+): Promise<IdentityEmbeddingEngine> {
+    const modelPath = options.modelPath ?? process.env.BANANA_IDENTITY_MODEL;
+
+    if (modelPath) {
+        const onnx = await loadOnnxEmbeddingBackend({ ...options, modelPath });
+        if (onnx.ok) {
+            return new IdentityEmbeddingEngine(onnx.value, options);
+        }
+        logger.warn({
+            code: onnx.error.code,
+            modelPath,
+        }, `${onnx.error.message}; falling back to descriptor embeddings`);
+    }
+
+    return new IdentityEmbeddingEngine(createDescriptorEmbeddingBackend(), options);
+}
+
+/**
+ * Measure embedding throughput in frames/sec
+ */
+export async function measureEmbeddingThroughput(
+    engine: IdentityEmbeddingEngine,
+    frames: RawImage[],
+    batchSize: number = DEFAULT_MAX_BATCH_SIZE
+): Promise<EmbeddingThroughput> {
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < frames.length; i += batchSize) {
+        await engine.embedBatch(frames.slice(i, i + batchSize));
+    }
+    const durationMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+    return {
+        backend: engine.backendId,
+        frames: frames.length,
+        batch_size: batchSize,
+        duration_ms: durationMs,
+        frames_per_second: durationMs > 0 ? (frames.length * 1000) / durationMs : Infinity,
+    };
+}
+
+function clamp01(value: number): number {
+    return Math.max(0, Math.min(1, value));
+}
+
+/**
+ * Cache key for a frame's pixels
+ */
+function contentKey(image: RawImage): string {
+    return createHash('sha1')
+        .update(`${image.width}x${image.height}:`)
+        .update(image.data)
+        .digest('hex');
+}
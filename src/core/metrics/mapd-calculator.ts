@@ -3,9 +3,9 @@
  * Per Story 3.8: Measure frame-to-frame consistency
  */
 
-import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 
 /**
  * MAPD calculation result
@@ -43,6 +43,19 @@ const MAPD_THRESHOLDS: Record<string, number> = {
 // Moves that bypass MAPD check due to inherent high motion
 const BYPASS_MOVES = ['attack', 'jump', 'hit', 'death', 'special'];
 
+/**
+ * Resolve MAPD threshold and bypass status for a move type
+ */
+export function resolveMoveThreshold(moveType: string): { threshold: number; bypassed: boolean } {
+    const normalizedMoveType = moveType.toLowerCase();
+
+    // Check if this move type bypasses MAPD
+    const bypassed = BYPASS_MOVES.some(m => normalizedMoveType.includes(m));
+    const threshold = MAPD_THRESHOLDS[normalizedMoveType] || MAPD_THRESHOLDS['walk'];
+
+    return { threshold, bypassed };
+}
+
 /**
  * Calculate MAPD between two consecutive frames
  */
@@ -52,87 +65,35 @@ export async function calculateMAPD(
     moveType: string
 ): Promise<Result<MAPDResult, MAPDError>> {
     const startTime = Date.now();
-    const normalizedMoveType = moveType.toLowerCase();
-
-    // Check if this move type bypasses MAPD
-    const bypassed = BYPASS_MOVES.some(m => normalizedMoveType.includes(m));
-    const threshold = MAPD_THRESHOLDS[normalizedMoveType] || MAPD_THRESHOLDS['walk'];
+    const { threshold, bypassed } = resolveMoveThreshold(moveType);
 
     if (bypassed) {
-        return Result.ok({
-            mapd_score: 0,
-            mapd_percentage: 0,
-            move_type: moveType,
-            threshold,
-            bypassed: true,
-            passed: true,
-            computation_time_ms: Date.now() - startTime,
-        });
+        return Result.ok(createBypassedResult(moveType, threshold, startTime));
     }
 
     try {
         // Load both frames
         const [frame1Data, frame2Data] = await Promise.all([
-            loadImageData(framePath1),
-            loadImageData(framePath2),
+            loadRawImage(framePath1),
+            loadRawImage(framePath2),
         ]);
 
-        // Verify dimensions match
-        if (frame1Data.width !== frame2Data.width ||
-            frame1Data.height !== frame2Data.height) {
-            return Result.err({
-                code: 'MAPD_DIMENSION_MISMATCH',
-                message: 'Frame dimensions do not match',
-            });
+        const result = scoreMAPD(frame1Data, frame2Data, moveType, startTime);
+
+        if (result.ok) {
+            logger.debug({
+                framePath1,
+                framePath2,
+                moveType,
+                mapdScore: result.value.mapd_score,
+                mapdPercentage: result.value.mapd_percentage,
+                threshold,
+                passed: result.value.passed,
+                computationTimeMs: result.value.computation_time_ms,
+            }, 'MAPD calculation complete');
         }
 
-        // We know dimensions are the same, total pixels determined by data length
-        const channels = 4;  // RGBA
-        let totalDiff = 0;
-        let comparedPixels = 0;
-
-        // Calculate mean absolute difference for each pixel
-        for (let i = 0; i < frame1Data.data.length; i += channels) {
-            const alpha1 = frame1Data.data[i + 3];
-            const alpha2 = frame2Data.data[i + 3];
-
-            // Skip pixels where both are transparent
-            if (alpha1 < 128 && alpha2 < 128) continue;
-
-            // Calculate per-channel absolute difference
-            for (let c = 0; c < 3; c++) {  // RGB only
-                totalDiff += Math.abs(frame1Data.data[i + c] - frame2Data.data[i + c]);
-            }
-            comparedPixels++;
-        }
-
-        // Calculate MAPD as percentage of max possible difference
-        const maxDiff = comparedPixels * 3 * 255;  // 3 channels, 255 max diff
-        const mapdScore = maxDiff > 0 ? totalDiff / maxDiff : 0;
-        const mapdPercentage = mapdScore * 100;
-        const passed = mapdScore <= threshold;
-        const computationTimeMs = Date.now() - startTime;
-
-        logger.debug({
-            framePath1,
-            framePath2,
-            moveType,
-            mapdScore,
-            mapdPercentage,
-            threshold,
-            passed,
-            computationTimeMs,
-        }, 'MAPD calculation complete');
-
-        return Result.ok({
-            mapd_score: mapdScore,
-            mapd_percentage: mapdPercentage,
-            move_type: moveType,
-            threshold,
-            bypassed: false,
-            passed,
-            computation_time_ms: computationTimeMs,
-        });
+        return result;
     } catch (error) {
         return Result.err({
             code: 'MAPD_CALCULATION_FAILED',
@@ -143,21 +104,76 @@ export async function calculateMAPD(
 }
 
 /**
- * Load image as raw RGBA buffer
+ * Calculate MAPD between two already-decoded frames
+ * Pure pixel work, safe to run inside an audit worker thread
  */
-async function loadImageData(imagePath: string): Promise<{
-    data: Buffer;
-    width: number;
-    height: number;
-}> {
-    const { data, info } = await sharp(imagePath)
-        .ensureAlpha()
-        .raw()
-        .toBuffer({ resolveWithObject: true });
+export function scoreMAPD(
+    frame1Data: RawImage,
+    frame2Data: RawImage,
+    moveType: string,
+    startTime: number = Date.now()
+): Result<MAPDResult, MAPDError> {
+    const { threshold, bypassed } = resolveMoveThreshold(moveType);
+
+    if (bypassed) {
+        return Result.ok(createBypassedResult(moveType, threshold, startTime));
+    }
+
+    // Verify dimensions match
+    if (frame1Data.width !== frame2Data.width ||
+        frame1Data.height !== frame2Data.height) {
+        return Result.err({
+            code: 'MAPD_DIMENSION_MISMATCH',
+            message: 'Frame dimensions do not match',
+        });
+    }
+
+    // We know dimensions are the same, total pixels determined by data length
+    const channels = 4;  // RGBA
+    let totalDiff = 0;
+    let comparedPixels = 0;
 
+    // Calculate mean absolute difference for each pixel
+    for (let i = 0; i < frame1Data.data.length; i += channels) {
+        const alpha1 = frame1Data.data[i + 3];
+        const alpha2 = frame2Data.data[i + 3];
+
+        // Skip pixels where both are transparent
+        if (alpha1 < 128 && alpha2 < 128) continue;
+
+        // Calculate per-channel absolute difference
+        for (let c = 0; c < 3; c++) {  // RGB only
+            totalDiff += Math.abs(frame1Data.data[i + c] - frame2Data.data[i + c]);
+        }
+        comparedPixels++;
+    }
+
+    // Calculate MAPD as percentage of max possible difference
+    const maxDiff = comparedPixels * 3 * 255;  // 3 channels, 255 max diff
+    const mapdScore = maxDiff > 0 ? totalDiff / maxDiff : 0;
+
+    return Result.ok({
+        mapd_score: mapdScore,
+        mapd_percentage: mapdScore * 100,
+        move_type: moveType,
+        threshold,
+        bypassed: false,
+        passed: mapdScore <= threshold,
+        computation_time_ms: Date.now() - startTime,
+    });
+}
+
+/**
+ * Build the pass-through result for high-motion moves
+ */
+function createBypassedResult(moveType: string, threshold: number, startTime: number): MAPDResult {
     return {
-        data,
-        width: info.width,
-        height: info.height,
+        mapd_score: 0,
+        mapd_percentage: 0,
+        move_type: moveType,
+        threshold,
+        bypassed: true,
+        passed: true,
+        computation_time_ms: Date.now() - startTime,
     };
 }
@@ -3,9 +3,9 @@
  * Per Story 3.10: Detect single pixels with no matching neighbors
  */
 
-import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 
 /**
  * Orphan pixel detection result
@@ -45,74 +45,19 @@ export async function detectOrphanPixels(
     const startTime = Date.now();
 
     try {
-        const { data, info } = await sharp(imagePath)
-            .ensureAlpha()
-            .raw()
-            .toBuffer({ resolveWithObject: true });
-
-        const { width, height, channels } = info;
-
-        let orphanCount = 0;
-        let totalOpaquePixels = 0;
-        const orphanLocations: OrphanPixelResult['orphan_locations'] = [];
-
-        // Scan internal pixels (skip 1px border)
-        for (let y = 1; y < height - 1; y++) {
-            for (let x = 1; x < width - 1; x++) {
-                const idx = (y * width + x) * channels;
-                const alpha = data[idx + 3];
-
-                // Skip transparent pixels
-                if (alpha < 128) continue;
-
-                totalOpaquePixels++;
-
-                // Check if this pixel has any identical RGBA neighbors
-                const hasMatchingNeighbor = checkNeighbors(data, x, y, width, height, channels);
-
-                if (!hasMatchingNeighbor) {
-                    orphanCount++;
-                    if (orphanLocations.length < 50) {
-                        orphanLocations.push({
-                            x,
-                            y,
-                            color: rgbToHex(data[idx], data[idx + 1], data[idx + 2]),
-                        });
-                    }
-                }
-            }
-        }
-
-        // Classify result
-        let classification: 'pass' | 'warning' | 'soft_fail';
-        if (orphanCount <= PASS_THRESHOLD) {
-            classification = 'pass';
-        } else if (orphanCount <= WARNING_THRESHOLD) {
-            classification = 'warning';
-        } else {
-            classification = 'soft_fail';
-        }
-
-        const passed = classification !== 'soft_fail';
-        const computationTimeMs = Date.now() - startTime;
+        const image = await loadRawImage(imagePath);
+        const result = scoreOrphanPixels(image, startTime);
 
         logger.debug({
             imagePath,
-            orphanCount,
-            classification,
-            totalOpaquePixels,
-            passed,
-            computationTimeMs,
+            orphanCount: result.orphan_count,
+            classification: result.classification,
+            totalOpaquePixels: result.total_opaque_pixels,
+            passed: result.passed,
+            computationTimeMs: result.computation_time_ms,
         }, 'Orphan pixel detection complete');
 
-        return Result.ok({
-            orphan_count: orphanCount,
-            classification,
-            orphan_locations: orphanLocations,
-            total_opaque_pixels: totalOpaquePixels,
-            passed,
-            computation_time_ms: computationTimeMs,
-        });
+        return Result.ok(result);
     } catch (error) {
         return Result.err({
             code: 'ORPHAN_DETECTION_FAILED',
@@ -122,11 +67,73 @@ export async function detectOrphanPixels(
     }
 }
 
+/**
+ * Detect orphan pixels in already-decoded pixels
+ * Pure pixel work, safe to run inside an audit worker thread
+ */
+export function scoreOrphanPixels(
+    image: RawImage,
+    startTime: number = Date.now()
+): OrphanPixelResult {
+    const { data, width, height } = image;
+    const channels = 4;
+
+    let orphanCount = 0;
+    let totalOpaquePixels = 0;
+    const orphanLocations: OrphanPixelResult['orphan_locations'] = [];
+
+    // Scan internal pixels (skip 1px border)
+    for (let y = 1; y < height - 1; y++) {
+        for (let x = 1; x < width - 1; x++) {
+            const idx = (y * width + x) * channels;
+            const alpha = data[idx + 3];
+
+            // Skip transparent pixels
+            if (alpha < 128) continue;
+
+            totalOpaquePixels++;
+
+            // Check if this pixel has any identical RGBA neighbors
+            const hasMatchingNeighbor = checkNeighbors(data, x, y, width, height, channels);
+
+            if (!hasMatchingNeighbor) {
+                orphanCount++;
+                if (orphanLocations.length < 50) {
+                    orphanLocations.push({
+                        x,
+                        y,
+                        color: rgbToHex(data[idx], data[idx + 1], data[idx + 2]),
+                    });
+                }
+            }
+        }
+    }
+
+    // Classify result
+    let classification: 'pass' | 'warning' | 'soft_fail';
+    if (orphanCount <= PASS_THRESHOLD) {
+        classification = 'pass';
+    } else if (orphanCount <= WARNING_THRESHOLD) {
+        classification = 'warning';
+    } else {
+        classification = 'soft_fail';
+    }
+
+    return {
+        orphan_count: orphanCount,
+        classification,
+        orphan_locations: orphanLocations,
+        total_opaque_pixels: totalOpaquePixels,
+        passed: classification !== 'soft_fail',
+        computation_time_ms: Date.now() - startTime,
+    };
+}
+
 /**
  * Check if pixel has any identical RGBA neighbors (4-connected)
  */
 function checkNeighbors(
-    data: Buffer,
+    data: Uint8Array,
     x: number,
     y: number,
     width: number,
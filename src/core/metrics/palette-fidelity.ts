@@ -6,6 +6,7 @@
 import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 import { colorDistance, hexToRgb, rgbToHex, type RGB } from '../../utils/palette-analyzer.js';
 
 /**
@@ -68,120 +69,139 @@ export async function calculatePaletteFidelity(
 
     try {
         // Load candidate image
-        const { data, info } = await sharp(candidatePath)
-            .ensureAlpha()
-            .raw()
-            .toBuffer({ resolveWithObject: true });
+        const image = await loadRawImage(candidatePath);
+        const result = scorePaletteFidelity(image, palette, threshold, tolerance, startTime);
+
+        if (result.ok) {
+            logger.debug({
+                candidatePath,
+                fidelityScore: result.value.fidelity_score,
+                matchedPixels: result.value.matched_pixels,
+                unmatchedPixels: result.value.unmatched_pixels,
+                offPaletteCount: result.value.off_palette_colors.length,
+                passed: result.value.passed,
+                computationTimeMs: result.value.computation_time_ms,
+            }, 'Palette fidelity calculation complete');
+        }
 
-        const { channels } = info;
-        const paletteRgb = palette.map(hexToRgb);
+        return result;
+    } catch (error) {
+        return Result.err({
+            code: 'PALETTE_FIDELITY_FAILED',
+            message: 'Failed to calculate palette fidelity',
+            cause: error,
+        });
+    }
+}
 
-        // Initialize counters
-        let matchedPixels = 0;
-        let unmatchedPixels = 0;
-        const colorCounts = new Map<string, number>();
-        const paletteUsage = new Map<string, number>();
+/**
+ * Calculate palette fidelity for already-decoded candidate pixels
+ * Pure pixel work, safe to run inside an audit worker thread
+ */
+export function scorePaletteFidelity(
+    image: RawImage,
+    palette: string[],  // Array of hex colors
+    threshold: number = DEFAULT_PALETTE_THRESHOLD,
+    tolerance: number = DEFAULT_TOLERANCE,
+    startTime: number = Date.now()
+): Result<PaletteFidelityResult, PaletteFidelityError> {
+    if (palette.length === 0) {
+        return Result.err({
+            code: 'PALETTE_EMPTY',
+            message: 'Cannot calculate fidelity against empty palette',
+        });
+    }
 
-        // Initialize palette usage map
-        for (const hex of palette) {
-            paletteUsage.set(hex, 0);
-        }
+    const { data } = image;
+    const channels = 4;
+    const paletteRgb = palette.map(hexToRgb);
 
-        // Analyze each pixel
-        for (let i = 0; i < data.length; i += channels) {
-            const alpha = data[i + 3];
+    // Initialize counters
+    let matchedPixels = 0;
+    let unmatchedPixels = 0;
+    const colorCounts = new Map<string, number>();
+    const paletteUsage = new Map<string, number>();
 
-            // Skip transparent pixels
-            if (alpha < 128) continue;
+    // Initialize palette usage map
+    for (const hex of palette) {
+        paletteUsage.set(hex, 0);
+    }
 
-            const pixelRgb: RGB = {
-                r: data[i],
-                g: data[i + 1],
-                b: data[i + 2],
-            };
-
-            // Find closest palette color
-            let minDistance = Infinity;
-            let closestColor = palette[0];
-
-            for (let j = 0; j < paletteRgb.length; j++) {
-                const distance = colorDistance(pixelRgb, paletteRgb[j]);
-                if (distance < minDistance) {
-                    minDistance = distance;
-                    closestColor = palette[j];
-                }
-            }
+    // Analyze each pixel
+    for (let i = 0; i < data.length; i += channels) {
+        const alpha = data[i + 3];
+
+        // Skip transparent pixels
+        if (alpha < 128) continue;
+
+        const pixelRgb: RGB = {
+            r: data[i],
+            g: data[i + 1],
+            b: data[i + 2],
+        };
 
-            if (minDistance <= tolerance) {
-                // Within tolerance - counts as palette match
-                matchedPixels++;
-                paletteUsage.set(closestColor, (paletteUsage.get(closestColor) || 0) + 1);
-            } else {
-                // Off-palette color
-                unmatchedPixels++;
-                const hex = rgbToHex(pixelRgb);
-                colorCounts.set(hex, (colorCounts.get(hex) || 0) + 1);
+        // Find closest palette color
+        let minDistance = Infinity;
+        let closestColor = palette[0];
+
+        for (let j = 0; j < paletteRgb.length; j++) {
+            const distance = colorDistance(pixelRgb, paletteRgb[j]);
+            if (distance < minDistance) {
+                minDistance = distance;
+                closestColor = palette[j];
             }
         }
 
-        const totalOpaquePixels = matchedPixels + unmatchedPixels;
-        const fidelityScore = totalOpaquePixels > 0
-            ? matchedPixels / totalOpaquePixels
-            : 1.0;
-        const fidelityPercentage = fidelityScore * 100;
-
-        // Build off-palette color list (sorted by count)
-        const offPaletteColors = Array.from(colorCounts.entries())
-            .map(([hex, count]) => ({
-                hex,
-                count,
-                percentage: (count / totalOpaquePixels) * 100,
-            }))
-            .sort((a, b) => b.count - a.count)
-            .slice(0, MAX_OFF_PALETTE_COLORS);
-
-        // Build palette coverage list
-        const paletteCoverage = Array.from(paletteUsage.entries())
-            .filter(([_, count]) => count > 0)
-            .map(([hex, count]) => ({
-                hex,
-                count,
-                percentage: (count / totalOpaquePixels) * 100,
-            }))
-            .sort((a, b) => b.count - a.count);
-
-        const passed = fidelityScore >= threshold;
-        const computationTimeMs = Date.now() - startTime;
-
-        logger.debug({
-            candidatePath,
-            fidelityScore,
-            matchedPixels,
-            unmatchedPixels,
-            offPaletteCount: offPaletteColors.length,
-            passed,
-            computationTimeMs,
-        }, 'Palette fidelity calculation complete');
-
-        return Result.ok({
-            fidelity_percentage: fidelityPercentage,
-            fidelity_score: fidelityScore,
-            matched_pixels: matchedPixels,
-            unmatched_pixels: unmatchedPixels,
-            off_palette_colors: offPaletteColors,
-            palette_coverage: paletteCoverage,
-            tolerance_used: tolerance,
-            passed,
-            threshold,
-            computation_time_ms: computationTimeMs,
-        });
-    } catch (error) {
-        return Result.err({
-            code: 'PALETTE_FIDELITY_FAILED',
-            message: 'Failed to calculate palette fidelity',
-            cause: error,
-        });
+        if (minDistance <= tolerance) {
+            // Within tolerance - counts as palette match
+            matchedPixels++;
+            paletteUsage.set(closestColor, (paletteUsage.get(closestColor) || 0) + 1);
+        } else {
+            // Off-palette color
+            unmatchedPixels++;
+            const hex = rgbToHex(pixelRgb);
+            colorCounts.set(hex, (colorCounts.get(hex) || 0) + 1);
+        }
     }
+
+    const totalOpaquePixels = matchedPixels + unmatchedPixels;
+    const fidelityScore = totalOpaquePixels > 0
+        ? matchedPixels / totalOpaquePixels
+        : 1.0;
+    const fidelityPercentage = fidelityScore * 100;
+
+    // Build off-palette color list (sorted by count)
+    const offPaletteColors = Array.from(colorCounts.entries())
+        .map(([hex, count]) => ({
+            hex,
+            count,
+            percentage: (count / totalOpaquePixels) * 100,
+        }))
+        .sort((a, b) => b.count - a.count)
+        .slice(0, MAX_OFF_PALETTE_COLORS);
+
+    // Build palette coverage list
+    const paletteCoverage = Array.from(paletteUsage.entries())
+        .filter(([_, count]) => count > 0)
+        .map(([hex, count]) => ({
+            hex,
+            count,
+            percentage: (count / totalOpaquePixels) * 100,
+        }))
+        .sort((a, b) => b.count - a.count);
+
+    return Result.ok({
+        fidelity_percentage: fidelityPercentage,
+        fidelity_score: fidelityScore,
+        matched_pixels: matchedPixels,
+        unmatched_pixels: unmatchedPixels,
+        off_palette_colors: offPaletteColors,
+        palette_coverage: paletteCoverage,
+        tolerance_used: tolerance,
+        passed: fidelityScore >= threshold,
+        threshold,
+        computation_time_ms: Date.now() - startTime,
+    });
 }
 
 /**
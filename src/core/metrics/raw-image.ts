@@ -0,0 +1,82 @@
+/**
+ * Raw image helpers - decoded RGBA buffers consumed by the metric calculators
+ * Per Stories 3.4-3.10: Pixel loops operate on raw RGBA, decoded once per frame
+ */
+
+import sharp from 'sharp';
+
+/**
+ * Decoded RGBA image (always 4 channels)
+ */
+export interface RawImage {
+    data: Uint8Array;
+    width: number;
+    height: number;
+}
+
+/**
+ * Load image as raw RGBA buffer
+ */
+export async function loadRawImage(imagePath: string): Promise<RawImage> {
+    const { data, info } = await sharp(imagePath)
+        .ensureAlpha()
+        .raw()
+        .toBuffer({ resolveWithObject: true });
+
+    return {
+        data,
+        width: info.width,
+        height: info.height,
+    };
+}
+
+/**
+ * Copy pixel data into a SharedArrayBuffer so it can be handed to worker
+ * threads without a per-message copy. Already-shared images are returned as-is.
+ */
+export function toSharedRawImage(image: RawImage): RawImage {
+    if (image.data.buffer instanceof SharedArrayBuffer) {
+        return image;
+    }
+
+    const shared = new Uint8Array(new SharedArrayBuffer(image.data.byteLength));
+    shared.set(image.data);
+
+    return {
+        data: shared,
+        width: image.width,
+        height: image.height,
+    };
+}
+
+/**
+ * Downsample by an integer factor using nearest-neighbor sampling.
+ * Keeps exact palette colors, matching the pipeline's pixel-art downsample.
+ */
+export function downsampleRawImage(image: RawImage, factor: number): RawImage {
+    if (factor <= 1) {
+        return image;
+    }
+
+    const width = Math.max(1, Math.floor(image.width / factor));
+    const height = Math.max(1, Math.floor(image.height / factor));
+    const data = new Uint8Array(width * height * 4);
+
+    // Sample the center of each block so single-pixel borders don't dominate
+    const centerOffset = Math.floor(factor / 2);
+
+    for (let y = 0; y < height; y++) {
+        const srcY = Math.min(image.height - 1, y * factor + centerOffset);
+        for (let x = 0; x < width; x++) {
+            const srcX = Math.min(image.width - 1, x * factor + centerOffset);
+            const srcIdx = (srcY * image.width + srcX) * 4;
+            const dstIdx = (y * width + x) * 4;
+            data[dstIdx] = image.data[srcIdx];
+            data[dstIdx + 1] = image.data[srcIdx + 1];
+            data[dstIdx + 2] = image.data[srcIdx + 2];
+            data[dstIdx + 3] = image.data[srcIdx + 3];
+        }
+    }
+
+    return { data, width, height };
+}
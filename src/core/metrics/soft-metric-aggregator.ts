@@ -4,6 +4,7 @@
  */
 
 import { logger } from '../../utils/logger.js';
+import { isCalibratedEmbeddingBackend } from './identity-embedding.js';
 
 /**
  * Individual metric scores (inputs to aggregator)
@@ -11,6 +12,8 @@ import { logger } from '../../utils/logger.js';
 export interface MetricInputs {
     stability?: number;   // 0.0 - 1.0
     identity?: number;    // SSIM score 0.0 - 1.0
+    dino_similarity?: number;   // Embedding similarity 0.0 - 1.0 (replaces SSIM for calibrated backends)
+    identity_backend?: string;  // EmbeddingBackend id that produced dino_similarity
     palette?: number;     // Fidelity score 0.0 - 1.0
     style?: number;       // Style consistency 0.0 - 1.0
 }
@@ -33,6 +36,7 @@ export interface CompositeScore {
         style: number;
     };
     metrics_provided: string[];
+    identity_source?: string;       // 'ssim', or the embedding backend id
     passed: boolean;
     threshold: number;
     should_retry: boolean;
@@ -47,7 +51,7 @@ const DEFAULT_WEIGHTS = {
 };
 
 // Default composite threshold
-const DEFAULT_COMPOSITE_THRESHOLD = 0.70;
+export const DEFAULT_COMPOSITE_THRESHOLD = 0.70;
 
 /**
  * Calculate composite score from individual metrics
@@ -77,8 +81,19 @@ export function calculateCompositeScore(
         totalWeight += weights.stability;
     }
 
-    if (metrics.identity !== undefined) {
+    // Embedding similarity replaces SSIM as the identity signal only when it
+    // comes from a calibrated (ONNX) backend; descriptor scores are ignored
+    let identitySource: CompositeScore['identity_source'];
+    const identityBackend = metrics.identity_backend;
+    if (metrics.dino_similarity !== undefined && identityBackend && isCalibratedEmbeddingBackend(identityBackend)) {
+        metricsProvided.push('dino_similarity');
+        identitySource = identityBackend;
+        weightedScores.identity = metrics.dino_similarity * weights.identity;
+        weightedSum += weightedScores.identity;
+        totalWeight += weights.identity;
+    } else if (metrics.identity !== undefined) {
         metricsProvided.push('identity');
+        identitySource = 'ssim';
         weightedScores.identity = metrics.identity * weights.identity;
         weightedSum += weightedScores.identity;
         totalWeight += weights.identity;
@@ -116,6 +131,7 @@ export function calculateCompositeScore(
         weighted_scores: weightedScores,
         weights_used: weights,
         metrics_provided: metricsProvided,
+        identity_source: identitySource,
         passed,
         threshold,
         should_retry: shouldRetry,
@@ -3,9 +3,9 @@
  * Per Story 3.4: Compare candidate frames against anchor using SSIM
  */
 
-import sharp from 'sharp';
 import { Result } from '../config-resolver.js';
 import { logger } from '../../utils/logger.js';
+import { loadRawImage, type RawImage } from './raw-image.js';
 
 /**
  * SSIM calculation result
@@ -45,7 +45,7 @@ const C1 = (K1 * L) ** 2;
 const C2 = (K2 * L) ** 2;
 
 // Default window size
-const WINDOW_SIZE = 11;
+export const WINDOW_SIZE = 11;
 
 // Default identity threshold
 const DEFAULT_IDENTITY_THRESHOLD = 0.85;
@@ -63,73 +63,25 @@ export async function calculateSSIM(
     try {
         // Load both images
         const [candidateData, anchorData] = await Promise.all([
-            loadImageData(candidatePath),
-            loadImageData(anchorPath),
+            loadRawImage(candidatePath),
+            loadRawImage(anchorPath),
         ]);
 
-        // Verify dimensions match
-        if (candidateData.width !== anchorData.width ||
-            candidateData.height !== anchorData.height) {
-            return Result.err({
-                code: 'SSIM_DIMENSION_MISMATCH',
-                message: `Dimensions don't match: ${candidateData.width}x${candidateData.height} vs ${anchorData.width}x${anchorData.height}`,
-            });
+        const result = scoreSSIM(candidateData, anchorData, threshold, startTime);
+
+        if (result.ok) {
+            logger.debug({
+                candidatePath,
+                anchorPath,
+                score: result.value.score,
+                channelScores: result.value.channel_scores,
+                passed: result.value.passed,
+                threshold,
+                computationTimeMs: result.value.computation_time_ms,
+            }, 'SSIM calculation complete');
         }
 
-        const { width, height } = candidateData;
-        const totalPixels = width * height;
-
-        // Calculate per-channel SSIM with mask-aware comparison
-        const channelScores = {
-            r: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 0),
-            g: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 1),
-            b: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 2),
-            a: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 3),
-        };
-
-        // Composite score (weighted average, emphasizing luminance/color over alpha)
-        const score = (
-            channelScores.r * 0.3 +
-            channelScores.g * 0.4 +  // Green carries more visual weight
-            channelScores.b * 0.2 +
-            channelScores.a * 0.1
-        );
-
-        // Count compared pixels (where both have alpha > 0)
-        let comparedPixels = 0;
-        for (let i = 0; i < totalPixels; i++) {
-            const cidx = i * 4 + 3;
-            const aidx = i * 4 + 3;
-            if (candidateData.data[cidx] > 0 && anchorData.data[aidx] > 0) {
-                comparedPixels++;
-            }
-        }
-
-        const computationTimeMs = Date.now() - startTime;
-        const passed = score >= threshold;
-
-        logger.debug({
-            candidatePath,
-            anchorPath,
-            score,
-            channelScores,
-            passed,
-            threshold,
-            computationTimeMs,
-        }, 'SSIM calculation complete');
-
-        return Result.ok({
-            score,
-            channel_scores: channelScores,
-            comparison_area: {
-                total_pixels: totalPixels,
-                compared_pixels: comparedPixels,
-                percentage: (comparedPixels / totalPixels) * 100,
-            },
-            computation_time_ms: computationTimeMs,
-            passed,
-            threshold,
-        });
+        return result;
     } catch (error) {
         return Result.err({
             code: 'SSIM_CALCULATION_FAILED',
@@ -140,23 +92,65 @@ export async function calculateSSIM(
 }
 
 /**
- * Load image as raw RGBA buffer
+ * Calculate SSIM between already-decoded candidate and anchor pixels
+ * Pure pixel work, safe to run inside an audit worker thread
  */
-async function loadImageData(imagePath: string): Promise<{
-    data: Buffer;
-    width: number;
-    height: number;
-}> {
-    const { data, info } = await sharp(imagePath)
-        .ensureAlpha()
-        .raw()
-        .toBuffer({ resolveWithObject: true });
-
-    return {
-        data,
-        width: info.width,
-        height: info.height,
+export function scoreSSIM(
+    candidateData: RawImage,
+    anchorData: RawImage,
+    threshold: number = DEFAULT_IDENTITY_THRESHOLD,
+    startTime: number = Date.now()
+): Result<SSIMResult, SSIMError> {
+    // Verify dimensions match
+    if (candidateData.width !== anchorData.width ||
+        candidateData.height !== anchorData.height) {
+        return Result.err({
+            code: 'SSIM_DIMENSION_MISMATCH',
+            message: `Dimensions don't match: ${candidateData.width}x${candidateData.height} vs ${anchorData.width}x${anchorData.height}`,
+        });
+    }
+
+    const { width, height } = candidateData;
+    const totalPixels = width * height;
+
+    // Calculate per-channel SSIM with mask-aware comparison
+    const channelScores = {
+        r: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 0),
+        g: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 1),
+        b: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 2),
+        a: calculateChannelSSIM(candidateData.data, anchorData.data, width, height, 3),
     };
+
+    // Composite score (weighted average, emphasizing luminance/color over alpha)
+    const score = (
+        channelScores.r * 0.3 +
+        channelScores.g * 0.4 +  // Green carries more visual weight
+        channelScores.b * 0.2 +
+        channelScores.a * 0.1
+    );
+
+    // Count compared pixels (where both have alpha > 0)
+    let comparedPixels = 0;
+    for (let i = 0; i < totalPixels; i++) {
+        const cidx = i * 4 + 3;
+        const aidx = i * 4 + 3;
+        if (candidateData.data[cidx] > 0 && anchorData.data[aidx] > 0) {
+            comparedPixels++;
+        }
+    }
+
+    return Result.ok({
+        score,
+        channel_scores: channelScores,
+        comparison_area: {
+            total_pixels: totalPixels,
+            compared_pixels: comparedPixels,
+            percentage: (comparedPixels / totalPixels) * 100,
+        },
+        computation_time_ms: Date.now() - startTime,
+        passed: score >= threshold,
+        threshold,
+    });
 }
 
 /**
@@ -164,8 +158,8 @@ async function loadImageData(imagePath: string): Promise<{
  * More efficient than sliding window for pixel art
  */
 function calculateChannelSSIM(
-    candidateData: Buffer,
-    anchorData: Buffer,
+    candidateData: Uint8Array,
+    anchorData: Uint8Array,
     width: number,
     height: number,
     channelOffset: number
@@ -211,21 +205,34 @@ function calculateChannelSSIM(
 
             if (count < 4) continue; // Skip mostly transparent blocks
 
-            const meanX = sumX / count;
-            const meanY = sumY / count;
-            const varX = (sumX2 / count) - (meanX * meanX);
-            const varY = (sumY2 / count) - (meanY * meanY);
-            const covXY = (sumXY / count) - (meanX * meanY);
-
-            // SSIM formula
-            const numerator = (2 * meanX * meanY + C1) * (2 * covXY + C2);
-            const denominator = (meanX * meanX + meanY * meanY + C1) * (varX + varY + C2);
-
-            const blockSSIM = denominator > 0 ? numerator / denominator : 1;
-            totalSSIM += blockSSIM;
+            totalSSIM += blockSSIM(sumX, sumY, sumX2, sumY2, sumXY, count);
             validBlocks++;
         }
     }
 
     return validBlocks > 0 ? totalSSIM / validBlocks : 1.0;
 }
+
+/**
+ * SSIM for one block from its running sums
+ */
+export function blockSSIM(
+    sumX: number,
+    sumY: number,
+    sumX2: number,
+    sumY2: number,
+    sumXY: number,
+    count: number
+): number {
+    const meanX = sumX / count;
+    const meanY = sumY / count;
+    const varX = (sumX2 / count) - (meanX * meanX);
+    const varY = (sumY2 / count) - (meanY * meanY);
+    const covXY = (sumXY / count) - (meanX * meanY);
+
+    // SSIM formula
+    const numerator = (2 * meanX * meanY + C1) * (2 * covXY + C2);
+    const denominator = (meanX * meanX + meanY * meanY + C1) * (varX + varY + C2);
+
+    return denominator > 0 ? numerator / denominator : 1;
+}
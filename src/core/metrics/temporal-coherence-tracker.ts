@@ -0,0 +1,362 @@
+/**
+ * Temporal Coherence Tracker - rolling per-move frame-to-frame coherence
+ * Per SF-04 (FRAME_COHERENCE): frame SSIM and MAPD flicker checks, computed
+ * incrementally against the previous approved frame kept in memory.
+ */
+
+import { Result } from '../config-resolver.js';
+import { logger } from '../../utils/logger.js';
+import { SF04_TEMPORAL_FLICKER } from '../../domain/reason-codes.js';
+import type { RawImage } from './raw-image.js';
+import { blockSSIM, WINDOW_SIZE } from './ssim-calculator.js';
+import { resolveMoveThreshold } from './mapd-calculator.js';
+
+/**
+ * Coherence of one candidate against the previous approved frame
+ */
+export interface CoherenceScore {
+    has_reference: boolean;         // False for the first frame of a move
+    frame_ssim: number;             // Luma SSIM vs previous frame, 0.0 - 1.0
+    mapd_score: number;             // 0.0 - 1.0
+    mapd_threshold: number;
+    bypassed: boolean;              // True if high-motion move
+    flicker_detected: boolean;
+    hard_floor_breached: boolean;   // frame_ssim below the SF-04 hard floor
+    reason_codes: string[];
+    passed: boolean;
+    computation_time_ms: number;
+}
+
+/**
+ * Move-level coherence statistics, maintained incrementally
+ */
+export interface MoveCoherenceStatistics {
+    move_type: string;
+    frames_tracked: number;
+    transitions: number;
+    frame_ssim: { mean: number; min: number; stddev: number };
+    mapd: { mean: number; max: number; stddev: number };
+    flicker_transitions: number;
+    flicker_rate: number;           // flicker_transitions / transitions
+    loop_closure?: CoherenceScore;  // Last frame vs first, for looping moves
+    passed: boolean;
+}
+
+/**
+ * Error for coherence tracking
+ */
+export interface CoherenceError {
+    code: string;
+    message: string;
+    cause?: unknown;
+}
+
+/**
+ * Tracker thresholds
+ */
+export interface CoherenceTrackerOptions {
+    frameSsimMin?: number;      // Soft fail below this
+    frameSsimFloor?: number;    // Hard floor
+    isLoop?: boolean;           // Keep first frame for loop closure
+}
+
+// SF-04 thresholds: soft fail frame_ssim < 0.85, hard floor < 0.70
+const DEFAULT_FRAME_SSIM_MIN = 0.85;
+const DEFAULT_FRAME_SSIM_FLOOR = 0.70;
+
+/**
+ * Frame cached for comparison: pixels plus precomputed luma plane
+ */
+interface CachedFrame {
+    image: RawImage;
+    luma: Uint8Array;
+}
+
+/**
+ * Running mean/variance (Welford)
+ */
+interface RunningStat {
+    count: number;
+    mean: number;
+    m2: number;
+}
+
+/**
+ * Rolling coherence tracker for a single move
+ */
+export class TemporalCoherenceTracker {
+    private readonly moveType: string;
+    private readonly frameSsimMin: number;
+    private readonly frameSsimFloor: number;
+    private readonly isLoop: boolean;
+    private readonly mapdThreshold: number;
+    private readonly bypassed: boolean;
+
+    private previous: CachedFrame | null = null;
+    private first: CachedFrame | null = null;
+    private framesTracked = 0;
+    private flickerTransitions = 0;
+    private ssimStat: RunningStat = { count: 0, mean: 0, m2: 0 };
+    private mapdStat: RunningStat = { count: 0, mean: 0, m2: 0 };
+    private minFrameSsim = 1;
+    private maxMapd = 0;
+
+    constructor(moveType: string, options: CoherenceTrackerOptions = {}) {
+        this.moveType = moveType;
+        this.frameSsimMin = options.frameSsimMin ?? DEFAULT_FRAME_SSIM_MIN;
+        this.frameSsimFloor = options.frameSsimFloor ?? DEFAULT_FRAME_SSIM_FLOOR;
+        this.isLoop = options.isLoop ?? false;
+
+        const { threshold, bypassed } = resolveMoveThreshold(moveType);
+        this.mapdThreshold = threshold;
+        this.bypassed = bypassed;
+    }
+
+    /**
+     * Score a candidate against the previous approved frame (one pass)
+     */
+    scoreCandidate(candidate: RawImage): Result<CoherenceScore, CoherenceError> {
+        if (!this.previous) {
+            return Result.ok(this.createNoReferenceScore());
+        }
+        return this.compare(this.previous, candidate);
+    }
+
+    /**
+     * Record an approved frame: it becomes the new reference and its
+     * transition is folded into the move statistics.
+     */
+    commitFrame(frame: RawImage, score?: CoherenceScore): Result<CoherenceScore, CoherenceError> {
+        let transition = score;
+        if (!transition) {
+            const scored = this.scoreCandidate(frame);
+            if (!scored.ok) return scored;
+            transition = scored.value;
+        }
+
+        if (transition.has_reference) {
+            pushStat(this.ssimStat, transition.frame_ssim);
+            pushStat(this.mapdStat, transition.mapd_score);
+            this.minFrameSsim = Math.min(this.minFrameSsim, transition.frame_ssim);
+            this.maxMapd = Math.max(this.maxMapd, transition.mapd_score);
+            if (transition.flicker_detected) {
+                this.flickerTransitions++;
+            }
+        }
+
+        const cached: CachedFrame = { image: frame, luma: computeLuma(frame) };
+        this.previous = cached;
+        if (this.isLoop && !this.first) {
+            this.first = cached;
+        }
+        this.framesTracked++;
+
+        logger.debug({
+            moveType: this.moveType,
+            framesTracked: this.framesTracked,
+            frameSsim: transition.frame_ssim,
+            mapdScore: transition.mapd_score,
+            flickerDetected: transition.flicker_detected,
+        }, 'Coherence tracker frame committed');
+
+        return Result.ok(transition);
+    }
+
+    /**
+     * Move-level statistics. O(1) apart from the loop-closure comparison.
+     */
+    getStatistics(): Result<MoveCoherenceStatistics, CoherenceError> {
+        let loopClosure: CoherenceScore | undefined;
+        if (this.isLoop && this.first && this.previous && this.framesTracked > 1) {
+            const closure = this.compare(this.previous, this.first.image, this.first.luma);
+            if (!closure.ok) return closure;
+            loopClosure = closure.value;
+        }
+
+        const transitions = this.ssimStat.count;
+
+        return Result.ok({
+            move_type: this.moveType,
+            frames_tracked: this.framesTracked,
+            transitions,
+            frame_ssim: {
+                mean: transitions > 0 ? this.ssimStat.mean : 1,
+                min: this.minFrameSsim,
+                stddev: stddev(this.ssimStat),
+            },
+            mapd: {
+                mean: this.mapdStat.mean,
+                max: this.maxMapd,
+                stddev: stddev(this.mapdStat),
+            },
+            flicker_transitions: this.flickerTransitions,
+            flicker_rate: transitions > 0 ? this.flickerTransitions / transitions : 0,
+            loop_closure: loopClosure,
+            passed: this.flickerTransitions === 0 && (loopClosure?.passed ?? true),
+        });
+    }
+
+    /**
+     * Drop cached frames and statistics (e.g., when a move is restarted)
+     */
+    reset(): void {
+        this.previous = null;
+        this.first = null;
+        this.framesTracked = 0;
+        this.flickerTransitions = 0;
+        this.ssimStat = { count: 0, mean: 0, m2: 0 };
+        this.mapdStat = { count: 0, mean: 0, m2: 0 };
+        this.minFrameSsim = 1;
+        this.maxMapd = 0;
+    }
+
+    /**
+     * Single pass over both frames: luma block SSIM and RGB MAPD together
+     */
+    private compare(
+        reference: CachedFrame,
+        candidate: RawImage,
+        candidateLuma?: Uint8Array
+    ): Result<CoherenceScore, CoherenceError> {
+        const startTime = Date.now();
+        const { width, height } = candidate;
+
+        if (reference.image.width !== width || reference.image.height !== height) {
+            return Result.err({
+                code: 'COHERENCE_DIMENSION_MISMATCH',
+                message: `Dimensions don't match: ${width}x${height} vs ${reference.image.width}x${reference.image.height}`,
+            });
+        }
+
+        const ref = reference.image.data;
+        const cand = candidate.data;
+        const refLuma = reference.luma;
+
+        // Non-overlapping blocks, same layout as calculateSSIM
+        const blockSize = Math.min(WINDOW_SIZE, Math.min(width, height));
+        const blocksX = Math.max(1, Math.floor(width / blockSize));
+        const blocksY = Math.max(1, Math.floor(height / blockSize));
+        const blockCount = blocksX * blocksY;
+        const sumX = new Float64Array(blockCount);
+        const sumY = new Float64Array(blockCount);
+        const sumX2 = new Float64Array(blockCount);
+        const sumY2 = new Float64Array(blockCount);
+        const sumXY = new Float64Array(blockCount);
+        const counts = new Uint32Array(blockCount);
+
+        let totalDiff = 0;
+        let comparedPixels = 0;
+
+        for (let y = 0; y < height; y++) {
+            const by = Math.floor(y / blockSize);
+            for (let x = 0; x < width; x++) {
+                const p = y * width + x;
+                const idx = p * 4;
+
+                // Skip pixels where both are transparent
+                if (ref[idx + 3] < 128 && cand[idx + 3] < 128) continue;
+
+                totalDiff += Math.abs(ref[idx] - cand[idx]) +
+                    Math.abs(ref[idx + 1] - cand[idx + 1]) +
+                    Math.abs(ref[idx + 2] - cand[idx + 2]);
+                comparedPixels++;
+
+                const bx = Math.floor(x / blockSize);
+                if (bx >= blocksX || by >= blocksY) continue;
+
+                const b = by * blocksX + bx;
+                const lx = refLuma[p];
+                const ly = candidateLuma ? candidateLuma[p] : lumaAt(cand, idx);
+                sumX[b] += lx;
+                sumY[b] += ly;
+                sumX2[b] += lx * lx;
+                sumY2[b] += ly * ly;
+                sumXY[b] += lx * ly;
+                counts[b]++;
+            }
+        }
+
+        let totalSSIM = 0;
+        let validBlocks = 0;
+        for (let b = 0; b < blockCount; b++) {
+            if (counts[b] < 4) continue; // Skip mostly transparent blocks
+            totalSSIM += blockSSIM(sumX[b], sumY[b], sumX2[b], sumY2[b], sumXY[b], counts[b]);
+            validBlocks++;
+        }
+
+        const frameSsim = validBlocks > 0 ? totalSSIM / validBlocks : 1.0;
+        const maxDiff = comparedPixels * 3 * 255;
+        const mapdScore = maxDiff > 0 ? totalDiff / maxDiff : 0;
+
+        const hardFloorBreached = !this.bypassed && frameSsim < this.frameSsimFloor;
+        const flickerDetected = !this.bypassed &&
+            (frameSsim < this.frameSsimMin || mapdScore > this.mapdThreshold);
+
+        return Result.ok({
+            has_reference: true,
+            frame_ssim: frameSsim,
+            mapd_score: mapdScore,
+            mapd_threshold: this.mapdThreshold,
+            bypassed: this.bypassed,
+            flicker_detected: flickerDetected,
+            hard_floor_breached: hardFloorBreached,
+            reason_codes: flickerDetected ? [SF04_TEMPORAL_FLICKER] : [],
+            passed: !flickerDetected,
+            computation_time_ms: Date.now() - startTime,
+        });
+    }
+
+    /**
+     * Score for the first frame of a move (nothing to compare against)
+     */
+    private createNoReferenceScore(): CoherenceScore {
+        return {
+            has_reference: false,
+            frame_ssim: 1,
+            mapd_score: 0,
+            mapd_threshold: this.mapdThreshold,
+            bypassed: this.bypassed,
+            flicker_detected: false,
+            hard_floor_breached: false,
+            reason_codes: [],
+            passed: true,
+            computation_time_ms: 0,
+        };
+    }
+}
+
+/**
+ * Rec. 601 luma of one RGBA pixel (integer approximation)
+ */
+function lumaAt(data: Uint8Array, idx: number): number {
+    return (77 * data[idx] + 150 * data[idx + 1] + 29 * data[idx + 2]) >> 8;
+}
+
+/**
+ * Precompute the luma plane of a frame
+ */
+function computeLuma(image: RawImage): Uint8Array {
+    const pixels = image.width * image.height;
+    const luma = new Uint8Array(pixels);
+    for (let p = 0; p < pixels; p++) {
+        luma[p] = lumaAt(image.data, p * 4);
+    }
+    return luma;
+}
+
+/**
+ * Fold a value into a running statistic
+ */
+function pushStat(stat: RunningStat, value: number): void {
+    stat.count++;
+    const delta = value - stat.mean;
+    stat.mean += delta / stat.count;
+    stat.m2 += delta * (value - stat.mean);
+}
+
+/**
+ * Population standard deviation of a running statistic
+ */
+function stddev(stat: RunningStat): number {
+    return stat.count > 0 ? Math.sqrt(stat.m2 / stat.count) : 0;
+}
@@ -562,9 +562,9 @@ async function executeApproving(
     const approvedFilename = `frame_${frameIndex.toString().padStart(4, '0')}.png`;
     const approvedPath = join(ctx.runPaths.approved, approvedFilename);
 
-    // In production, copy file to approved folder
+    // In production, link file into approved folder via the blob store
     // For now, just update state
-    // await fs.copyFile(candidatePath, approvedPath);
+    // await getBlobStore(ctx.runPaths.runsDir).linkFile(candidatePath, approvedPath);
 
     // Mark frame approved
     ctx.state = markFrameApproved(ctx.state, frameIndex, approvedPath) as RunStateWithAttempts;
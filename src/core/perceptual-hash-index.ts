@@ -0,0 +1,344 @@
+/**
+ * Perceptual hash index - detects duplicate candidate frames across rerolls
+ * Consulted right after generateFrame: near-duplicates force a fresh seed
+ * instead of re-running the pipeline. An earlier audit verdict is reused
+ * only for byte-identical candidates; an 8x8 hash can't see the small
+ * fixes (orphan pixels, halo, off-palette pixels) a retry exists to make.
+ */
+
+import { promises as fs } from 'fs';
+import { createHash } from 'crypto';
+import sharp from 'sharp';
+import { Result } from './config-resolver.js';
+import { writeJsonAtomic } from '../utils/fs-helpers.js';
+import { logger } from '../utils/logger.js';
+
+/**
+ * Audit verdict stored alongside a hashed candidate
+ */
+export interface HashedVerdict {
+    passed: boolean;
+    reasonCodes: string[];
+    compositeScore?: number;
+}
+
+/**
+ * Indexed candidate
+ */
+export interface HashIndexEntry {
+    hash: string;               // 64-bit dHash as 16 hex chars
+    contentDigest?: string;     // SHA-256 of the candidate file (exact-match verdict reuse)
+    runId: string;
+    characterId: string;
+    moveId: string;
+    frameIndex: number;
+    attemptIndex: number;
+    candidatePath: string;
+    verdict?: HashedVerdict;
+    recordedAt: string;
+}
+
+/**
+ * Identifies the candidate being checked
+ */
+export interface HashCandidateContext {
+    runId: string;
+    characterId: string;
+    moveId: string;
+    frameIndex: number;
+    attemptIndex: number;
+}
+
+/**
+ * Outcome of a duplicate check
+ */
+export interface DuplicateCheck {
+    hash: string;
+    duplicate: boolean;
+    match?: HashIndexEntry;
+    distance?: number;
+    action: 'none' | 'reuse_verdict' | 'reroll_seed';
+    suggestedSeedSalt?: number;     // Pass as GeneratorContext.seedSalt when rerolling
+}
+
+/**
+ * Error for perceptual hashing
+ */
+export interface PerceptualHashError {
+    code: string;
+    message: string;
+    cause?: unknown;
+}
+
+/**
+ * Identifies an indexed candidate when attaching a verdict
+ */
+export type HashCandidateKey = Pick<HashCandidateContext, 'runId' | 'moveId' | 'frameIndex' | 'attemptIndex'>;
+
+/**
+ * Index configuration
+ */
+export interface PerceptualHashIndexOptions {
+    scope?: 'run' | 'character';    // 'character' matches across runs of the same character
+    maxDistance?: number;           // Hamming distance that still counts as duplicate (reroll only)
+}
+
+/**
+ * Persisted index file shape
+ */
+interface HashIndexFile {
+    version: 1;
+    entries: HashIndexEntry[];
+}
+
+// dHash grid: 9x8 greyscale yields 8x8 = 64 gradient bits
+const HASH_WIDTH = 9;
+const HASH_HEIGHT = 8;
+// Near-identical threshold for rerolls: up to 4 of 64 bits may differ
+const DEFAULT_MAX_DISTANCE = 4;
+// Transparent areas are flattened onto mid-grey so dark and light sprites both hash
+const FLATTEN_BACKGROUND = { r: 128, g: 128, b: 128 };
+
+/**
+ * Compute a 64-bit difference hash (dHash) for an image (path or encoded buffer)
+ */
+export async function computeDHash(image: string | Buffer): Promise<Result<string, PerceptualHashError>> {
+    try {
+        const pixels = await sharp(image)
+            .flatten({ background: FLATTEN_BACKGROUND })
+            .greyscale()
+            .resize(HASH_WIDTH, HASH_HEIGHT, { fit: 'fill' })
+            .raw()
+            .toBuffer();
+
+        // Two 32-bit halves keep the math in plain numbers
+        let high = 0;
+        let low = 0;
+        let bit = 0;
+        for (let y = 0; y < HASH_HEIGHT; y++) {
+            for (let x = 0; x < HASH_WIDTH - 1; x++) {
+                const brighter = pixels[y * HASH_WIDTH + x] < pixels[y * HASH_WIDTH + x + 1] ? 1 : 0;
+                if (bit < 32) {
+                    high = ((high << 1) | brighter) >>> 0;
+                } else {
+                    low = ((low << 1) | brighter) >>> 0;
+                }
+                bit++;
+            }
+        }
+
+        return Result.ok(high.toString(16).padStart(8, '0') + low.toString(16).padStart(8, '0'));
+    } catch (error) {
+        return Result.err({
+            code: 'PHASH_FAILED',
+            message: typeof image === 'string'
+                ? `Failed to compute perceptual hash: ${image}`
+                : 'Failed to compute perceptual hash',
+            cause: error,
+        });
+    }
+}
+
+/**
+ * Hamming distance between two 16-hex-char hashes
+ */
+export function hammingDistance(a: string, b: string): number {
+    return popcount32(parseInt(a.slice(0, 8), 16) ^ parseInt(b.slice(0, 8), 16)) +
+        popcount32(parseInt(a.slice(8, 16), 16) ^ parseInt(b.slice(8, 16), 16));
+}
+
+/**
+ * Count set bits in a 32-bit integer
+ */
+function popcount32(value: number): number {
+    let v = value >>> 0;
+    v = v - ((v >>> 1) & 0x55555555);
+    v = (v & 0x33333333) + ((v >>> 2) & 0x33333333);
+    return (((v + (v >>> 4)) & 0x0F0F0F0F) * 0x01010101) >>> 24;
+}
+
+/**
+ * Perceptual hash index of generated candidates
+ */
+export class PerceptualHashIndex {
+    private readonly scope: 'run' | 'character';
+    private readonly maxDistance: number;
+    private readonly entries: HashIndexEntry[];
+
+    constructor(options: PerceptualHashIndexOptions = {}, entries: HashIndexEntry[] = []) {
+        this.scope = options.scope ?? 'run';
+        this.maxDistance = options.maxDistance ?? DEFAULT_MAX_DISTANCE;
+        this.entries = [...entries];
+    }
+
+    /**
+     * Hash a freshly generated candidate, look for a near-duplicate of the
+     * same frame, and record the candidate in the index.
+     * An audited byte-identical candidate reuses its verdict; any other
+     * near-duplicate only triggers a reroll.
+     */
+    async check(
+        candidatePath: string,
+        context: HashCandidateContext
+    ): Promise<Result<DuplicateCheck, PerceptualHashError>> {
+        let content: Buffer;
+        try {
+            content = await fs.readFile(candidatePath);
+        } catch (error) {
+            return Result.err({
+                code: 'PHASH_FAILED',
+                message: `Failed to compute perceptual hash: ${candidatePath}`,
+                cause: error,
+            });
+        }
+
+        const hashResult = await computeDHash(content);
+        if (!hashResult.ok) {
+            return Result.err({ ...hashResult.error, message: `${hashResult.error.message}: ${candidatePath}` });
+        }
+
+        const hash = hashResult.value;
+        const contentDigest = createHash('sha256').update(content).digest('hex');
+        const exact = this.findAuditedCopy(contentDigest, context);
+        const found = exact
+            ? { entry: exact, distance: hammingDistance(hash, exact.hash) }
+            : this.findMatch(hash, context);
+
+        this.entries.push({
+            hash,
+            contentDigest,
+            ...context,
+            candidatePath,
+            recordedAt: new Date().toISOString(),
+        });
+
+        if (!found) {
+            return Result.ok({ hash, duplicate: false, action: 'none' });
+        }
+
+        const action = exact ? 'reuse_verdict' : 'reroll_seed';
+
+        logger.info({
+            frameIndex: context.frameIndex,
+            attemptIndex: context.attemptIndex,
+            matchRunId: found.entry.runId,
+            matchAttempt: found.entry.attemptIndex,
+            distance: found.distance,
+            action,
+        }, `Duplicate candidate detected for frame ${context.frameIndex}`);
+
+        return Result.ok({
+            hash,
+            duplicate: true,
+            match: found.entry,
+            distance: found.distance,
+            action,
+            suggestedSeedSalt: this.countFrameEntries(context),
+        });
+    }
+
+    /**
+     * Find the closest indexed candidate of the same frame within maxDistance
+     */
+    findMatch(
+        hash: string,
+        context: HashCandidateContext
+    ): { entry: HashIndexEntry; distance: number } | null {
+        let best: { entry: HashIndexEntry; distance: number } | null = null;
+
+        for (const entry of this.entries) {
+            if (!this.isSameFrame(entry, context)) continue;
+
+            const distance = hammingDistance(hash, entry.hash);
+            if (distance <= this.maxDistance && (!best || distance < best.distance)) {
+                best = { entry, distance };
+            }
+        }
+
+        return best;
+    }
+
+    /**
+     * Attach the audit verdict to an indexed candidate
+     */
+    recordVerdict(candidate: HashCandidateKey, verdict: HashedVerdict): boolean {
+        const entry = this.entries.find(e =>
+            e.runId === candidate.runId
+            && e.moveId === candidate.moveId
+            && e.frameIndex === candidate.frameIndex
+            && e.attemptIndex === candidate.attemptIndex
+        );
+        if (!entry) {
+            return false;
+        }
+        entry.verdict = verdict;
+        return true;
+    }
+
+    /**
+     * Number of indexed candidates
+     */
+    get size(): number {
+        return this.entries.length;
+    }
+
+    /**
+     * Persist the index atomically
+     */
+    async save(indexPath: string): Promise<void> {
+        const file: HashIndexFile = { version: 1, entries: this.entries };
+        await writeJsonAtomic(indexPath, file);
+    }
+
+    /**
+     * Candidates are comparable when they target the same frame
+     */
+    private isSameFrame(entry: HashIndexEntry, context: HashCandidateContext): boolean {
+        if (entry.frameIndex !== context.frameIndex || entry.moveId !== context.moveId) {
+            return false;
+        }
+        return this.scope === 'character'
+            ? entry.characterId === context.characterId
+            : entry.runId === context.runId;
+    }
+
+    /**
+     * Audited candidate of the same frame with identical file content
+     */
+    private findAuditedCopy(contentDigest: string, context: HashCandidateContext): HashIndexEntry | null {
+        return this.entries.find(e =>
+            e.verdict !== undefined && e.contentDigest === contentDigest && this.isSameFrame(e, context)
+        ) ?? null;
+    }
+
+    /**
+     * Count indexed candidates for the move's frame in the current run
+     */
+    private countFrameEntries(context: HashCandidateContext): number {
+        return this.entries.filter(e =>
+            e.runId === context.runId
+            && e.moveId === context.moveId
+            && e.frameIndex === context.frameIndex
+        ).length;
+    }
+}
+
+/**
+ * Load a persisted index, or start an empty one if the file is missing or unreadable
+ */
+export async function loadPerceptualHashIndex(
+    indexPath: string,
+    options: PerceptualHashIndexOptions = {}
+): Promise<PerceptualHashIndex> {
+    try {
+        const content = await fs.readFile(indexPath, 'utf-8');
+        const file = JSON.parse(content) as HashIndexFile;
+        if (file.version === 1 && Array.isArray(file.entries)) {
+            return new PerceptualHashIndex(options, file.entries);
+        }
+        logger.warn({ indexPath }, 'Unrecognized perceptual hash index format, starting fresh');
+    } catch {
+        // No index yet
+    }
+    return new PerceptualHashIndex(options);
+}
@@ -10,6 +10,7 @@ import { pathExists, isWritable, writeJsonAtomic } from '../utils/fs-helpers.js'
 import { Result } from './config-resolver.js';
 import { RUN_FOLDERS, ALL_RUN_FOLDERS, RUN_FILES } from '../domain/constants/run-folders.js';
 import { logger } from '../utils/logger.js';
+import { getBlobStore } from './blob-store.js';
 
 // Use constant from domain (backward compatible)
 const RUN_SUBDIRS = ALL_RUN_FOLDERS;
@@ -19,6 +20,7 @@ const RUN_SUBDIRS = ALL_RUN_FOLDERS;
  */
 export interface RunPaths {
     root: string;
+    runsDir?: string;           // Configured runs root; enables the shared blob store
     candidates: string;
     approved: string;
     rejected: string;
@@ -64,10 +66,13 @@ export function generateRunId(): string {
 
 /**
  * Build RunPaths from a run directory
+ *
+ * @param runsDir - Configured runs root the run lives in, if known
  */
-export function buildRunPaths(runDir: string): RunPaths {
+export function buildRunPaths(runDir: string, runsDir?: string): RunPaths {
     return {
         root: runDir,
+        runsDir,
         candidates: join(runDir, RUN_FOLDERS.CANDIDATES),
         approved: join(runDir, RUN_FOLDERS.APPROVED),
         rejected: join(runDir, RUN_FOLDERS.REJECTED),
@@ -92,7 +97,7 @@ export async function createRunFolder(
     runId: string
 ): Promise<Result<RunPaths, RunFolderError>> {
     const runDir = join(runsDir, runId);
-    const paths = buildRunPaths(runDir);
+    const paths = buildRunPaths(runDir, runsDir);
 
     try {
         // Check parent directory is writable
@@ -227,8 +232,13 @@ export async function saveRejectedFrame(
     const framePath = getRejectedPath(runPaths, frameIndex, reasonCode);
     const metadataPath = getRejectedMetadataPath(runPaths, frameIndex, reasonCode);
 
-    // Copy candidate to rejected folder
-    await fs.copyFile(candidatePath, framePath);
+    // Link candidate into rejected folder (shared blob, no byte copy) when
+    // the runs root is known; otherwise a plain copy
+    if (runPaths.runsDir) {
+        await getBlobStore(runPaths.runsDir).linkFile(candidatePath, framePath);
+    } else {
+        await fs.copyFile(candidatePath, framePath);
+    }
 
     // Write metadata
     const fullMetadata: RejectedFrameMetadata = {
@@ -315,25 +325,40 @@ export interface CleanupResult {
     runsDeleted: number;
     runsPreserved: number;
     spaceFreedBytes: number;
+    blobsDeleted: number;
     deletedRuns: string[];
     preservedRuns: string[];
     errors: Array<{ runId: string; error: string }>;
 }
 
 /**
- * Get directory size in bytes
+ * Hardlinked files seen while sizing runs for deletion, keyed by inode
  */
-async function getDirectorySize(dirPath: string): Promise<number> {
+type SharedFileMap = Map<string, { size: number; nlink: number; seen: number }>;
+
+/**
+ * Get directory size in bytes.
+ * Hardlinked files (blob store links) are not counted here; they are
+ * recorded in `shared` so the caller can tell which ones deletion frees.
+ */
+async function getDirectorySize(dirPath: string, shared?: SharedFileMap): Promise<number> {
     let size = 0;
     try {
         const entries = await fs.readdir(dirPath, { withFileTypes: true });
         for (const entry of entries) {
             const entryPath = join(dirPath, entry.name);
             if (entry.isDirectory()) {
-                size += await getDirectorySize(entryPath);
+                size += await getDirectorySize(entryPath, shared);
             } else {
                 const stats = await fs.stat(entryPath);
-                size += stats.size;
+                if (stats.nlink > 1 && shared) {
+                    const key = `${stats.dev}:${stats.ino}`;
+                    const file = shared.get(key) ?? { size: stats.size, nlink: stats.nlink, seen: 0 };
+                    file.seen++;
+                    shared.set(key, file);
+                } else {
+                    size += stats.size;
+                }
             }
         }
     } catch {
@@ -342,6 +367,22 @@ async function getDirectorySize(dirPath: string): Promise<number> {
     return size;
 }
 
+/**
+ * Shared files freed by deleting the runs that hold `seen` of their links:
+ * a file is freed once only the blob store's own link remains.
+ */
+function predictSharedFilesFreed(shared: SharedFileMap): { count: number; bytes: number } {
+    let count = 0;
+    let bytes = 0;
+    for (const file of shared.values()) {
+        if (file.seen >= file.nlink - 1) {
+            count++;
+            bytes += file.size;
+        }
+    }
+    return { count, bytes };
+}
+
 /**
  * Cleanup old runs based on age
  */
@@ -354,6 +395,7 @@ export async function cleanupOldRuns(
         runsDeleted: 0,
         runsPreserved: 0,
         spaceFreedBytes: 0,
+        blobsDeleted: 0,
         deletedRuns: [],
         preservedRuns: [],
         errors: [],
@@ -361,12 +403,14 @@ export async function cleanupOldRuns(
 
     const maxAgeMs = options.maxAgeDays * 24 * 60 * 60 * 1000;
     const cutoffTime = Date.now() - maxAgeMs;
+    const sharedFiles: SharedFileMap = new Map();
 
     try {
         const entries = await fs.readdir(runsDir, { withFileTypes: true });
 
         for (const entry of entries) {
-            if (!entry.isDirectory() || entry.name === 'README.md') {
+            // Skip non-runs, including the blob store (.blobs)
+            if (!entry.isDirectory() || entry.name === 'README.md' || entry.name.startsWith('.')) {
                 continue;
             }
 
@@ -391,7 +435,7 @@ export async function cleanupOldRuns(
                     }
 
                     // Calculate size before deletion
-                    const size = await getDirectorySize(runPath);
+                    const size = await getDirectorySize(runPath, sharedFiles);
 
                     if (!options.dryRun) {
                         await fs.rm(runPath, { recursive: true, force: true });
@@ -415,6 +459,21 @@ export async function cleanupOldRuns(
         logger.error({ error, runsDir }, 'Failed to scan runs directory');
     }
 
+    // Frames shared through the blob store are freed once no run links them.
+    // A real GC reports those bytes itself; a dry run has to predict them.
+    try {
+        const gc = await getBlobStore(runsDir).collectGarbage({ dryRun: options.dryRun });
+        result.blobsDeleted = gc.blobsDeleted;
+        result.spaceFreedBytes += gc.bytesFreed;
+        if (options.dryRun) {
+            const predicted = predictSharedFilesFreed(sharedFiles);
+            result.blobsDeleted += predicted.count;
+            result.spaceFreedBytes += predicted.bytes;
+        }
+    } catch (error) {
+        logger.error({ error, runsDir }, 'Failed to collect unreferenced blobs');
+    }
+
     logger.info({
         event: 'cleanup_complete',
         ...result,
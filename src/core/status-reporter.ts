@@ -4,7 +4,7 @@
  */
 
 import { logger } from '../utils/logger.js';
-import type { RunStateWithAttempts } from './attempt-tracker.js';
+import { getDuplicateStats, type RunStateWithAttempts } from './attempt-tracker.js';
 import type { StopReason } from './stop-condition-evaluator.js';
 import {
     type RunStatus,
@@ -46,6 +46,7 @@ export function calculateRunMetrics(state: RunStateWithAttempts): RunMetrics {
         totalAttempts: state.totalAttempts,
         retryRate: attemptedFrames > 0 ? framesWithRetries / attemptedFrames : 0,
         rejectRate: attemptedFrames > 0 ? framesFailed / attemptedFrames : 0,
+        duplicateRate: getDuplicateStats(state).duplicateRate,
     };
 }
 
@@ -270,6 +271,9 @@ export function formatStatusForCLI(status: RunStatus): string {
     lines.push(`  Failed:     ${status.metrics.framesFailed}/${status.metrics.totalFrames} frames`);
     lines.push(`  Attempts:   ${status.metrics.totalAttempts} total`);
     lines.push(`  Retry Rate: ${(status.metrics.retryRate * 100).toFixed(1)}%`);
+    if (status.metrics.duplicateRate) {
+        lines.push(`  Duplicates: ${(status.metrics.duplicateRate * 100).toFixed(1)}%`);
+    }
 
     // Status-specific details
     if (status.status === 'stopped') {
@@ -79,3 +79,9 @@ export const RUN_FOLDER_DESCRIPTIONS: Record<RunFolderName, string> = {
     [RUN_FOLDERS.EXPORT]: 'Final atlas (PNG + JSON)',
     [RUN_FOLDERS.VALIDATION]: 'Phaser micro-test results',
 };
+
+/**
+ * Content-addressed blob store, shared by all runs in a runs directory.
+ * Run folders hold hardlinks into it; see core/blob-store.ts.
+ */
+export const BLOB_STORE_DIR = '.blobs';
@@ -53,6 +53,7 @@ export interface RunMetrics {
     totalAttempts: number;
     retryRate: number;
     rejectRate: number;
+    duplicateRate?: number;
 }
 
 /**
@@ -0,0 +1,43 @@
+/**
+ * Concurrency helpers for bounded parallel I/O
+ */
+
+import { availableParallelism } from 'os';
+
+/**
+ * Default parallelism for file-bound work (reads, decodes, links).
+ * Above the core count since most of the time is spent waiting on I/O,
+ * capped so large moves don't exhaust file descriptors or libuv threads.
+ */
+export const DEFAULT_IO_CONCURRENCY = Math.min(16, Math.max(4, availableParallelism() * 2));
+
+/**
+ * Map items through an async function with at most `limit` calls in flight.
+ * Results keep input order. Rejects with the first error; no new calls
+ * start after a failure.
+ */
+export async function mapWithConcurrency<T, R>(
+    items: readonly T[],
+    limit: number,
+    fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+    const results = new Array<R>(items.length);
+    let next = 0;
+    let failed = false;
+
+    const worker = async (): Promise<void> => {
+        while (!failed && next < items.length) {
+            const index = next++;
+            try {
+                results[index] = await fn(items[index], index);
+            } catch (error) {
+                failed = true;
+                throw error;
+            }
+        }
+    };
+
+    const workerCount = Math.max(1, Math.min(Math.floor(limit) || 1, items.length));
+    await Promise.all(Array.from({ length: workerCount }, worker));
+    return results;
+}
@@ -30,12 +30,19 @@ export function crc32(str: string): number {
  * Calculate seed for frame generation
  * Attempt 1: deterministic CRC32 seed
  * Attempt 2+: undefined (API randomizes)
+ * With salt: deterministic salted seed for any attempt (forced reroll
+ * after a duplicate candidate)
  */
 export function calculateSeed(
     runId: string,
     frameIndex: number,
-    attemptIndex: number
+    attemptIndex: number,
+    salt?: number
 ): number | undefined {
+    if (salt !== undefined) {
+        return crc32(`${runId}::${frameIndex}::${attemptIndex}::${salt}`);
+    }
+
     // Only use fixed seed for attempt 1
     if (attemptIndex > 1) {
         return undefined; // Let API randomize to escape failure modes
@@ -49,6 +56,9 @@ export function calculateSeed(
 /**
  * Get seed policy description for logging
  */
-export function describeSeedPolicy(attemptIndex: number): string {
+export function describeSeedPolicy(attemptIndex: number, salt?: number): string {
+    if (salt !== undefined) {
+        return 'salted_crc32';
+    }
     return attemptIndex === 1 ? 'fixed_crc32' : 'random';
 }
@@ -0,0 +1,217 @@
+/**
+ * Tests for the Gemini rate governor
+ * Exercised against a local stand-in HTTP server
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import * as http from 'http';
+import type { AddressInfo } from 'net';
+import {
+    GeminiRateGovernor,
+    GeminiHttpError,
+    TokenBucket,
+    computeBackoffMs,
+    extractQuotaHint,
+    parseQuotaHeaders,
+    postJson,
+} from '../../src/adapters/gemini-rate-governor.js';
+
+describe('Gemini Rate Governor', () => {
+    describe('TokenBucket', () => {
+        it('should allow a burst then report time until refill', () => {
+            let now = 0;
+            const bucket = new TokenBucket(2, 1, () => now);
+
+            expect(bucket.take()).toBe(0);
+            expect(bucket.take()).toBe(0);
+            expect(bucket.take()).toBe(1000);
+
+            now = 1000;
+            expect(bucket.take()).toBe(0);
+        });
+
+        it('should not refill past capacity', () => {
+            let now = 0;
+            const bucket = new TokenBucket(1, 1, () => now);
+
+            now = 60000;
+            expect(bucket.take()).toBe(0);
+            expect(bucket.take()).toBeGreaterThan(0);
+        });
+    });
+
+    describe('quota parsing', () => {
+        it('should parse Retry-After seconds and rate-limit headers', () => {
+            const hint = parseQuotaHeaders({
+                'retry-after': '2',
+                'x-ratelimit-remaining': '0',
+                'x-ratelimit-reset': '5',
+            });
+
+            expect(hint).toEqual({ retryAfterMs: 2000, remaining: 0, resetMs: 5000 });
+        });
+
+        it('should convert an epoch-seconds reset to a delay', () => {
+            const resetAt = Math.floor(Date.now() / 1000) + 30;
+            const hint = parseQuotaHeaders({ 'x-ratelimit-reset': String(resetAt) });
+
+            expect(hint.resetMs).toBeGreaterThan(28000);
+            expect(hint.resetMs).toBeLessThanOrEqual(30000);
+        });
+
+        it('should read RetryInfo from SDK errors', () => {
+            const hint = extractQuotaHint({
+                status: 429,
+                errorDetails: [{ '@type': 'type.googleapis.com/google.rpc.RetryInfo', retryDelay: '13s' }],
+            });
+
+            expect(hint?.status).toBe(429);
+            expect(hint?.retryAfterMs).toBe(13000);
+        });
+
+        it('should retry fetch failures with a network cause', () => {
+            const cause = Object.assign(new Error('socket hang up'), { code: 'ECONNRESET' });
+            const fetchError = new TypeError('fetch failed', { cause });
+
+            expect(extractQuotaHint(fetchError)).toEqual({});
+            expect(extractQuotaHint(new TypeError('fetch failed'))).toEqual({});
+            expect(extractQuotaHint(new Error('Error fetching from https://example.test: fetch failed'))).toEqual({});
+            expect(extractQuotaHint(new Error('wrapped', { cause: { code: 'UND_ERR_SOCKET' } }))).toEqual({});
+        });
+
+        it('should not retry client errors or plain errors', () => {
+            expect(extractQuotaHint({ status: 400 })).toBeNull();
+            expect(extractQuotaHint(new Error('API rate limit exceeded'))).toBeNull();
+        });
+    });
+
+    describe('computeBackoffMs', () => {
+        it('should grow exponentially up to the ceiling', () => {
+            const max = () => 1;
+            expect(computeBackoffMs(0, {}, 100, 1000, max)).toBe(100);
+            expect(computeBackoffMs(2, {}, 100, 1000, max)).toBe(400);
+            expect(computeBackoffMs(10, {}, 100, 1000, max)).toBe(1000);
+        });
+
+        it('should honor server delay with small jitter', () => {
+            expect(computeBackoffMs(0, { retryAfterMs: 3000 }, 100, 10000, () => 0)).toBe(3000);
+            expect(computeBackoffMs(0, { retryAfterMs: 3000 }, 100, 10000, () => 1)).toBe(3025);
+        });
+
+        it('should cap server delay at maxBackoffMs', () => {
+            expect(computeBackoffMs(0, { retryAfterMs: 3000 }, 100, 1000, () => 1)).toBe(1000);
+            expect(computeBackoffMs(0, { remaining: 0, resetMs: 86400000 }, 100, 60000, () => 0)).toBe(60000);
+        });
+    });
+
+    describe('concurrency cap', () => {
+        it('should never exceed maxConcurrency and record queue wait', async () => {
+            const governor = new GeminiRateGovernor({ maxConcurrency: 2, burst: 10, requestsPerMinute: 6000 });
+            let active = 0;
+            let peak = 0;
+
+            const task = async () => {
+                active++;
+                peak = Math.max(peak, active);
+                await new Promise(resolve => setTimeout(resolve, 20));
+                active--;
+                return active;
+            };
+
+            await Promise.all(Array.from({ length: 6 }, () => governor.run(task)));
+
+            const metrics = governor.getMetrics();
+            expect(peak).toBe(2);
+            expect(metrics.requests).toBe(6);
+            expect(metrics.inFlight).toBe(0);
+            expect(metrics.queueWaitMs.max).toBeGreaterThan(0);
+        });
+
+        it('should rethrow non-retryable errors without retrying', async () => {
+            const governor = new GeminiRateGovernor();
+
+            await expect(governor.run(async () => {
+                throw new Error('bad request');
+            })).rejects.toThrow('bad request');
+            expect(governor.getMetrics().retries).toBe(0);
+            expect(governor.getMetrics().inFlight).toBe(0);
+        });
+    });
+
+    describe('against a local HTTP server', () => {
+        let server: http.Server;
+        let baseUrl: string;
+        let responses: Array<{ status: number; headers?: Record<string, string> }>;
+        let hits: number;
+        let remotePorts: Set<number>;
+
+        beforeEach(async () => {
+            responses = [];
+            hits = 0;
+            remotePorts = new Set();
+            server = http.createServer((req, res) => {
+                hits++;
+                remotePorts.add(req.socket.remotePort ?? 0);
+                req.resume();
+                req.on('end', () => {
+                    const next = responses.shift() ?? { status: 200 };
+                    res.writeHead(next.status, { 'content-type': 'application/json', ...next.headers });
+                    res.end(JSON.stringify({ ok: next.status === 200 }));
+                });
+            });
+            await new Promise<void>(resolve => server.listen(0, '127.0.0.1', resolve));
+            baseUrl = `http://127.0.0.1:${(server.address() as AddressInfo).port}`;
+        });
+
+        afterEach(async () => {
+            server.closeAllConnections();
+            await new Promise<void>(resolve => server.close(() => resolve()));
+        });
+
+        it('should post JSON and parse the response', async () => {
+            const response = await postJson(`${baseUrl}/v1beta/models/test:generateContent`, { hello: 'world' });
+
+            expect(response.status).toBe(200);
+            expect(response.body).toEqual({ ok: true });
+        });
+
+        it('should reject non-2xx with GeminiHttpError', async () => {
+            responses.push({ status: 400 });
+
+            await expect(postJson(`${baseUrl}/x`, {})).rejects.toBeInstanceOf(GeminiHttpError);
+        });
+
+        it('should retry 429 after the server-provided delay', async () => {
+            responses.push({ status: 429, headers: { 'retry-after': '0.05' } });
+            const governor = new GeminiRateGovernor({ random: () => 0 });
+
+            const start = Date.now();
+            const result = await governor.postJson(`${baseUrl}/x`, {});
+
+            expect(result.value.status).toBe(200);
+            expect(result.attempts).toBe(2);
+            expect(Date.now() - start).toBeGreaterThanOrEqual(45);
+            expect(governor.getMetrics().quotaErrors).toBe(1);
+            expect(hits).toBe(2);
+        });
+
+        it('should give up after maxRetries', async () => {
+            responses.push({ status: 503 }, { status: 503 }, { status: 503 });
+            const governor = new GeminiRateGovernor({ maxRetries: 2, baseBackoffMs: 5 });
+
+            await expect(governor.postJson(`${baseUrl}/x`, {})).rejects.toBeInstanceOf(GeminiHttpError);
+            expect(hits).toBe(3);
+        });
+
+        it('should reuse pooled keep-alive connections', async () => {
+            const governor = new GeminiRateGovernor({ maxConcurrency: 1 });
+
+            for (let i = 0; i < 3; i++) {
+                await governor.postJson(`${baseUrl}/x`, { i });
+            }
+
+            expect(hits).toBe(3);
+            expect(remotePorts.size).toBe(1);
+        });
+    });
+});
@@ -0,0 +1,95 @@
+/**
+ * Tests for lazy command loading and CLI startup time
+ */
+
+import { describe, it, expect } from 'vitest';
+import { Command } from 'commander';
+import { spawnSync } from 'child_process';
+import { dirname, join } from 'path';
+import { fileURLToPath } from 'url';
+import {
+    LAZY_COMMAND_NAMES,
+    registerCommands,
+    resolveCommandsToLoad,
+} from '../../src/commands/command-registry.js';
+
+const INLINE_COMMANDS = ['director', 'export'];
+
+describe('Command Registry', () => {
+    describe('resolveCommandsToLoad', () => {
+        it('should load only the invoked command', () => {
+            expect(resolveCommandsToLoad(['inspect', 'run_123', '--json'])).toEqual(['inspect']);
+            expect(resolveCommandsToLoad(['gen', '--move=idle'])).toEqual(['gen']);
+            expect(resolveCommandsToLoad(['new-manifest', '--help'])).toEqual(['new-manifest']);
+        });
+
+        it('should load nothing for --version', () => {
+            expect(resolveCommandsToLoad(['--version'])).toEqual([]);
+            expect(resolveCommandsToLoad(['-V'])).toEqual([]);
+        });
+
+        it('should load nothing for inline commands', () => {
+            expect(resolveCommandsToLoad(['director'], INLINE_COMMANDS)).toEqual([]);
+        });
+
+        it('should load the target of help <command>', () => {
+            expect(resolveCommandsToLoad(['help', 'clean'])).toEqual(['clean']);
+        });
+
+        it('should load everything for top-level help and unknown commands', () => {
+            expect(resolveCommandsToLoad([])).toEqual(LAZY_COMMAND_NAMES);
+            expect(resolveCommandsToLoad(['--help'])).toEqual(LAZY_COMMAND_NAMES);
+            expect(resolveCommandsToLoad(['help'])).toEqual(LAZY_COMMAND_NAMES);
+            expect(resolveCommandsToLoad(['gne'])).toEqual(LAZY_COMMAND_NAMES);
+        });
+    });
+
+    describe('registerCommands', () => {
+        it('should register only the requested commands', async () => {
+            const program = new Command();
+
+            await registerCommands(program, ['schema']);
+
+            expect(program.commands.map(c => c.name())).toEqual(['schema']);
+        });
+
+        it('should register in listing order regardless of request order', async () => {
+            const program = new Command();
+
+            await registerCommands(program, ['guide', 'schema']);
+
+            expect(program.commands.map(c => c.name())).toEqual(['schema', 'guide']);
+        });
+    });
+
+    describe('startup benchmark', () => {
+        const binPath = join(dirname(fileURLToPath(import.meta.url)), '../../src/bin.ts');
+
+        /**
+         * Median wall time of running the CLI from source
+         */
+        function measureStartup(args: string[], runs: number = 3): number {
+            const times: number[] = [];
+            for (let i = 0; i < runs; i++) {
+                const start = process.hrtime.bigint();
+                const result = spawnSync(process.execPath, ['--import', 'tsx', binPath, ...args], {
+                    encoding: 'utf-8',
+                    env: { ...process.env, LOG_LEVEL: 'silent' },
+                });
+                times.push(Number(process.hrtime.bigint() - start) / 1e6);
+                expect(result.status).toBe(0);
+            }
+            times.sort((a, b) => a - b);
+            return times[Math.floor(times.length / 2)];
+        }
+
+        it('should start lightweight commands faster than loading the full command set', () => {
+            const versionMs = measureStartup(['--version']);
+            const schemaHelpMs = measureStartup(['schema', '--help']);
+            const fullHelpMs = measureStartup(['--help']);
+
+            expect(versionMs).toBeLessThan(fullHelpMs);
+            expect(schemaHelpMs).toBeLessThan(fullHelpMs);
+        }, 120000);
+    });
+});
@@ -18,6 +18,8 @@ import {
     countFramesWithRetries,
     countRejectedFrames,
     countFailedAttemptFrames,
+    recordDuplicateAttempt,
+    getDuplicateStats,
     type RunStateWithAttempts,
 } from '../../src/core/attempt-tracker.js';
 import { initializeState } from '../../src/core/state-manager.js';
@@ -403,4 +405,70 @@ describe('Attempt Tracker', () => {
             expect(countFailedAttemptFrames(state)).toBe(1); // Frame 3
         });
     });
+
+    describe('duplicate tracking', () => {
+        it('should mark the last attempt as a duplicate', () => {
+            const baseState = initializeState('test-run', 2);
+            let state = initializeAttemptTracking(baseState, 2);
+
+            state = recordAttempt(state, 0, {
+                timestamp: new Date().toISOString(),
+                promptHash: 'a',
+                result: 'soft_fail',
+                reasonCodes: ['SF01'],
+                durationMs: 1000,
+            });
+            state = recordDuplicateAttempt(state, 0, 'ffff0000ffff0000', {
+                runId: 'test-run',
+                frameIndex: 0,
+                attemptIndex: 1,
+                distance: 2,
+            });
+
+            expect(state.frameAttempts[0].attempts[0].duplicateOf?.distance).toBe(2);
+            expect(state.frameAttempts[0].attempts[0].phash).toBe('ffff0000ffff0000');
+            expect(state.duplicateAttempts).toBe(1);
+        });
+
+        it('should ignore frames without attempts', () => {
+            const baseState = initializeState('test-run', 2);
+            const state = initializeAttemptTracking(baseState, 2);
+
+            const next = recordDuplicateAttempt(state, 1, 'ffff0000ffff0000', {
+                runId: 'test-run',
+                frameIndex: 1,
+                attemptIndex: 1,
+                distance: 0,
+            });
+
+            expect(next).toBe(state);
+        });
+
+        it('should report duplicate rate and wasted cost', () => {
+            const baseState = initializeState('test-run', 1);
+            let state = initializeAttemptTracking(baseState, 1);
+
+            for (let i = 0; i < 4; i++) {
+                state = recordAttempt(state, 0, {
+                    timestamp: new Date().toISOString(),
+                    promptHash: `p${i}`,
+                    result: 'soft_fail',
+                    reasonCodes: [],
+                    durationMs: 1000,
+                });
+            }
+            state = recordDuplicateAttempt(state, 0, 'ffff0000ffff0000', {
+                runId: 'test-run',
+                frameIndex: 0,
+                attemptIndex: 3,
+                distance: 1,
+            });
+
+            const stats = getDuplicateStats(state);
+            expect(stats.duplicateAttempts).toBe(1);
+            expect(stats.totalAttempts).toBe(4);
+            expect(stats.duplicateRate).toBeCloseTo(0.25);
+            expect(stats.estimatedWastedCost).toBeGreaterThan(0);
+        });
+    });
 });
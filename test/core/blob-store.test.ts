@@ -0,0 +1,228 @@
+/**
+ * Tests for the content-addressed blob store
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { promises as fs } from 'fs';
+import path from 'path';
+import { tmpdir } from 'os';
+import { createHash } from 'crypto';
+import { BlobStore, getBlobStore, hashFile } from '../../src/core/blob-store.js';
+import {
+    buildRunPaths,
+    cleanupOldRuns,
+    createRunFolder,
+    saveRejectedFrame,
+} from '../../src/core/run-folder-manager.js';
+
+describe('Blob Store', () => {
+    let runsDir: string;
+    let store: BlobStore;
+
+    beforeEach(async () => {
+        runsDir = path.join(tmpdir(), `blob-store-test-${Date.now()}`);
+        await fs.mkdir(runsDir, { recursive: true });
+        store = getBlobStore(runsDir);
+    });
+
+    afterEach(async () => {
+        vi.restoreAllMocks();
+        try {
+            await fs.rm(runsDir, { recursive: true, force: true });
+        } catch {
+            // Ignore cleanup errors
+        }
+    });
+
+    async function writeSource(name: string, content: string): Promise<string> {
+        const filePath = path.join(runsDir, 'src', name);
+        await fs.mkdir(path.dirname(filePath), { recursive: true });
+        await fs.writeFile(filePath, content);
+        return filePath;
+    }
+
+    it('should store content once and hardlink every copy', async () => {
+        const source = await writeSource('frame.png', 'frame bytes');
+        const approved = path.join(runsDir, 'run_a', 'approved', 'frame_0000.png');
+        const staged = path.join(runsDir, 'run_a', 'export_staging', 'idle', 'idle_0000.png');
+
+        const first = await store.linkFile(source, approved);
+        const second = await store.linkFile(source, staged);
+
+        expect(first.deduplicated).toBe(false);
+        expect(second.deduplicated).toBe(true);
+        expect(second.digest).toBe(first.digest);
+        expect(first.method).toBe('hardlink');
+
+        const blobStats = await fs.stat(store.blobPath(first.digest));
+        const approvedStats = await fs.stat(approved);
+        expect(approvedStats.ino).toBe(blobStats.ino);
+        expect(blobStats.nlink).toBe(3);
+        expect(await fs.readFile(staged, 'utf-8')).toBe('frame bytes');
+    });
+
+    it('should address blobs by SHA-256 of their content', async () => {
+        const source = await writeSource('frame.png', 'frame bytes');
+
+        const result = await store.linkFile(source, path.join(runsDir, 'run_a', 'frame.png'));
+
+        expect(result.digest).toBe(await hashFile(source));
+        expect(store.blobPath(result.digest)).toContain(path.join('.blobs', 'sha256', result.digest.slice(0, 2)));
+    });
+
+    it('should hash the source when a known digest has no blob', async () => {
+        const source = await writeSource('frame.png', 'edited after validation');
+        const staleDigest = createHash('sha256').update('validated bytes').digest('hex');
+
+        const result = await store.linkFile(source, path.join(runsDir, 'run_a', 'staged.png'), staleDigest);
+
+        expect(result.digest).toBe(await hashFile(source));
+        await expect(fs.access(store.blobPath(staleDigest))).rejects.toThrow();
+    });
+
+    it('should address a new blob by the bytes actually copied', async () => {
+        const source = await writeSource('frame.png', 'validated bytes');
+        const copyFile = fs.copyFile.bind(fs);
+        vi.spyOn(fs, 'copyFile').mockImplementation(async (src, dest, mode) => {
+            // Simulate the source being rewritten while it is copied into the store
+            await fs.writeFile(source, 'rewritten bytes');
+            return copyFile(src, dest, mode);
+        });
+
+        const result = await store.linkFile(source, path.join(runsDir, 'run_a', 'staged.png'));
+
+        expect(result.digest).toBe(createHash('sha256').update('rewritten bytes').digest('hex'));
+        expect(await fs.readFile(store.blobPath(result.digest), 'utf-8')).toBe('rewritten bytes');
+    });
+
+    it('should replace an existing destination without touching its blob', async () => {
+        const dest = path.join(runsDir, 'run_a', 'approved', 'frame_0000.png');
+
+        const original = await store.writeBuffer(Buffer.from('original'), dest);
+        const replaced = await store.writeBuffer(Buffer.from('nudged'), dest);
+
+        expect(replaced.digest).not.toBe(original.digest);
+        expect(await fs.readFile(dest, 'utf-8')).toBe('nudged');
+        expect(await fs.readFile(store.blobPath(original.digest), 'utf-8')).toBe('original');
+    });
+
+    it('should collect only unreferenced blobs', async () => {
+        const kept = path.join(runsDir, 'run_a', 'kept.png');
+        const dropped = path.join(runsDir, 'run_a', 'dropped.png');
+        const keptBlob = await store.writeBuffer(Buffer.from('kept'), kept);
+        const droppedBlob = await store.writeBuffer(Buffer.from('dropped'), dropped);
+        await fs.rm(dropped);
+
+        const preview = await store.collectGarbage({ dryRun: true });
+        expect(preview.blobsDeleted).toBe(1);
+
+        const result = await store.collectGarbage();
+
+        expect(result.blobsScanned).toBe(2);
+        expect(result.blobsReferenced).toBe(1);
+        expect(result.blobsDeleted).toBe(1);
+        expect(result.bytesFreed).toBe('dropped'.length);
+        await expect(fs.access(store.blobPath(keptBlob.digest))).resolves.toBeUndefined();
+        await expect(fs.access(store.blobPath(droppedBlob.digest))).rejects.toThrow();
+    });
+
+    it('should re-ingest a blob collected between ingest and link', async () => {
+        const dest = path.join(runsDir, 'run_a', 'approved', 'frame_0000.png');
+        const link = fs.link.bind(fs);
+        let collected = false;
+        vi.spyOn(fs, 'link').mockImplementation(async (existing, newPath) => {
+            if (!collected) {
+                // Simulate `banana clean` removing the blob while it has one link
+                collected = true;
+                await store.collectGarbage();
+            }
+            return link(existing, newPath);
+        });
+
+        const result = await store.writeBuffer(Buffer.from('frame bytes'), dest);
+
+        expect(collected).toBe(true);
+        expect(result.method).toBe('hardlink');
+        expect(await fs.readFile(dest, 'utf-8')).toBe('frame bytes');
+        expect((await fs.stat(store.blobPath(result.digest))).nlink).toBe(2);
+    });
+
+    describe('run folder integration', () => {
+        async function writeCandidate(runPath: string): Promise<string> {
+            const candidatePath = path.join(runPath, 'candidates', 'frame_0000_attempt_01.png');
+            await fs.mkdir(path.dirname(candidatePath), { recursive: true });
+            await fs.writeFile(candidatePath, 'candidate bytes');
+            return candidatePath;
+        }
+
+        const metadata = { reason_message: 'Identity collapse', attempts: 3 };
+
+        it('should link rejected frames into the configured runs root store', async () => {
+            const created = await createRunFolder(runsDir, 'run_a');
+            expect(created.ok).toBe(true);
+            if (!created.ok) return;
+            const candidatePath = await writeCandidate(created.value.root);
+
+            const { framePath } = await saveRejectedFrame(
+                created.value, 0, 'HF_IDENTITY_COLLAPSE', candidatePath, metadata
+            );
+
+            const digest = await hashFile(candidatePath);
+            expect(created.value.runsDir).toBe(runsDir);
+            expect((await fs.stat(framePath)).ino).toBe((await fs.stat(store.blobPath(digest))).ino);
+        });
+
+        it('should copy rejected frames when the runs root is unknown', async () => {
+            const paths = buildRunPaths(path.join(runsDir, 'run_b'));
+            const candidatePath = await writeCandidate(paths.root);
+
+            const { framePath } = await saveRejectedFrame(paths, 0, 'HF_IDENTITY_COLLAPSE', candidatePath, metadata);
+
+            expect((await fs.stat(framePath)).nlink).toBe(1);
+            await expect(fs.access(path.join(runsDir, '.blobs'))).rejects.toThrow();
+        });
+    });
+
+    describe('cleanupOldRuns integration', () => {
+        const oldTime = new Date(Date.now() - 100 * 24 * 60 * 60 * 1000);
+
+        async function createLinkedRun(runId: string, content: string): Promise<void> {
+            await store.writeBuffer(Buffer.from(content), path.join(runsDir, runId, 'approved', 'frame_0000.png'));
+            await fs.utimes(path.join(runsDir, runId), oldTime, oldTime);
+        }
+
+        it('should not treat the blob store as a run', async () => {
+            await createLinkedRun('run_old', 'frame');
+
+            const result = await cleanupOldRuns(runsDir, { maxAgeDays: 30, dryRun: true });
+
+            expect(result.runsScanned).toBe(1);
+        });
+
+        it('should free blobs once no run links them', async () => {
+            await createLinkedRun('run_old', 'old frame');
+
+            const preview = await cleanupOldRuns(runsDir, { maxAgeDays: 30, dryRun: true });
+            expect(preview.blobsDeleted).toBe(1);
+            expect(preview.spaceFreedBytes).toBe('old frame'.length);
+
+            const result = await cleanupOldRuns(runsDir, { maxAgeDays: 30, dryRun: false });
+
+            expect(result.runsDeleted).toBe(1);
+            expect(result.blobsDeleted).toBe(1);
+            expect(result.spaceFreedBytes).toBe('old frame'.length);
+        });
+
+        it('should keep blobs still linked from preserved runs', async () => {
+            await createLinkedRun('run_old', 'shared frame');
+            await store.writeBuffer(Buffer.from('shared frame'), path.join(runsDir, 'run_new', 'approved', 'frame_0000.png'));
+
+            const result = await cleanupOldRuns(runsDir, { maxAgeDays: 30, dryRun: false });
+
+            expect(result.runsDeleted).toBe(1);
+            expect(result.blobsDeleted).toBe(0);
+            expect(await fs.readFile(path.join(runsDir, 'run_new', 'approved', 'frame_0000.png'), 'utf-8'))
+                .toBe('shared frame');
+        });
+    });
+});
@@ -0,0 +1,108 @@
+/**
+ * Tests for the frame fact sheet collector
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { promises as fs } from 'fs';
+import path from 'path';
+import os from 'os';
+import sharp from 'sharp';
+import { collectFrameFactSheet, isFrameFactCurrent } from '../../../src/core/export/frame-fact-sheet.js';
+import { hashFile } from '../../../src/core/blob-store.js';
+
+/**
+ * Transparent frame with an opaque rectangle
+ */
+async function createFrame(
+    filePath: string,
+    size: number,
+    rect: { x: number; y: number; w: number; h: number }
+): Promise<void> {
+    const buffer = Buffer.alloc(size * size * 4, 0);
+    for (let y = rect.y; y < rect.y + rect.h; y++) {
+        for (let x = rect.x; x < rect.x + rect.w; x++) {
+            const idx = (y * size + x) * 4;
+            buffer[idx] = 200;
+            buffer[idx + 3] = 255;
+        }
+    }
+    await sharp(buffer, { raw: { width: size, height: size, channels: 4 } }).png().toFile(filePath);
+}
+
+describe('Frame Fact Sheet', () => {
+    let approvedPath: string;
+
+    beforeEach(async () => {
+        approvedPath = await fs.mkdtemp(path.join(os.tmpdir(), 'fact-sheet-test-'));
+    });
+
+    afterEach(async () => {
+        vi.restoreAllMocks();
+        await fs.rm(approvedPath, { recursive: true, force: true });
+    });
+
+    it('should gather hash, size, metadata and bounds for each frame', async () => {
+        const framePath = path.join(approvedPath, 'frame_0000.png');
+        await createFrame(framePath, 32, { x: 4, y: 8, w: 10, h: 12 });
+
+        const sheet = await collectFrameFactSheet(approvedPath);
+
+        expect(sheet.frames).toHaveLength(1);
+        const [frame] = sheet.frames;
+        expect(frame.index).toBe(0);
+        expect(frame.hash).toBe(await hashFile(framePath));
+        expect(frame.fileSize).toBe((await fs.stat(framePath)).size);
+        expect(frame.metadata?.width).toBe(32);
+        expect(frame.metadata?.channels).toBe(4);
+        expect(frame.opaqueBounds).toEqual({ left: 4, top: 8, right: 13, bottom: 19, width: 10, height: 12 });
+    });
+
+    it('should read each frame from disk once', async () => {
+        for (let i = 0; i < 6; i++) {
+            await createFrame(path.join(approvedPath, `frame_000${i}.png`), 16, { x: 0, y: 0, w: 4 + i, h: 4 });
+        }
+        const readSpy = vi.spyOn(fs, 'readFile');
+
+        const sheet = await collectFrameFactSheet(approvedPath, { concurrency: 3 });
+
+        expect(sheet.frames.map(f => f.index)).toEqual([0, 1, 2, 3, 4, 5]);
+        expect(readSpy).toHaveBeenCalledTimes(6);
+        expect(sheet.concurrency).toBe(3);
+    });
+
+    it('should list non-PNG entries and tolerate corrupted frames', async () => {
+        await createFrame(path.join(approvedPath, 'frame_0000.png'), 16, { x: 0, y: 0, w: 4, h: 4 });
+        await fs.writeFile(path.join(approvedPath, 'frame_0001.png'), 'not a png');
+        await fs.writeFile(path.join(approvedPath, 'notes.txt'), 'stray');
+
+        const sheet = await collectFrameFactSheet(approvedPath);
+
+        expect(sheet.entries.sort()).toEqual(['frame_0000.png', 'frame_0001.png', 'notes.txt']);
+        const corrupted = sheet.frames.find(f => f.filename === 'frame_0001.png');
+        expect(corrupted?.metadata).toBeUndefined();
+        expect(corrupted?.hash).toBeDefined();
+        expect(corrupted?.opaqueBounds).toBeUndefined();
+    });
+
+    it('should report facts as stale once the frame is rewritten', async () => {
+        const framePath = path.join(approvedPath, 'frame_0000.png');
+        await createFrame(framePath, 16, { x: 0, y: 0, w: 4, h: 4 });
+
+        const sheet = await collectFrameFactSheet(approvedPath);
+        expect(await isFrameFactCurrent(sheet.frames[0])).toBe(true);
+
+        await createFrame(framePath, 16, { x: 0, y: 0, w: 8, h: 8 });
+        await fs.utimes(framePath, new Date(), new Date(Date.now() + 5000));
+
+        expect(await isFrameFactCurrent(sheet.frames[0])).toBe(false);
+    });
+
+    it('should leave opaque bounds unset for fully transparent frames', async () => {
+        await createFrame(path.join(approvedPath, 'frame_0000.png'), 16, { x: 0, y: 0, w: 0, h: 0 });
+
+        const sheet = await collectFrameFactSheet(approvedPath);
+
+        expect(sheet.frames[0].metadata).toBeDefined();
+        expect(sheet.frames[0].opaqueBounds).toBeUndefined();
+    });
+});
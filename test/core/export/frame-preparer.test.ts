@@ -0,0 +1,121 @@
+/**
+ * Tests for staging approved frames for export
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { promises as fs } from 'fs';
+import path from 'path';
+import os from 'os';
+import sharp from 'sharp';
+import { prepareFramesForExport } from '../../../src/core/export/frame-preparer.js';
+import { collectFrameFactSheet } from '../../../src/core/export/frame-fact-sheet.js';
+import { BlobStore, hashFile } from '../../../src/core/blob-store.js';
+
+/**
+ * Transparent frame with an opaque square
+ */
+async function createFrame(filePath: string, size: number, edge: number): Promise<void> {
+    const buffer = Buffer.alloc(size * size * 4, 0);
+    for (let y = 0; y < edge; y++) {
+        for (let x = 0; x < edge; x++) {
+            const idx = (y * size + x) * 4;
+            buffer[idx + 1] = 180;
+            buffer[idx + 3] = 255;
+        }
+    }
+    await sharp(buffer, { raw: { width: size, height: size, channels: 4 } }).png().toFile(filePath);
+}
+
+describe('Frame Preparer', () => {
+    let runsDir: string;
+    let approvedPath: string;
+
+    beforeEach(async () => {
+        runsDir = await fs.mkdtemp(path.join(os.tmpdir(), 'frame-preparer-test-'));
+        approvedPath = path.join(runsDir, 'run_a', 'approved');
+        await fs.mkdir(approvedPath, { recursive: true });
+    });
+
+    afterEach(async () => {
+        vi.restoreAllMocks();
+        await fs.rm(runsDir, { recursive: true, force: true });
+    });
+
+    async function createFrames(count: number): Promise<void> {
+        for (let i = 0; i < count; i++) {
+            await createFrame(path.join(approvedPath, `frame_${i.toString().padStart(4, '0')}.png`), 16, 4 + i);
+        }
+    }
+
+    it('should stage frames with Phaser names and write the mapping log', async () => {
+        await createFrames(3);
+        await fs.writeFile(path.join(approvedPath, 'notes.txt'), 'stray');
+
+        const result = await prepareFramesForExport(approvedPath, { runId: 'run_a', runsDir, moveId: 'idle' });
+
+        expect(result.ok).toBe(true);
+        if (!result.ok) return;
+        expect(result.value.frameCount).toBe(3);
+        expect((await fs.readdir(result.value.stagingPath)).sort())
+            .toEqual(['idle_0000.png', 'idle_0001.png', 'idle_0002.png']);
+        expect(await hashFile(path.join(result.value.stagingPath, 'idle_0002.png')))
+            .toBe(await hashFile(path.join(approvedPath, 'frame_0002.png')));
+
+        const mappingLog = JSON.parse(
+            await fs.readFile(path.join(runsDir, 'run_a', 'export', 'frame_mapping.json'), 'utf-8')
+        );
+        expect(mappingLog.frame_count).toBe(3);
+        expect(mappingLog.mappings[1].renamed).toBe('idle/0001');
+    });
+
+    it('should reuse fact sheet digests for unchanged frames', async () => {
+        await createFrames(2);
+        const factSheet = await collectFrameFactSheet(approvedPath);
+        const linkSpy = vi.spyOn(BlobStore.prototype, 'linkFile');
+
+        const result = await prepareFramesForExport(approvedPath, {
+            runId: 'run_a',
+            runsDir,
+            moveId: 'idle',
+            factSheet,
+        });
+
+        expect(result.ok).toBe(true);
+        expect(linkSpy.mock.calls.map(call => call[2])).toEqual(factSheet.frames.map(f => f.hash));
+    });
+
+    it('should not trust the digest of a frame changed since validation', async () => {
+        await createFrames(2);
+        const factSheet = await collectFrameFactSheet(approvedPath);
+        const editedPath = path.join(approvedPath, 'frame_0001.png');
+        await createFrame(editedPath, 32, 20);
+        const linkSpy = vi.spyOn(BlobStore.prototype, 'linkFile');
+
+        const result = await prepareFramesForExport(approvedPath, {
+            runId: 'run_a',
+            runsDir,
+            moveId: 'idle',
+            factSheet,
+        });
+
+        expect(result.ok).toBe(true);
+        if (!result.ok) return;
+        const edited = linkSpy.mock.calls.find(call => call[0] === editedPath);
+        expect(edited?.[2]).toBeUndefined();
+        expect(await hashFile(path.join(result.value.stagingPath, 'idle_0001.png')))
+            .toBe(await hashFile(editedPath));
+    });
+
+    it('should return error when the approved folder is missing', async () => {
+        const result = await prepareFramesForExport(path.join(runsDir, 'missing'), {
+            runId: 'run_a',
+            runsDir,
+            moveId: 'idle',
+        });
+
+        expect(result.ok).toBe(false);
+        if (!result.ok) {
+            expect(result.error.code).toBe('SYS_PATH_NOT_FOUND');
+        }
+    });
+});
@@ -0,0 +1,143 @@
+/**
+ * Tests for the audit worker pool
+ */
+
+import { describe, it, expect, afterEach } from 'vitest';
+
+import { AuditWorkerPool } from '../../../src/core/metrics/audit-worker-pool.js';
+import { runMetricTask, type AuditMetricOutcomes } from '../../../src/core/metrics/audit-metric-task.js';
+import { toSharedRawImage } from '../../../src/core/metrics/raw-image.js';
+import { createRawImage } from './raw-image-fixtures.js';
+
+/**
+ * Assert a metric outcome succeeded and return its value
+ */
+function expectOk<T>(outcome: { ok: true; value: T } | { ok: false; error: unknown } | undefined): T {
+    expect(outcome).toBeDefined();
+    if (!outcome?.ok) {
+        throw new Error(`Expected metric to succeed: ${JSON.stringify(outcome)}`);
+    }
+    return outcome.value;
+}
+
+describe('AuditWorkerPool', () => {
+    let pool: AuditWorkerPool | undefined;
+
+    afterEach(async () => {
+        await pool?.close();
+        pool = undefined;
+    });
+
+    it('should run tiny frames in-process', async () => {
+        pool = new AuditWorkerPool({ size: 2 });
+        const candidate = createRawImage(32);
+
+        const result = await pool.auditFrame({ candidate, anchor: createRawImage(32) });
+
+        expect(result.execution).toBe('in_process');
+        expect(pool.threadCount).toBe(0);
+        expect(result.ssim?.ok).toBe(true);
+        if (result.ssim?.ok) {
+            expect(result.ssim.value.score).toBeGreaterThanOrEqual(0.99);
+        }
+    });
+
+    it('should only compute metrics whose inputs are provided', async () => {
+        pool = new AuditWorkerPool({ size: 1 });
+
+        const result = await pool.auditFrame({ candidate: createRawImage(32) });
+
+        expect(result.alpha.ok).toBe(true);
+        expect(result.orphan.ok).toBe(true);
+        expect(result.ssim).toBeUndefined();
+        expect(result.palette).toBeUndefined();
+        expect(result.mapd).toBeUndefined();
+        expect(result.baseline).toBeUndefined();
+    });
+
+    it('should return the same scores as in-process execution', async () => {
+        pool = new AuditWorkerPool({ size: 2, inProcessMaxPixels: 0 });
+        const candidate = createRawImage(256, { r: 200, g: 40, b: 40 }, { y: 4 });
+        const anchor = createRawImage(256);
+        const previous = createRawImage(256, { r: 190, g: 40, b: 40 });
+
+        const result = await pool.auditFrame({
+            candidate,
+            anchor,
+            previous,
+            moveType: 'idle',
+            palette: ['#C82828', '#8040C0'],
+            anchorBaselineY: 191,
+        });
+
+        expect(result.execution).toBe('worker');
+        expect(pool.threadCount).toBeGreaterThan(0);
+        expect(pool.tasksCompletedInWorker).toBe(6);
+
+        const expectedSSIM = runMetricTask({ metric: 'ssim', candidate, anchor }) as AuditMetricOutcomes['ssim'];
+        const expectedMAPD = runMetricTask({ metric: 'mapd', previous, candidate, moveType: 'idle' }) as AuditMetricOutcomes['mapd'];
+        const expectedPalette = runMetricTask({
+            metric: 'palette',
+            candidate,
+            palette: ['#C82828', '#8040C0'],
+        }) as AuditMetricOutcomes['palette'];
+
+        const ssim = expectOk(result.ssim);
+        const mapd = expectOk(result.mapd);
+        const palette = expectOk(result.palette);
+        const baseline = expectOk(result.baseline);
+
+        expect(ssim).toHaveProperty('score');
+        expect(mapd).toHaveProperty('mapd_score');
+        expect(palette).toHaveProperty('fidelity_score');
+
+        expect(ssim.score).toBeCloseTo(expectOk(expectedSSIM).score, 10);
+        expect(mapd.mapd_score).toBeCloseTo(expectOk(expectedMAPD).mapd_score, 10);
+        expect(palette.fidelity_score).toBeCloseTo(expectOk(expectedPalette).fidelity_score, 10);
+        expect(baseline.drift_pixels).toBe(4);
+    });
+
+    it('should audit several frames concurrently', async () => {
+        pool = new AuditWorkerPool({ size: 2, inProcessMaxPixels: 0 });
+        const anchor = toSharedRawImage(createRawImage(128));
+
+        const results = await Promise.all(
+            [0, 1, 2, 3].map(offset => pool!.auditFrame({
+                candidate: createRawImage(128, undefined, { y: offset }),
+                anchor,
+            }))
+        );
+
+        expect(results).toHaveLength(4);
+        for (const result of results) {
+            expect(result.ssim?.ok).toBe(true);
+        }
+        expect(pool.threadCount).toBeGreaterThan(0);
+        expect(pool.threadCount).toBeLessThanOrEqual(2);
+        expect(pool.tasksCompletedInWorker).toBe(results.length * 3);
+        for (const result of results) {
+            expect(result.execution).toBe('worker');
+        }
+    });
+
+    it('should not report worker execution when tasks fell back in-process', async () => {
+        pool = new AuditWorkerPool({ size: 2, inProcessMaxPixels: 0 });
+
+        const pending = pool.auditFrame({ candidate: createRawImage(128), anchor: createRawImage(128) });
+        await pool.close();
+        const result = await pending;
+
+        expect(result.execution).toBe('in_process');
+        expect(result.ssim?.ok).toBe(true);
+        expect(pool.tasksCompletedInWorker).toBe(0);
+    });
+
+    it('should share pixel memory instead of copying', () => {
+        const image = createRawImage(16);
+        const shared = toSharedRawImage(image);
+
+        expect(shared.data.buffer).toBeInstanceOf(SharedArrayBuffer);
+        expect(Array.from(shared.data)).toEqual(Array.from(image.data));
+        expect(toSharedRawImage(shared)).toBe(shared);
+    });
+});
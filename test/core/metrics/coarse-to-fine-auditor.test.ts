@@ -0,0 +1,143 @@
+/**
+ * Tests for the coarse-to-fine audit mode
+ */
+
+import { describe, it, expect } from 'vitest';
+
+import {
+    auditCoarseToFine,
+    selectPyramidFactor,
+    toMetricInputs,
+} from '../../../src/core/metrics/coarse-to-fine-auditor.js';
+import { downsampleRawImage } from '../../../src/core/metrics/raw-image.js';
+import { createRawImage } from './raw-image-fixtures.js';
+
+describe('Coarse-to-Fine Auditor', () => {
+    describe('selectPyramidFactor', () => {
+        it('should pick the largest factor that keeps the coarse level usable', () => {
+            expect(selectPyramidFactor(512, 512)).toBe(8);
+            expect(selectPyramidFactor(256, 512)).toBe(4);
+            expect(selectPyramidFactor(128, 128)).toBe(2);
+        });
+
+        it('should skip the coarse pass for small canvases', () => {
+            expect(selectPyramidFactor(100, 100)).toBe(1);
+            expect(selectPyramidFactor(64, 64)).toBe(1);
+        });
+    });
+
+    describe('downsampleRawImage', () => {
+        it('should keep exact palette colors', () => {
+            const image = createRawImage(64);
+            const coarse = downsampleRawImage(image, 4);
+
+            expect(coarse.width).toBe(16);
+            expect(coarse.height).toBe(16);
+            const center = (8 * 16 + 8) * 4;
+            expect(Array.from(coarse.data.slice(center, center + 4))).toEqual([128, 64, 192, 255]);
+        });
+    });
+
+    it('should accept a clearly good candidate at the coarse level', async () => {
+        const result = await auditCoarseToFine({
+            candidate: createRawImage(512),
+            anchor: createRawImage(512),
+            palette: ['#8040C0'],
+        });
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.resolution).toBe('coarse');
+            expect(result.value.pyramid_factor).toBe(8);
+            expect(result.value.composite.passed).toBe(true);
+        }
+    });
+
+    it('should reject a clearly broken candidate at the coarse level', async () => {
+        const result = await auditCoarseToFine({
+            candidate: createRawImage(512, { r: 0, g: 255, b: 0 }),
+            anchor: createRawImage(512),
+            palette: ['#8040C0'],
+        });
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.resolution).toBe('coarse');
+            expect(result.value.composite.passed).toBe(false);
+        }
+    });
+
+    it('should fall through to full resolution for borderline candidates', async () => {
+        const result = await auditCoarseToFine({
+            candidate: createRawImage(512),
+            anchor: createRawImage(512),
+            palette: ['#8040C0'],
+        }, { margin: 1.0 });
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.resolution).toBe('full');
+            expect(result.value.pyramid_factor).toBe(1);
+            expect(result.value.coarse_composite_score).toBeDefined();
+            expect(result.value.ssim?.comparison_area.total_pixels).toBe(512 * 512);
+        }
+    });
+
+    it('should run full resolution directly on small canvases', async () => {
+        const result = await auditCoarseToFine({
+            candidate: createRawImage(64),
+            anchor: createRawImage(64),
+        });
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.resolution).toBe('full');
+            expect(result.value.coarse_composite_score).toBeUndefined();
+        }
+    });
+
+    it('should surface metric errors', async () => {
+        const result = await auditCoarseToFine({
+            candidate: createRawImage(512),
+            anchor: createRawImage(256),
+        });
+
+        expect(result.ok).toBe(false);
+        if (!result.ok) {
+            expect(result.error.code).toBe('SSIM_DIMENSION_MISMATCH');
+        }
+    });
+
+    it('should map MAPD to stability and skip bypassed moves', () => {
+        const base = {
+            mapd_percentage: 0,
+            move_type: 'idle',
+            threshold: 0.02,
+            passed: true,
+            computation_time_ms: 0,
+        };
+
+        expect(toMetricInputs({ mapd: { ...base, mapd_score: 0.1, bypassed: false } }).stability).toBeCloseTo(0.9);
+        expect(toMetricInputs({ mapd: { ...base, mapd_score: 0, bypassed: true } }).stability).toBeUndefined();
+    });
+
+    it('should score identity from a precomputed ONNX embedding similarity', async () => {
+        const identity = {
+            dino_similarity: 0.95,
+            anchor_similarity: 0.95,
+            backend: 'onnx:/models/dinov2-small.onnx',
+            passed: true,
+            threshold: 0.8,
+            computation_time_ms: 0,
+        };
+
+        const result = await auditCoarseToFine({ candidate: createRawImage(256), identity });
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.identity).toBe(identity);
+            expect(result.value.composite.identity_source).toBe('onnx:/models/dinov2-small.onnx');
+            expect(result.value.composite.composite_score).toBeCloseTo(0.95);
+        }
+    });
+});
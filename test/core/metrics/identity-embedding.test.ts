@@ -0,0 +1,263 @@
+/**
+ * Tests for the identity embedding engine
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+    DEFAULT_DINO_SIMILARITY_THRESHOLD,
+    IdentityEmbeddingEngine,
+    computeDescriptor,
+    cosineSimilarity,
+    createDescriptorEmbeddingBackend,
+    createIdentityEmbeddingEngine,
+    isCalibratedEmbeddingBackend,
+    loadOnnxEmbeddingBackend,
+    measureEmbeddingThroughput,
+    toNchwBatch,
+    type EmbeddingBackend,
+} from '../../../src/core/metrics/identity-embedding.js';
+import { scoreSSIM } from '../../../src/core/metrics/ssim-calculator.js';
+import type { RawImage } from '../../../src/core/metrics/raw-image.js';
+
+// Real model, when the optional runtime and weights are available
+const onnxModelPath = process.env.BANANA_IDENTITY_MODEL;
+const onnxBackend = onnxModelPath ? await loadOnnxEmbeddingBackend({ modelPath: onnxModelPath }) : null;
+
+/**
+ * Simple "character": body block, head block, and a colored belt,
+ * drawn at an offset on a transparent canvas
+ */
+function createSprite(
+    size: number,
+    offsetX: number,
+    offsetY: number,
+    colors: { body: number[]; head: number[]; belt: number[] } = {
+        body: [40, 80, 200],
+        head: [240, 200, 160],
+        belt: [200, 40, 40],
+    }
+): RawImage {
+    const data = new Uint8Array(size * size * 4);
+    const paint = (x0: number, y0: number, w: number, h: number, rgb: number[]) => {
+        for (let y = y0; y < y0 + h; y++) {
+            for (let x = x0; x < x0 + w; x++) {
+                const px = x + offsetX;
+                const py = y + offsetY;
+                if (px < 0 || py < 0 || px >= size || py >= size) continue;
+                const idx = (py * size + px) * 4;
+                data[idx] = rgb[0];
+                data[idx + 1] = rgb[1];
+                data[idx + 2] = rgb[2];
+                data[idx + 3] = 255;
+            }
+        }
+    };
+    paint(12, 4, 8, 8, colors.head);
+    paint(8, 12, 16, 20, colors.body);
+    paint(8, 22, 16, 3, colors.belt);
+    return { data, width: size, height: size };
+}
+
+/**
+ * Backend that records batch sizes
+ */
+function createRecordingBackend(): EmbeddingBackend & { batches: number[] } {
+    const descriptor = createDescriptorEmbeddingBackend();
+    const batches: number[] = [];
+    return {
+        id: 'recording',
+        batches,
+        embedBatch: async images => {
+            batches.push(images.length);
+            return descriptor.embedBatch(images);
+        },
+    };
+}
+
+describe('Identity Embedding', () => {
+    describe('computeDescriptor', () => {
+        it('should be L2-normalized', () => {
+            const embedding = computeDescriptor(createSprite(64, 10, 10));
+            expect(cosineSimilarity(embedding, embedding)).toBeCloseTo(1, 5);
+        });
+
+        it('should return a zero vector for a transparent frame', () => {
+            const empty = { data: new Uint8Array(32 * 32 * 4), width: 32, height: 32 };
+            expect(computeDescriptor(empty).every(v => v === 0)).toBe(true);
+        });
+
+        it('should ignore placement where SSIM does not', () => {
+            const anchor = createSprite(64, 4, 4);
+            const shifted = createSprite(64, 24, 20);
+            const recolored = createSprite(64, 4, 4, {
+                body: [40, 160, 40],
+                head: [120, 80, 40],
+                belt: [250, 250, 0],
+            });
+
+            const anchorEmbedding = computeDescriptor(anchor);
+            const shiftedSimilarity = cosineSimilarity(anchorEmbedding, computeDescriptor(shifted));
+            const recoloredSimilarity = cosineSimilarity(anchorEmbedding, computeDescriptor(recolored));
+
+            // Same character moved on the canvas stays on-model...
+            expect(shiftedSimilarity).toBeGreaterThan(0.99);
+            // ...while a different character in the same place does not
+            expect(recoloredSimilarity).toBeLessThan(shiftedSimilarity - 0.2);
+
+            // Block SSIM reads the same shift as drift
+            const ssim = scoreSSIM(shifted, anchor, 0.85);
+            expect(ssim.ok).toBe(true);
+            if (ssim.ok) {
+                expect(ssim.value.score).toBeLessThan(0.95);
+            }
+        });
+    });
+
+    describe('toNchwBatch', () => {
+        it('should produce normalized planar channels', () => {
+            const image = { data: new Uint8Array([255, 255, 255, 255]), width: 1, height: 1 };
+            const batch = toNchwBatch([image], 2);
+
+            expect(batch.length).toBe(3 * 4);
+            expect(batch[0]).toBeCloseTo((1 - 0.485) / 0.229, 4);
+            expect(batch[4]).toBeCloseTo((1 - 0.456) / 0.224, 4);
+        });
+    });
+
+    describe('IdentityEmbeddingEngine', () => {
+        it('should batch concurrent candidate requests', async () => {
+            const backend = createRecordingBackend();
+            const engine = new IdentityEmbeddingEngine(backend, { maxBatchSize: 4 });
+
+            await Promise.all(Array.from({ length: 10 }, (_, i) => engine.embed(createSprite(48, i, 0))));
+
+            expect(backend.batches).toEqual([4, 4, 2]);
+        });
+
+        it('should cache anchor embeddings per character', async () => {
+            const backend = createRecordingBackend();
+            const engine = new IdentityEmbeddingEngine(backend);
+            const anchor = createSprite(64, 4, 4);
+
+            await engine.scoreCandidates('hero', anchor, [createSprite(64, 8, 8)]);
+            await engine.scoreCandidates('hero', anchor, [createSprite(64, 12, 8)]);
+
+            const stats = engine.getStats();
+            expect(stats.cacheMisses).toBe(1);
+            expect(stats.cacheHits).toBe(1);
+            expect(stats.cachedCharacters).toBe(1);
+        });
+
+        it('should score candidates against anchor and approved frames', async () => {
+            const engine = new IdentityEmbeddingEngine(createDescriptorEmbeddingBackend());
+            const anchor = createSprite(64, 4, 4);
+            await engine.cacheReference('hero', createSprite(64, 20, 4), 'approved');
+
+            const result = await engine.scoreCandidates('hero', anchor, [
+                createSprite(64, 16, 16),
+                createSprite(64, 4, 4, { body: [10, 10, 10], head: [10, 10, 10], belt: [10, 10, 10] }),
+            ]);
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                const [onModel, offModel] = result.value;
+                expect(onModel.approved_similarity).toBeDefined();
+                expect(offModel.dino_similarity).toBeLessThan(onModel.dino_similarity);
+                expect(onModel.backend).toBe('descriptor');
+            }
+        });
+
+        it('should only judge uncalibrated scores against an explicit threshold', async () => {
+            const engine = new IdentityEmbeddingEngine(createDescriptorEmbeddingBackend());
+            const anchor = createSprite(64, 4, 4);
+            const candidate = createSprite(64, 4, 4);
+
+            const unjudged = await engine.scoreCandidates('hero', anchor, [candidate]);
+            const judged = await engine.scoreCandidates('hero', anchor, [candidate], 0.5);
+
+            expect(unjudged.ok && judged.ok).toBe(true);
+            if (unjudged.ok && judged.ok) {
+                expect(unjudged.value[0].passed).toBeUndefined();
+                expect(unjudged.value[0].threshold).toBeUndefined();
+                expect(judged.value[0].passed).toBe(true);
+                expect(judged.value[0].threshold).toBe(0.5);
+            }
+        });
+
+        it('should judge calibrated backends against the DINOv2 threshold', async () => {
+            const descriptor = createDescriptorEmbeddingBackend();
+            const engine = new IdentityEmbeddingEngine({ id: 'onnx:/models/test.onnx', embedBatch: descriptor.embedBatch });
+            const anchor = createSprite(64, 4, 4);
+
+            const result = await engine.scoreCandidates('hero', anchor, [createSprite(64, 4, 4)]);
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value[0].threshold).toBe(DEFAULT_DINO_SIMILARITY_THRESHOLD);
+                expect(result.value[0].passed).toBe(true);
+            }
+        });
+
+        it('should report backend failures as errors', async () => {
+            const engine = new IdentityEmbeddingEngine({
+                id: 'broken',
+                embedBatch: async () => {
+                    throw new Error('inference failed');
+                },
+            });
+
+            const result = await engine.scoreCandidates('hero', createSprite(32, 0, 0), [createSprite(32, 0, 0)]);
+
+            expect(result.ok).toBe(false);
+            if (!result.ok) {
+                expect(result.error.code).toBe('EMBEDDING_FAILED');
+            }
+        });
+    });
+
+    describe('backend selection', () => {
+        it('should fall back to descriptors without a loadable model', async () => {
+            const onnx = await loadOnnxEmbeddingBackend({ modelPath: '/nonexistent/model.onnx' });
+            expect(onnx.ok).toBe(false);
+
+            const engine = await createIdentityEmbeddingEngine({ modelPath: '/nonexistent/model.onnx' });
+            expect(engine.backendId).toBe('descriptor');
+        });
+
+        it('should treat only ONNX backends as calibrated', () => {
+            expect(isCalibratedEmbeddingBackend('onnx:/models/dinov2-small.onnx')).toBe(true);
+            expect(isCalibratedEmbeddingBackend('descriptor')).toBe(false);
+        });
+    });
+
+    describe('throughput', () => {
+        const frames = Array.from({ length: 128 }, (_, i) => createSprite(128, i % 64, (i * 7) % 64));
+
+        // Sanity check of the descriptor fallback only; it says nothing about model inference speed
+        it('should run the descriptor fallback well above frame rate (descriptor only)', async () => {
+            const engine = new IdentityEmbeddingEngine(createDescriptorEmbeddingBackend(), { maxBatchSize: 16 });
+
+            // Warm up JIT before measuring
+            await measureEmbeddingThroughput(engine, frames.slice(0, 16));
+            const throughput = await measureEmbeddingThroughput(engine, frames);
+
+            expect(throughput.backend).toBe('descriptor');
+            expect(throughput.frames).toBe(128);
+            expect(throughput.frames_per_second).toBeGreaterThan(50);
+        }, 30000);
+
+        // Model benchmark: needs onnxruntime-node and BANANA_IDENTITY_MODEL pointing at the .onnx weights
+        it.skipIf(!onnxBackend?.ok)('should embed 128px frames with the ONNX model on CPU', async () => {
+            if (!onnxBackend?.ok) return;
+            const engine = new IdentityEmbeddingEngine(onnxBackend.value, { maxBatchSize: 16 });
+
+            await measureEmbeddingThroughput(engine, frames.slice(0, 16));
+            const throughput = await measureEmbeddingThroughput(engine, frames);
+            await engine.dispose();
+
+            expect(throughput.backend.startsWith('onnx:')).toBe(true);
+            expect(throughput.frames).toBe(128);
+            expect(throughput.frames_per_second).toBeGreaterThan(10);
+        }, 120000);
+    });
+});
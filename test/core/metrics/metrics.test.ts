@@ -339,5 +339,29 @@ describe('Metrics Modules (Stories 3.4-3.10)', () => {
             expect(result.metrics_provided).toContain('identity');
             expect(result.metrics_provided.length).toBe(1);
         });
+
+        it('should prefer ONNX embedding similarity over SSIM for identity', () => {
+            const result = calculateCompositeScore({
+                identity: 0.4,
+                dino_similarity: 0.9,
+                identity_backend: 'onnx:/models/dinov2-small.onnx',
+            });
+
+            expect(result.composite_score).toBeCloseTo(0.9);
+            expect(result.identity_source).toBe('onnx:/models/dinov2-small.onnx');
+            expect(result.metrics_provided).toEqual(['dino_similarity']);
+        });
+
+        it('should keep SSIM when the embedding comes from the descriptor backend', () => {
+            const result = calculateCompositeScore({
+                identity: 0.4,
+                dino_similarity: 0.9,
+                identity_backend: 'descriptor',
+            });
+
+            expect(result.composite_score).toBeCloseTo(0.4);
+            expect(result.identity_source).toBe('ssim');
+            expect(result.metrics_provided).toEqual(['identity']);
+        });
     });
 });
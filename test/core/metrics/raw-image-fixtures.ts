@@ -0,0 +1,31 @@
+/**
+ * Shared RawImage fixtures for metric tests
+ */
+
+import type { RawImage } from '../../../src/core/metrics/raw-image.js';
+
+/**
+ * Build a decoded RGBA frame with an opaque square in the middle,
+ * optionally shifted by offset.x / offset.y (clipped at the canvas edge)
+ */
+export function createRawImage(
+    size: number,
+    fillColor: { r: number; g: number; b: number } = { r: 128, g: 64, b: 192 },
+    offset: { x?: number; y?: number } = {}
+): RawImage {
+    const data = new Uint8Array(size * size * 4);
+    const start = Math.floor(size / 4);
+    const end = size - start;
+    const offsetX = offset.x ?? 0;
+    const offsetY = offset.y ?? 0;
+    for (let y = start + offsetY; y < Math.min(size, end + offsetY); y++) {
+        for (let x = start + offsetX; x < Math.min(size, end + offsetX); x++) {
+            const idx = (y * size + x) * 4;
+            data[idx] = fillColor.r;
+            data[idx + 1] = fillColor.g;
+            data[idx + 2] = fillColor.b;
+            data[idx + 3] = 255;
+        }
+    }
+    return { data, width: size, height: size };
+}
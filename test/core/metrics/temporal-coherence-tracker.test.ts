@@ -0,0 +1,137 @@
+/**
+ * Tests for the temporal coherence tracker (SF-04)
+ */
+
+import { describe, it, expect } from 'vitest';
+
+import { TemporalCoherenceTracker } from '../../../src/core/metrics/temporal-coherence-tracker.js';
+import { scoreMAPD } from '../../../src/core/metrics/mapd-calculator.js';
+import { createRawImage } from './raw-image-fixtures.js';
+
+describe('TemporalCoherenceTracker', () => {
+    it('should pass the first frame with no reference', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+
+        const result = tracker.scoreCandidate(createRawImage(64));
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.has_reference).toBe(false);
+            expect(result.value.passed).toBe(true);
+        }
+    });
+
+    it('should score identical consecutive frames as coherent', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+        tracker.commitFrame(createRawImage(64));
+
+        const result = tracker.scoreCandidate(createRawImage(64));
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.frame_ssim).toBeGreaterThanOrEqual(0.99);
+            expect(result.value.mapd_score).toBe(0);
+            expect(result.value.flicker_detected).toBe(false);
+        }
+    });
+
+    it('should flag flicker with SF04_TEMPORAL_FLICKER', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+        tracker.commitFrame(createRawImage(64));
+
+        const result = tracker.scoreCandidate(createRawImage(64, { r: 0, g: 255, b: 0 }));
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.flicker_detected).toBe(true);
+            expect(result.value.reason_codes).toContain('SF04_TEMPORAL_FLICKER');
+            expect(result.value.passed).toBe(false);
+        }
+    });
+
+    it('should match the standalone MAPD calculation', () => {
+        const previous = createRawImage(64);
+        const candidate = createRawImage(64, { r: 120, g: 70, b: 180 }, { x: 2 });
+        const tracker = new TemporalCoherenceTracker('walk');
+        tracker.commitFrame(previous);
+
+        const tracked = tracker.scoreCandidate(candidate);
+        const standalone = scoreMAPD(previous, candidate, 'walk');
+
+        expect(tracked.ok && standalone.ok).toBe(true);
+        if (tracked.ok && standalone.ok) {
+            expect(tracked.value.mapd_score).toBeCloseTo(standalone.value.mapd_score, 10);
+        }
+    });
+
+    it('should bypass flicker checks for high-motion moves', () => {
+        const tracker = new TemporalCoherenceTracker('attack');
+        tracker.commitFrame(createRawImage(64));
+
+        const result = tracker.scoreCandidate(createRawImage(64, { r: 0, g: 255, b: 0 }));
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.bypassed).toBe(true);
+            expect(result.value.passed).toBe(true);
+        }
+    });
+
+    it('should reject dimension mismatch', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+        tracker.commitFrame(createRawImage(64));
+
+        const result = tracker.scoreCandidate(createRawImage(32));
+
+        expect(result.ok).toBe(false);
+        if (!result.ok) {
+            expect(result.error.code).toBe('COHERENCE_DIMENSION_MISMATCH');
+        }
+    });
+
+    it('should maintain move statistics incrementally', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+        tracker.commitFrame(createRawImage(64));
+        tracker.commitFrame(createRawImage(64));
+        tracker.commitFrame(createRawImage(64, { r: 0, g: 255, b: 0 }));
+
+        const stats = tracker.getStatistics();
+
+        expect(stats.ok).toBe(true);
+        if (stats.ok) {
+            expect(stats.value.frames_tracked).toBe(3);
+            expect(stats.value.transitions).toBe(2);
+            expect(stats.value.flicker_transitions).toBe(1);
+            expect(stats.value.flicker_rate).toBeCloseTo(0.5);
+            expect(stats.value.mapd.max).toBeGreaterThan(stats.value.mapd.mean);
+            expect(stats.value.passed).toBe(false);
+        }
+    });
+
+    it('should check loop closure for looping moves', () => {
+        const tracker = new TemporalCoherenceTracker('idle', { isLoop: true });
+        tracker.commitFrame(createRawImage(64));
+        tracker.commitFrame(createRawImage(64, { r: 128, g: 64, b: 190 }));
+
+        const stats = tracker.getStatistics();
+
+        expect(stats.ok).toBe(true);
+        if (stats.ok) {
+            expect(stats.value.loop_closure?.has_reference).toBe(true);
+            expect(stats.value.loop_closure?.passed).toBe(true);
+        }
+    });
+
+    it('should clear state on reset', () => {
+        const tracker = new TemporalCoherenceTracker('idle');
+        tracker.commitFrame(createRawImage(64));
+        tracker.reset();
+
+        const result = tracker.scoreCandidate(createRawImage(32));
+
+        expect(result.ok).toBe(true);
+        if (result.ok) {
+            expect(result.value.has_reference).toBe(false);
+        }
+    });
+});
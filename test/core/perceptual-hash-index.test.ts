@@ -0,0 +1,263 @@
+/**
+ * Tests for the perceptual hash dedupe index
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { promises as fs } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import sharp from 'sharp';
+import {
+    computeDHash,
+    hammingDistance,
+    PerceptualHashIndex,
+    loadPerceptualHashIndex,
+    type HashCandidateContext,
+} from '../../src/core/perceptual-hash-index.js';
+
+describe('Perceptual Hash Index', () => {
+    let testDir: string;
+
+    beforeEach(async () => {
+        testDir = join(tmpdir(), `banana-phash-test-${Date.now()}`);
+        await fs.mkdir(testDir, { recursive: true });
+    });
+
+    afterEach(async () => {
+        try {
+            await fs.rm(testDir, { recursive: true, force: true });
+        } catch {
+            // Ignore
+        }
+    });
+
+    /**
+     * Write a 64x64 sprite: an opaque rectangle on a transparent canvas
+     */
+    async function createSprite(
+        name: string,
+        rect: { x: number; y: number; w: number; h: number },
+        color: { r: number; g: number; b: number } = { r: 255, g: 128, b: 64 }
+    ): Promise<string> {
+        const size = 64;
+        const data = Buffer.alloc(size * size * 4, 0);
+        for (let y = rect.y; y < rect.y + rect.h; y++) {
+            for (let x = rect.x; x < rect.x + rect.w; x++) {
+                const idx = (y * size + x) * 4;
+                data[idx] = color.r;
+                data[idx + 1] = color.g;
+                data[idx + 2] = color.b;
+                data[idx + 3] = 255;
+            }
+        }
+        const path = join(testDir, `${name}.png`);
+        await sharp(data, { raw: { width: size, height: size, channels: 4 } })
+            .png()
+            .toFile(path);
+        return path;
+    }
+
+    function context(overrides: Partial<HashCandidateContext> = {}): HashCandidateContext {
+        return {
+            runId: 'run-1',
+            characterId: 'BLAZE',
+            moveId: 'idle',
+            frameIndex: 0,
+            attemptIndex: 1,
+            ...overrides,
+        };
+    }
+
+    describe('computeDHash', () => {
+        it('should produce a 16-hex-char hash', async () => {
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            const result = await computeDHash(path);
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value).toMatch(/^[0-9a-f]{16}$/);
+            }
+        });
+
+        it('should return error for missing file', async () => {
+            const result = await computeDHash(join(testDir, 'missing.png'));
+
+            expect(result.ok).toBe(false);
+            if (!result.ok) {
+                expect(result.error.code).toBe('PHASH_FAILED');
+            }
+        });
+    });
+
+    describe('hammingDistance', () => {
+        it('should count differing bits', () => {
+            expect(hammingDistance('0000000000000000', '0000000000000000')).toBe(0);
+            expect(hammingDistance('0000000000000000', 'ffffffffffffffff')).toBe(64);
+            expect(hammingDistance('8000000000000001', '0000000000000000')).toBe(2);
+        });
+    });
+
+    describe('check', () => {
+        it('should not flag the first candidate of a frame', async () => {
+            const index = new PerceptualHashIndex();
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+
+            const result = await index.check(path, context());
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(false);
+                expect(result.value.action).toBe('none');
+            }
+            expect(index.size).toBe(1);
+        });
+
+        it('should flag a near-identical reroll and suggest a seed salt', async () => {
+            const index = new PerceptualHashIndex();
+            const first = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            const second = await createSprite('b', { x: 16, y: 8, w: 24, h: 48 }, { r: 250, g: 130, b: 60 });
+
+            await index.check(first, context());
+            const result = await index.check(second, context({ attemptIndex: 2 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(true);
+                expect(result.value.match?.attemptIndex).toBe(1);
+                expect(result.value.action).toBe('reroll_seed');
+                expect(result.value.suggestedSeedSalt).toBe(2);
+            }
+        });
+
+        it('should count the seed salt per move', async () => {
+            const index = new PerceptualHashIndex();
+            const first = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            const other = await createSprite('b', { x: 4, y: 40, w: 56, h: 12 }, { r: 20, g: 200, b: 90 });
+
+            await index.check(other, context({ moveId: 'walk' }));
+            await index.check(other, context({ moveId: 'walk', attemptIndex: 2 }));
+            await index.check(first, context());
+            const result = await index.check(first, context({ attemptIndex: 2 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(true);
+                expect(result.value.suggestedSeedSalt).toBe(2);
+            }
+        });
+
+        it('should reuse the verdict of an audited duplicate', async () => {
+            const index = new PerceptualHashIndex();
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+
+            await index.check(path, context());
+            index.recordVerdict(context(), { passed: false, reasonCodes: ['SF01_IDENTITY_DRIFT'] });
+            const result = await index.check(path, context({ attemptIndex: 2 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.action).toBe('reuse_verdict');
+                expect(result.value.match?.verdict?.reasonCodes).toEqual(['SF01_IDENTITY_DRIFT']);
+            }
+        });
+
+        it('should reroll rather than reuse a verdict for a near-duplicate', async () => {
+            const index = new PerceptualHashIndex();
+            const failed = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            // Same pose with a small color fix: hashes within the threshold
+            const fixed = await createSprite('b', { x: 16, y: 8, w: 24, h: 48 }, { r: 250, g: 130, b: 60 });
+
+            await index.check(failed, context());
+            index.recordVerdict(context(), { passed: false, reasonCodes: ['SF03_PALETTE_DRIFT'] });
+            const result = await index.check(fixed, context({ attemptIndex: 2 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(true);
+                expect(result.value.action).toBe('reroll_seed');
+            }
+        });
+
+        it('should attach verdicts to the candidate of the matching move', async () => {
+            const index = new PerceptualHashIndex();
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+
+            await index.check(path, context({ moveId: 'walk' }));
+            expect(index.recordVerdict(context(), { passed: true, reasonCodes: [] })).toBe(false);
+            expect(index.recordVerdict(context({ moveId: 'walk' }), { passed: true, reasonCodes: [] })).toBe(true);
+        });
+
+        it('should not match a different pose', async () => {
+            const index = new PerceptualHashIndex();
+            const standing = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            const crouching = await createSprite('b', { x: 4, y: 36, w: 56, h: 24 });
+
+            await index.check(standing, context());
+            const result = await index.check(crouching, context({ attemptIndex: 2 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(false);
+            }
+        });
+
+        it('should only compare candidates of the same frame', async () => {
+            const index = new PerceptualHashIndex();
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+
+            await index.check(path, context());
+            const result = await index.check(path, context({ frameIndex: 1 }));
+
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.duplicate).toBe(false);
+            }
+        });
+
+        it('should match across runs in character scope', async () => {
+            const runScoped = new PerceptualHashIndex();
+            const characterScoped = new PerceptualHashIndex({ scope: 'character' });
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+
+            await runScoped.check(path, context());
+            await characterScoped.check(path, context());
+            const runResult = await runScoped.check(path, context({ runId: 'run-2' }));
+            const characterResult = await characterScoped.check(path, context({ runId: 'run-2' }));
+
+            expect(runResult.ok && characterResult.ok).toBe(true);
+            if (runResult.ok && characterResult.ok) {
+                expect(runResult.value.duplicate).toBe(false);
+                expect(characterResult.value.duplicate).toBe(true);
+                expect(characterResult.value.match?.runId).toBe('run-1');
+            }
+        });
+    });
+
+    describe('persistence', () => {
+        it('should round-trip entries through save and load', async () => {
+            const index = new PerceptualHashIndex({ scope: 'character' });
+            const path = await createSprite('a', { x: 16, y: 8, w: 24, h: 48 });
+            const indexPath = join(testDir, 'phash-index.json');
+
+            await index.check(path, context());
+            index.recordVerdict(context(), { passed: true, reasonCodes: [], compositeScore: 0.9 });
+            await index.save(indexPath);
+
+            const loaded = await loadPerceptualHashIndex(indexPath, { scope: 'character' });
+            const result = await loaded.check(path, context({ runId: 'run-2' }));
+
+            expect(loaded.size).toBe(2);
+            expect(result.ok).toBe(true);
+            if (result.ok) {
+                expect(result.value.action).toBe('reuse_verdict');
+                expect(result.value.match?.verdict?.compositeScore).toBe(0.9);
+            }
+        });
+
+        it('should start empty when no index file exists', async () => {
+            const loaded = await loadPerceptualHashIndex(join(testDir, 'missing.json'));
+
+            expect(loaded.size).toBe(0);
+        });
+    });
+});
@@ -0,0 +1,48 @@
+/**
+ * Tests for bounded concurrency helpers
+ */
+
+import { describe, it, expect } from 'vitest';
+import { mapWithConcurrency } from '../../src/utils/concurrency.js';
+
+describe('mapWithConcurrency', () => {
+    const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+    it('should keep input order', async () => {
+        const results = await mapWithConcurrency([30, 10, 20], 3, async (ms, i) => {
+            await sleep(ms);
+            return i;
+        });
+
+        expect(results).toEqual([0, 1, 2]);
+    });
+
+    it('should never exceed the limit', async () => {
+        let active = 0;
+        let peak = 0;
+
+        await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+            active++;
+            peak = Math.max(peak, active);
+            await sleep(5);
+            active--;
+        });
+
+        expect(peak).toBe(3);
+    });
+
+    it('should stop starting work after a failure', async () => {
+        const started: number[] = [];
+
+        await expect(mapWithConcurrency([0, 1, 2, 3, 4], 1, async item => {
+            started.push(item);
+            if (item === 1) throw new Error('boom');
+        })).rejects.toThrow('boom');
+
+        expect(started).toEqual([0, 1]);
+    });
+
+    it('should handle empty input', async () => {
+        expect(await mapWithConcurrency([], 4, async () => 1)).toEqual([]);
+    });
+});
@@ -68,6 +68,15 @@ describe('CRC32 Utility', () => {
             const seed2 = calculateSeed('run_002', 0, 1);
             expect(seed1).not.toBe(seed2);
         });
+
+        it('should return deterministic salted seeds for any attempt', () => {
+            const seed1 = calculateSeed('run_abc', 0, 3, 1);
+            const seed2 = calculateSeed('run_abc', 0, 3, 1);
+            const seed3 = calculateSeed('run_abc', 0, 3, 2);
+            expect(seed1).toBeDefined();
+            expect(seed1).toBe(seed2);
+            expect(seed1).not.toBe(seed3);
+        });
     });
 
     describe('describeSeedPolicy function', () => {
@@ -80,5 +89,9 @@ describe('CRC32 Utility', () => {
             expect(describeSeedPolicy(3)).toBe('random');
             expect(describeSeedPolicy(10)).toBe('random');
         });
+
+        it('should return "salted_crc32" when a salt is given', () => {
+            expect(describeSeedPolicy(2, 1)).toBe('salted_crc32');
+        });
     });
 });